@@ -6,24 +6,62 @@ Clean chat context focused on conversation state and tool coordination.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, AsyncIterator
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, AsyncIterator, Optional
 
 from rich import print
 from rich.console import Console
 
+from mcp_cli.chat.context_window import ContextWindow
+from mcp_cli.chat.session_store import SessionStore
 from mcp_cli.chat.system_prompt import generate_system_prompt
 from mcp_cli.tools.manager import ToolManager
 from mcp_cli.model_manager import ModelManager
 
 logger = logging.getLogger(__name__)
 
+# Tool names accepted by OpenAI-style function calling
+_VALID_TOOL_NAME = re.compile(r'^[a-zA-Z0-9_-]+$')
+_INVALID_TOOL_NAME_CHARS = re.compile(r'[^a-zA-Z0-9_-]')
+
+
+@lru_cache(maxsize=1024)
+def sanitize_tool_name(name: str) -> str:
+    """Return *name* with every character the providers reject replaced by ``_``."""
+    if _VALID_TOOL_NAME.match(name):
+        return name
+    return _INVALID_TOOL_NAME_CHARS.sub('_', name)
+
+
+def sanitize_message(msg: Dict[str, Any]) -> int:
+    """Sanitize tool names in one history message in place; returns the number changed."""
+    changed = 0
+    if msg.get("role") == "assistant" and msg.get("tool_calls"):
+        for tc in msg["tool_calls"]:
+            fn = tc.get("function") if isinstance(tc, dict) else None
+            if fn and "name" in fn:
+                sanitized = sanitize_tool_name(fn["name"])
+                if sanitized != fn["name"]:
+                    logger.debug(f"Sanitizing tool name in history: {fn['name']} -> {sanitized}")
+                    fn["name"] = sanitized
+                    changed += 1
+    elif msg.get("role") == "tool" and "name" in msg:
+        sanitized = sanitize_tool_name(msg["name"])
+        if sanitized != msg["name"]:
+            logger.debug(f"Sanitizing tool message name in history: {msg['name']} -> {sanitized}")
+            msg["name"] = sanitized
+            changed += 1
+    return changed
+
 
 class ChatContext:
     """
     Chat context focused on conversation state and tool coordination.
     
     Responsibilities:
-    - Conversation history management
+    - Conversation history management (full history, plus the bounded
+      window that is sent to the model)
     - Tool discovery and adaptation coordination
     - Session state (exit requests, etc.)
     
@@ -44,6 +82,10 @@ class ChatContext:
         # Conversation state
         self.exit_requested = False
         self.conversation_history: List[Dict[str, Any]] = []
+        self.context_window = ContextWindow()
+        self._sanitized_history: Optional[List[Dict[str, Any]]] = None
+        self._sanitized_upto = 0  # messages before this index are already sanitized
+        self.session_store: Optional[SessionStore] = None
         
         # Tool state (filled during initialization)
         self.tools: List[Dict[str, Any]] = []
@@ -52,6 +94,8 @@ class ChatContext:
         self.tool_to_server_map: Dict[str, str] = {}
         self.openai_tools: List[Dict[str, Any]] = []
         self.tool_name_mapping: Dict[str, str] = {}
+        self._tools_version: Optional[int] = None  # catalogue version the tools came from
+        self._system_prompt: Optional[str] = None  # generated from the tool list
         
         logger.debug(f"ChatContext created with {self.provider}/{self.model}")
 
@@ -131,6 +175,8 @@ class ChatContext:
 
     async def _initialize_tools(self) -> None:
         """Initialize tool discovery and adaptation."""
+        self._tools_version = getattr(self.tool_manager, "catalogue_version", None)
+
         # Get tools from ToolManager
         tool_infos = await self.tool_manager.get_unique_tools()
         
@@ -182,8 +228,30 @@ class ChatContext:
 
     def _initialize_conversation(self) -> None:
         """Initialize conversation with system prompt."""
-        system_prompt = generate_system_prompt(self.internal_tools)
-        self.conversation_history = [{"role": "system", "content": system_prompt}]
+        self._system_prompt = generate_system_prompt(self.internal_tools)
+        self.conversation_history = [{"role": "system", "content": self._system_prompt}]
+
+    async def refresh_tools_if_changed(self) -> bool:
+        """
+        Reload the tool list if the ToolManager's catalogue changed since it
+        was loaded (e.g. a server finished starting after the chat opened).
+
+        Returns:
+            True if the tools were reloaded
+        """
+        version = getattr(self.tool_manager, "catalogue_version", None)
+        if version is None or version == self._tools_version:
+            return False
+        await self._initialize_tools()
+
+        # Keep the generated system prompt in step with the tool list
+        history = self.conversation_history
+        if history and history[0].get("role") == "system" and history[0].get("content") == self._system_prompt:
+            self._system_prompt = generate_system_prompt(self.internal_tools)
+            history[0] = {"role": "system", "content": self._system_prompt}
+
+        logger.info(f"Tool catalogue changed: {len(self.tools)} tools now available")
+        return True
 
     # ── Model change handling ─────────────────────────────────────────────
     async def refresh_after_model_change(self) -> None:
@@ -211,13 +279,122 @@ class ChatContext:
         return await self.tool_manager.get_server_for_tool(tool_name) or "Unknown"
 
     # ── Conversation management ───────────────────────────────────────────
+    def add_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Append *message* to the history, sanitizing its tool names once.
+
+        Messages added through this method never need to be rescanned by
+        :meth:`sanitize_history`.
+        """
+        history = self.conversation_history
+        in_sync = self._sanitized_history is history and self._sanitized_upto == len(history)
+        sanitize_message(message)
+        history.append(message)
+        if in_sync:
+            self._sanitized_upto = len(history)
+        self.persist()
+        return message
+
     def add_user_message(self, content: str) -> None:
         """Add user message to conversation."""
-        self.conversation_history.append({"role": "user", "content": content})
+        self.add_message({"role": "user", "content": content})
 
     def add_assistant_message(self, content: str) -> None:
         """Add assistant message to conversation."""
-        self.conversation_history.append({"role": "assistant", "content": content})
+        self.add_message({"role": "assistant", "content": content})
+
+    def add_tool_exchange(self, call_id: str, tool_name: str, arguments: str, content: str) -> None:
+        """Add an assistant tool call and the tool's response to conversation."""
+        self.add_message(
+            {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": call_id,
+                        "type": "function",
+                        "function": {"name": tool_name, "arguments": arguments},
+                    }
+                ],
+            }
+        )
+        self.add_message(
+            {
+                "role": "tool",
+                "name": tool_name,
+                "content": content,
+                "tool_call_id": call_id,
+            }
+        )
+
+    def sanitize_history(self) -> int:
+        """
+        Sanitize tool names in messages not yet seen.
+
+        Only messages appended directly to ``conversation_history`` since the
+        last call are scanned; a replaced or shortened history is rescanned.
+
+        Returns:
+            Number of tool names that had to be changed
+        """
+        history = self.conversation_history
+        if self._sanitized_history is not history or self._sanitized_upto > len(history):
+            self._sanitized_history = history
+            self._sanitized_upto = 0
+
+        changed = 0
+        for msg in history[self._sanitized_upto:]:
+            changed += sanitize_message(msg)
+        self._sanitized_upto = len(history)
+
+        if changed:
+            logger.debug(f"Sanitized {changed} tool name(s) in conversation history")
+        self.persist()
+        return changed
+
+    # ── Session persistence ───────────────────────────────────────────────
+    def attach_session(self, store: SessionStore, resume: bool = False) -> int:
+        """
+        Persist this conversation through *store*.
+
+        Args:
+            store: Session log to write to
+            resume: Restore the history from *store* first; the freshly
+                generated system prompt replaces the saved one
+
+        Returns:
+            Number of messages restored
+        """
+        self.session_store = store
+        if not resume:
+            self.persist()
+            return 0
+
+        restored = store.load()
+        system = self.conversation_history[:1]
+        if system and system[0].get("role") == "system":
+            if restored and restored[0].get("role") == "system":
+                restored[0] = system[0]
+            else:
+                restored.insert(0, system[0])
+        self.conversation_history = restored
+        store.mark_synced(restored)
+        return len(restored)
+
+    def persist(self) -> None:
+        """Write messages added since the last call to the session log, if any."""
+        if self.session_store is not None:
+            self.session_store.sync(self.conversation_history)
+
+    def get_request_messages(self) -> List[Dict[str, Any]]:
+        """
+        Messages to send with the next completion request.
+
+        A token-budgeted view of ``conversation_history``: the system prompt
+        and recent turns are kept, older tool output is compacted.  The full
+        history itself is left untouched.
+        """
+        return self.context_window.build(self.conversation_history)
 
     def get_conversation_length(self) -> int:
         """Get conversation length (excluding system prompt)."""
@@ -270,6 +447,7 @@ class ChatContext:
             "exit_requested": self.exit_requested,
             "tool_to_server_map": self.tool_to_server_map,
             "tool_manager": self.tool_manager,
+            "context_window": self.context_window,
         }
 
     def update_from_dict(self, context_dict: Dict[str, Any]) -> None:
@@ -343,6 +521,10 @@ class TestChatContext(ChatContext):
         # Conversation state
         self.exit_requested = False
         self.conversation_history = []
+        self.context_window = ContextWindow()
+        self._sanitized_history = None
+        self._sanitized_upto = 0
+        self.session_store = None
         
         # Tool state
         self.tools = []
@@ -8,6 +8,7 @@ from __future__ import annotations
 import asyncio
 import gc
 import logging
+import os
 from typing import Optional
 
 from rich import print
@@ -18,6 +19,7 @@ from rich.console import Console
 from mcp_cli.chat.chat_context import ChatContext, TestChatContext
 from mcp_cli.chat.ui_manager import ChatUIManager
 from mcp_cli.chat.conversation import ConversationProcessor
+from mcp_cli.chat.session_store import SessionStore
 from mcp_cli.ui.ui_helpers import clear_screen, display_welcome_banner
 from mcp_cli.model_manager import ModelManager
 from mcp_cli.tools.manager import ToolManager
@@ -32,6 +34,7 @@ async def handle_chat_mode(
     model: str = None,
     api_base: str = None,
     api_key: str = None,
+    resume: Optional[str] = None,
 ) -> bool:
     """
     Launch the interactive chat loop with streaming support.
@@ -42,11 +45,13 @@ async def handle_chat_mode(
         model: Model to use (optional, uses ModelManager active if None)
         api_base: API base URL override (optional)
         api_key: API key override (optional)
+        resume: Saved session to continue (id or "latest", optional)
 
     Returns:
         True if session ended normally, False on failure
     """
     ui: Optional[ChatUIManager] = None
+    ctx: Optional[ChatContext] = None
     console = Console()
 
     try:
@@ -64,12 +69,25 @@ async def handle_chat_mode(
                 print("[red]Failed to initialize chat context.[/red]")
                 return False
 
+            restored = _attach_session(ctx, resume)
+            if restored is None:
+                return False
+
         # Welcome banner
         clear_screen()
         display_welcome_banner({
             "provider": ctx.provider,
             "model": ctx.model,
         })
+        if ctx.session_store is not None:
+            session_id = ctx.session_store.session_id
+            if resume:
+                print(f"[green]Resumed session {session_id}[/green] ({restored} messages)")
+            else:
+                print(
+                    f"[dim]Session {session_id} saved to {ctx.session_store.log_path} "
+                    f"(MCP_CLI_SESSIONS=0 to disable) - resume with: mcp-cli chat --resume {session_id}[/dim]"
+                )
 
         # UI and conversation processor
         ui = ChatUIManager(ctx)
@@ -89,6 +107,11 @@ async def handle_chat_mode(
         # Cleanup
         if ui:
             await _safe_cleanup(ui)
+
+        # Flush and close the session log
+        if ctx is not None and ctx.session_store is not None:
+            ctx.persist()
+            ctx.session_store.close()
             
         # Close tool manager
         try:
@@ -99,6 +122,33 @@ async def handle_chat_mode(
         gc.collect()
 
 
+def _attach_session(ctx: ChatContext, resume: Optional[str]) -> Optional[int]:
+    """
+    Persist the session to disk, restoring it first when *resume* is given.
+
+    Returns:
+        Number of restored messages, or None if the requested session
+        could not be resumed
+    """
+    try:
+        if resume:
+            store = SessionStore.open(resume)
+        elif os.getenv("MCP_CLI_SESSIONS", "1") == "0":
+            return 0
+        else:
+            store = SessionStore.create(provider=ctx.provider, model=ctx.model)
+        return ctx.attach_session(store, resume=bool(resume))
+    except FileNotFoundError as exc:
+        print(f"[red]Cannot resume session:[/red] {exc}")
+        return None
+    except (OSError, ValueError) as exc:
+        if resume:
+            print(f"[red]Cannot resume session {resume}:[/red] {exc}")
+            return None
+        logger.warning(f"Chat session will not be saved: {exc}")
+        return 0
+
+
 async def handle_chat_mode_for_testing(
     stream_manager,
     provider: str = None,
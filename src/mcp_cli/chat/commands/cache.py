@@ -0,0 +1,128 @@
+# mcp_cli/chat/commands/cache.py
+"""
+Chat-mode "/cache" command for MCP-CLI
+=====================================
+
+This module implements the **/cache** slash-command that inspects and
+clears the tool result cache, and shows how tool calls were queued per
+server by the scheduler.
+
+Only tools opted in through the ``toolCache`` block of
+``server_config.json`` are ever cached; everything else always runs.
+
+Examples
+--------
+>>> /cache                # cache counters, cached tools, per-server queueing
+>>> /cache clear          # drop every cached result
+>>> /cache clear sqlite.list_tables
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from rich.table import Table
+
+# Cross-platform Rich console helper
+from mcp_cli.utils.rich_helpers import get_console
+
+# Chat-command registry
+from mcp_cli.chat.commands import register_command
+
+
+# ════════════════════════════════════════════════════════════════════════════
+# Command handler
+# ════════════════════════════════════════════════════════════════════════════
+async def cache_command(parts: List[str], ctx: Dict[str, Any]) -> bool:  # noqa: D401
+    """
+    Inspect or clear the tool result cache.
+
+    Usage
+    -----
+      /cache                 - show cache and scheduler statistics
+      /cache clear [tool]    - drop all cached results, or those of *tool*
+    """
+    console = get_console()
+
+    tm = ctx.get("tool_manager")
+    cache = getattr(tm, "result_cache", None)
+    if cache is None:
+        console.print("[red]Error:[/red] Tool result cache not available.")
+        return True
+
+    args = parts[1:]
+    if args and args[0].lower() == "clear":
+        removed = tm.clear_result_cache(args[1] if len(args) > 1 else None)
+        cache.reset_stats()
+        console.print(f"[green]Cleared {removed} cached result(s).[/green]")
+        return True
+    if args:
+        console.print(f"[red]Unknown option:[/red] {args[0]}  (use /cache or /cache clear [tool])")
+        return True
+
+    _print_scheduler_stats(console, tm)
+
+    stats = tm.get_cache_stats()
+    single_flight = getattr(tm, "single_flight", None)
+    if single_flight is not None and single_flight.coalesced:
+        console.print(f"[dim]{single_flight.coalesced} duplicate in-flight call(s) shared[/dim]")
+
+    if not cache.enabled or not cache.allow:
+        console.print("[yellow]Tool result caching is disabled[/yellow] "
+                      "(add a 'toolCache' block to the server config to enable it).")
+        return True
+
+    console.print(
+        f"[green]Hits:[/green] {stats.hits}  [green]Misses:[/green] {stats.misses}  "
+        f"[green]Hit rate:[/green] {stats.hit_rate:.0%}  "
+        f"[green]Evictions:[/green] {stats.evictions}"
+    )
+    console.print(
+        f"[dim]{stats.entries} entries, {stats.bytes:,} of {stats.max_bytes:,} bytes[/dim]"
+    )
+
+    by_tool = cache.entries_by_tool()
+    if by_tool:
+        table = Table(title="Cached Tools")
+        table.add_column("Tool", style="green")
+        table.add_column("Entries", justify="right")
+        table.add_column("Bytes", justify="right")
+        for name, (count, size) in sorted(by_tool.items()):
+            table.add_row(name, str(count), f"{size:,}")
+        console.print(table)
+
+    return True
+
+
+def _print_scheduler_stats(console, tm: Any) -> None:
+    """Per-server queueing statistics from the ToolManager's scheduler."""
+    get_stats = getattr(tm, "get_scheduler_stats", None)
+    lanes = get_stats() if callable(get_stats) else {}
+    if not lanes:
+        return
+
+    table = Table(title="Tool Scheduling")
+    table.add_column("Server", style="green")
+    table.add_column("Limit", justify="right")
+    table.add_column("Active", justify="right")
+    table.add_column("Queued", justify="right")
+    table.add_column("Completed", justify="right")
+    table.add_column("Avg wait", justify="right")
+    table.add_column("Max wait", justify="right")
+    for name, lane in sorted(lanes.items()):
+        table.add_row(
+            name,
+            str(lane.limit),
+            str(lane.active),
+            str(lane.queued),
+            str(lane.completed),
+            f"{lane.avg_wait * 1000:.0f} ms",
+            f"{lane.max_wait * 1000:.0f} ms",
+        )
+    console.print(table)
+
+
+# ════════════════════════════════════════════════════════════════════════════
+# Registration
+# ════════════════════════════════════════════════════════════════════════════
+register_command("/cache", cache_command)
@@ -0,0 +1,91 @@
+# mcp_cli/chat/commands/context.py
+"""
+Chat-mode "/context" command for MCP-CLI
+=======================================
+
+Shows how much of the conversation is sent to the model on each request
+and lets you change the token budget for the session.
+
+Only the request window is bounded - */conversation* still shows (and
+*/save* still writes) the complete history.
+
+Examples
+--------
+>>> /context               # window size vs. full history
+>>> /context 32000         # set the budget (estimated tokens)
+>>> /context off           # send the full history again
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+# Cross-platform Rich console helper
+from mcp_cli.utils.rich_helpers import get_console
+
+# Chat-command registry
+from mcp_cli.chat.commands import register_command
+
+
+# ════════════════════════════════════════════════════════════════════════════
+# Command handler
+# ════════════════════════════════════════════════════════════════════════════
+async def context_command(parts: List[str], ctx: Dict[str, Any]) -> bool:  # noqa: D401
+    """
+    Inspect or configure the context window.
+
+    Usage
+    -----
+      /context              - show window statistics
+      /context <tokens>     - set the token budget
+      /context off          - disable windowing
+    """
+    console = get_console()
+
+    window = ctx.get("context_window")
+    if window is None:
+        console.print("[red]Error:[/red] Context window not available.")
+        return True
+
+    args = parts[1:]
+    if args:
+        value = args[0].lower()
+        if value in ("off", "0"):
+            window.max_tokens = 0
+            console.print("[yellow]Context windowing disabled - the full history is sent.[/yellow]")
+            return True
+        try:
+            budget = int(value.replace(",", "").replace("_", ""))
+            if budget < 0:
+                raise ValueError
+        except ValueError:
+            console.print(f"[red]Invalid budget:[/red] {args[0]}  (use /context <tokens> or /context off)")
+            return True
+        window.max_tokens = budget
+        console.print(f"[green]Context budget set to ~{budget:,} tokens.[/green]")
+        return True
+
+    # Refresh the statistics against the current history
+    window.build(ctx.get("conversation_history", []) or [])
+    stats = window.stats
+
+    budget = f"~{window.max_tokens:,} tokens" if window.enabled else "off"
+    console.print(f"[green]Budget:[/green] {budget}  [green]Recent turns kept:[/green] {window.keep_turns}")
+    console.print(
+        f"[green]History:[/green] {stats.history_messages} messages, ~{stats.history_tokens:,} tokens"
+    )
+    console.print(
+        f"[green]Next request:[/green] {stats.window_messages} messages, ~{stats.window_tokens:,} tokens"
+    )
+    if stats.elided or stats.evicted:
+        console.print(
+            f"[dim]{stats.elided} old tool output(s) shortened, "
+            f"{stats.evicted} old message(s) omitted[/dim]"
+        )
+    return True
+
+
+# ════════════════════════════════════════════════════════════════════════════
+# Registration
+# ════════════════════════════════════════════════════════════════════════════
+register_command("/context", context_command, ["<tokens>", "off"])
@@ -20,6 +20,9 @@ MCP provides several commands for working with tools:
   - Verbose mode shows full details of each tool call
   - Compact mode shows a condensed, animated view
 
+- `/cache`: Show tool result cache statistics
+  - `/cache clear [tool]`: Drop all cached results, or only those of one tool
+
 - `/interrupt`, `/stop`, or `/cancel`: Interrupt running tool execution
 
 In compact mode (default), tool calls are shown in a condensed format.
@@ -34,6 +37,10 @@ MCP also provides commands to view and manage the conversation history:
 - `/conversation` or `/ch`: Display the conversation history for the current session
   - `/conversation --json`: Show the conversation history in raw JSON format
 
+- `/context`: Show how much of the history is sent with each request
+  - `/context <tokens>`: Set the token budget for requests
+  - `/context off`: Send the full history again
+
 These commands allow you to review all the messages exchanged during the session, making it easier to track the flow of your conversation.
 """
 
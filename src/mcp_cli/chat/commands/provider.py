@@ -14,6 +14,7 @@ At a glance
 * `/providers`                     - list available providers (shortcut)
 * `/provider config`               - dump full provider configs
 * `/provider diagnostic`           - ping each provider with a tiny prompt
+* `/provider refresh`              - rebuild the cached provider catalogue
 * `/provider set <prov> <k> <v>`   - change one config value (e.g. API key)
 * `/provider <prov>  [model]`      - switch provider (and optional model)
 
@@ -0,0 +1,243 @@
+# mcp_cli/chat/context_window.py
+"""
+Token-budgeted view of the conversation history.
+
+``ChatContext.conversation_history`` keeps every message for ``/conversation``
+and friends, but sending all of it on every turn eventually overflows the
+model's context and makes each request more expensive than the last.
+``ContextWindow`` builds the list that is actually sent:
+
+* token counts are estimated once per message and cached, so building the
+  window only costs work for messages added since the previous turn;
+* the system prompt and the most recent user turns are always kept;
+* when the estimate exceeds the budget, older tool outputs are first
+  replaced by a short preview, then whole older exchanges are dropped
+  (an assistant tool call is always dropped together with its results).
+
+The budget comes from ``MCP_CLI_CONTEXT_TOKENS`` (default 64000, ``0``
+disables windowing) and can be changed at runtime with ``/context``.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_TOKENS = 64000
+DEFAULT_KEEP_TURNS = 2
+DEFAULT_PREVIEW_CHARS = 200
+
+# Rough cost of the role / framing of each message
+_MESSAGE_OVERHEAD = 4
+
+
+def estimate_tokens(message: Dict[str, Any]) -> int:
+    """Cheap token estimate (~4 characters per token) for one chat message."""
+    chars = 0
+    content = message.get("content")
+    if isinstance(content, str):
+        chars += len(content)
+    elif content is not None:
+        chars += len(json.dumps(content, default=str))
+    for tc in message.get("tool_calls") or []:
+        fn = tc.get("function") or {}
+        chars += len(str(fn.get("name", ""))) + len(str(fn.get("arguments", "")))
+    return _MESSAGE_OVERHEAD + (chars + 3) // 4
+
+
+def _default_max_tokens() -> int:
+    value = os.getenv("MCP_CLI_CONTEXT_TOKENS")
+    if value:
+        try:
+            return int(value)
+        except ValueError:
+            logger.warning(f"Invalid MCP_CLI_CONTEXT_TOKENS: {value}")
+    return DEFAULT_MAX_TOKENS
+
+
+@dataclass
+class WindowStats:
+    """Outcome of the most recent :meth:`ContextWindow.build`."""
+    history_messages: int = 0
+    history_tokens: int = 0
+    window_messages: int = 0
+    window_tokens: int = 0
+    elided: int = 0
+    evicted: int = 0
+
+
+@dataclass
+class _Entry:
+    message: Dict[str, Any]
+    tokens: int
+    elided: Optional[Dict[str, Any]] = None
+    elided_tokens: int = 0
+
+
+class ContextWindow:
+    """Builds a bounded message list from the full conversation history."""
+
+    def __init__(
+        self,
+        max_tokens: Optional[int] = None,
+        keep_turns: int = DEFAULT_KEEP_TURNS,
+        preview_chars: int = DEFAULT_PREVIEW_CHARS,
+    ):
+        """
+        Args:
+            max_tokens: Estimated token budget per request; ``0`` disables
+            keep_turns: Number of most recent user turns that are never compacted
+            preview_chars: Characters of an elided tool output that are kept
+        """
+        self.max_tokens = _default_max_tokens() if max_tokens is None else max_tokens
+        self.keep_turns = max(1, keep_turns)
+        self.preview_chars = preview_chars
+
+        self._entries: List[_Entry] = []
+        self.stats = WindowStats()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_tokens > 0
+
+    # ------------------------------------------------------------------ #
+    # Incremental accounting                                             #
+    # ------------------------------------------------------------------ #
+    def _sync(self, history: List[Dict[str, Any]]) -> List[_Entry]:
+        """Re-use cached estimates for the unchanged prefix of *history*."""
+        entries = self._entries
+        keep = 0
+        limit = min(len(entries), len(history))
+        while keep < limit and entries[keep].message is history[keep]:
+            keep += 1
+        if keep < len(entries):
+            del entries[keep:]
+        for message in history[keep:]:
+            entries.append(_Entry(message, estimate_tokens(message)))
+        return entries
+
+    def _elide(self, entry: _Entry) -> Tuple[Dict[str, Any], int]:
+        if entry.elided is None:
+            content = str(entry.message.get("content") or "")
+            preview = content[: self.preview_chars].rstrip()
+            elided = dict(entry.message)
+            elided["content"] = (
+                f"[Earlier tool output elided to save context: {len(content):,} chars. "
+                f"Preview: {preview}…]"
+            )
+            entry.elided = elided
+            entry.elided_tokens = estimate_tokens(elided)
+        return entry.elided, entry.elided_tokens
+
+    # ------------------------------------------------------------------ #
+    # Window construction                                                #
+    # ------------------------------------------------------------------ #
+    def build(self, history: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Return the messages to send for the next request.
+
+        *history* is never modified; compacted messages are copies.
+        """
+        entries = self._sync(history)
+        total = sum(e.tokens for e in entries)
+        self.stats = WindowStats(
+            history_messages=len(history),
+            history_tokens=total,
+            window_messages=len(history),
+            window_tokens=total,
+        )
+        if not self.enabled or total <= self.max_tokens:
+            return list(history)
+
+        start = 1 if history and history[0].get("role") == "system" else 0
+        pinned_from = self._pinned_from(history, start)
+        messages: List[Optional[Dict[str, Any]]] = list(history)
+        costs = [e.tokens for e in entries]
+        tokens = total
+
+        def elide_tool_outputs(lo: int, hi: int) -> None:
+            nonlocal tokens
+            for i in range(lo, hi):
+                if tokens <= self.max_tokens:
+                    return
+                if history[i].get("role") == "tool":
+                    elided, elided_tokens = self._elide(entries[i])
+                    if elided_tokens < costs[i]:
+                        messages[i] = elided
+                        tokens -= costs[i] - elided_tokens
+                        costs[i] = elided_tokens
+                        self.stats.elided += 1
+
+        # 1. replace old tool outputs with a preview, oldest first
+        elide_tool_outputs(start, pinned_from)
+
+        # 2. drop whole exchanges, oldest first
+        evicted = 0
+        for lo, hi in self._groups(history, start, pinned_from):
+            if tokens <= self.max_tokens:
+                break
+            for i in range(lo, hi):
+                tokens -= costs[i]
+                messages[i] = None
+            evicted += hi - lo
+
+        # 3. last resort: elide pinned tool outputs except the newest exchange
+        if tokens > self.max_tokens:
+            elide_tool_outputs(pinned_from, max(pinned_from, self._last_group_start(history, start)))
+
+        window = [m for m in messages if m is not None]
+        if evicted and start:
+            note = (
+                f"\n\n[{evicted} earlier message(s) of this conversation were omitted "
+                "to fit the context window.]"
+            )
+            window[0] = {**window[0], "content": f"{window[0].get('content') or ''}{note}"}
+            tokens += estimate_tokens({"content": note}) - _MESSAGE_OVERHEAD
+
+        self.stats.evicted = evicted
+        self.stats.window_messages = len(window)
+        self.stats.window_tokens = tokens
+        logger.debug(
+            f"Context window: {len(window)}/{len(history)} messages, "
+            f"~{tokens}/{total} tokens (budget {self.max_tokens})"
+        )
+        return window
+
+    def _pinned_from(self, history: List[Dict[str, Any]], start: int) -> int:
+        """Index of the first message in the last ``keep_turns`` user turns."""
+        seen = 0
+        for i in range(len(history) - 1, start - 1, -1):
+            if history[i].get("role") == "user":
+                seen += 1
+                if seen == self.keep_turns:
+                    return i
+        return start
+
+    @staticmethod
+    def _groups(history: List[Dict[str, Any]], start: int, end: int) -> List[Tuple[int, int]]:
+        """Split ``history[start:end]`` into evictable units, keeping tool results with their call."""
+        groups: List[Tuple[int, int]] = []
+        i = start
+        while i < end:
+            j = i + 1
+            if history[i].get("tool_calls"):
+                while j < end and history[j].get("role") == "tool":
+                    j += 1
+            groups.append((i, j))
+            i = j
+        return groups
+
+    @staticmethod
+    def _last_group_start(history: List[Dict[str, Any]], start: int) -> int:
+        for i in range(len(history) - 1, start - 1, -1):
+            if history[i].get("role") != "tool":
+                return i
+        return start
+
+    def reset(self) -> None:
+        """Drop cached estimates (e.g. after the history was replaced)."""
+        self._entries = []
@@ -5,6 +5,7 @@ import logging
 from rich import print
 
 # mcp cli imports
+from mcp_cli.chat.chat_context import _VALID_TOOL_NAME, sanitize_message
 from mcp_cli.chat.tool_processor import ToolProcessor
 
 log = logging.getLogger(__name__)
@@ -34,6 +35,10 @@ class ConversationProcessor:
                     if last_msg.get("role") == "user" and content.startswith("/"):
                         return
 
+                    # Pick up tools of servers that finished starting since the last turn
+                    if hasattr(self.context, "refresh_tools_if_changed"):
+                        await self.context.refresh_tools_if_changed()
+
                     # Ensure OpenAI tools are loaded for function calling
                     if not getattr(self.context, "openai_tools", None):
                         await self._load_tools()
@@ -101,9 +106,7 @@ class ConversationProcessor:
                         self.ui_manager.stop_streaming_response()
                     
                     # Add to conversation history
-                    self.context.conversation_history.append(
-                        {"role": "assistant", "content": response_content}
-                    )
+                    self._add_assistant_message(response_content)
                     break
 
                 except asyncio.CancelledError:
@@ -111,9 +114,7 @@ class ConversationProcessor:
                 except Exception as exc:
                     print(f"[red]Error during conversation processing:[/red] {exc}")
                     import traceback; traceback.print_exc()
-                    self.context.conversation_history.append(
-                        {"role": "assistant", "content": f"I encountered an error: {exc}"}
-                    )
+                    self._add_assistant_message(f"I encountered an error: {exc}")
                     break
         except asyncio.CancelledError:
             raise
@@ -132,7 +133,7 @@ class ConversationProcessor:
         try:
             completion = await streaming_handler.stream_response(
                 client=self.context.client,
-                messages=self.context.conversation_history,
+                messages=self._request_messages(),
                 tools=self.context.openai_tools
             )
             
@@ -163,10 +164,11 @@ class ConversationProcessor:
     async def _handle_regular_completion(self) -> dict:
         """Handle regular (non-streaming) completion."""
         start_time = time.time()
+        messages = self._request_messages()
         
         try:
             completion = await self.context.client.create_completion(
-                messages=self.context.conversation_history,
+                messages=messages,
                 tools=self.context.openai_tools,
             )
         except Exception as e:
@@ -176,7 +178,7 @@ class ConversationProcessor:
                 log.error(f"Tool definition error: {err}")
                 print("[yellow]Warning: tool definitions rejected by model, retrying without tools...[/yellow]")
                 completion = await self.context.client.create_completion(
-                    messages=self.context.conversation_history
+                    messages=messages
                 )
             else:
                 raise
@@ -187,6 +189,18 @@ class ConversationProcessor:
         
         return completion
 
+    def _add_assistant_message(self, content: str) -> None:
+        if hasattr(self.context, "add_assistant_message"):
+            self.context.add_assistant_message(content)
+        else:
+            self.context.conversation_history.append({"role": "assistant", "content": content})
+
+    def _request_messages(self) -> list:
+        """Bounded message window for the next request (full history if unavailable)."""
+        if hasattr(self.context, "get_request_messages"):
+            return self.context.get_request_messages()
+        return self.context.conversation_history
+
     def _validate_streaming_tool_call(self, tool_call: dict) -> bool:
         """Validate that a tool call from streaming has the required structure."""
         try:
@@ -283,11 +297,10 @@ class ConversationProcessor:
                 log.debug(f"Loaded {len(self.context.openai_tools)} adapted tools for {provider}")
                 
                 # Validate all tool names
-                import re
                 has_invalid = False
                 for i, tool in enumerate(self.context.openai_tools):
                     name = tool["function"]["name"]
-                    is_valid = re.match(r'^[a-zA-Z0-9_-]+$', name) is not None
+                    is_valid = _VALID_TOOL_NAME.match(name) is not None
                     log.debug(f"Tool {i}: '{name}' valid = {is_valid}")
                     if not is_valid:
                         has_invalid = True
@@ -303,38 +316,11 @@ class ConversationProcessor:
     
     def _sanitize_conversation_history(self):
         """Ensure all tool names in conversation history follow provider's pattern."""
-        import re
-        
-        # Only process if we have history
-        if not self.context.conversation_history:
+        # ChatContext keeps a watermark, so only new messages are scanned
+        if hasattr(self.context, "sanitize_history"):
+            self.context.sanitize_history()
             return
-        
-        sanitized_count = 0
-        
-        # Go through all messages in history
-        for msg in self.context.conversation_history:
-            # Fix tool calls in assistant messages
-            if msg.get("role") == "assistant" and msg.get("tool_calls"):
-                for tc in msg.get("tool_calls", []):
-                    if tc.get("function") and "name" in tc["function"]:
-                        name = tc["function"]["name"]
-                        # If name contains a dot or doesn't match pattern, sanitize it
-                        if '.' in name or not re.match(r'^[a-zA-Z0-9_-]+$', name):
-                            # This name has dots or other invalid chars, sanitize it
-                            sanitized = re.sub(r'[^a-zA-Z0-9_-]', '_', name)
-                            log.debug(f"Sanitizing tool name in history: {name} -> {sanitized}")
-                            tc["function"]["name"] = sanitized
-                            sanitized_count += 1
-            
-            # Fix tool messages
-            if msg.get("role") == "tool" and "name" in msg:
-                name = msg["name"]
-                if '.' in name or not re.match(r'^[a-zA-Z0-9_-]+$', name):
-                    # Sanitize
-                    sanitized = re.sub(r'[^a-zA-Z0-9_-]', '_', name)
-                    log.debug(f"Sanitizing tool message name in history: {name} -> {sanitized}")
-                    msg["name"] = sanitized
-                    sanitized_count += 1
-        
+
+        sanitized_count = sum(sanitize_message(msg) for msg in self.context.conversation_history)
         if sanitized_count > 0:
-            log.debug(f"Sanitized {sanitized_count} tool name(s) in conversation history")
\ No newline at end of file
+            log.debug(f"Sanitized {sanitized_count} tool name(s) in conversation history")
@@ -0,0 +1,340 @@
+# mcp_cli/chat/session_store.py
+"""
+Append-only persistence for chat sessions.
+
+Each session is written to ``~/.mcp-cli/sessions/<id>.jsonl`` as it grows,
+one compact JSON record per line, so a crash loses at most the message
+being written.  Records are:
+
+* ``{"op": "meta", ...}`` - written once, when the session is created
+* ``{"op": "add", "m": {...}}`` - one message appended to the history
+* ``{"op": "reset", "m": [...]}`` - the history was replaced (``/clear``,
+  ``/compact``); the record carries the new, short history
+
+Every ``snapshot_every`` records the live history is also written to
+``<id>.snapshot.jsonl`` (header line + one message per line) together with
+the log offset it corresponds to.  Resuming streams the snapshot and then
+only the log records written after it, so resume time depends on the size
+of the history rather than on how long the log has become.
+
+The directory can be moved with ``MCP_CLI_SESSION_DIR``.  Old sessions
+are pruned whenever a new one is created: sessions not written to for
+``MCP_CLI_SESSION_MAX_AGE_DAYS`` days (default 30) are deleted, then the
+oldest ones until all sessions fit in ``MCP_CLI_SESSION_MAX_MB``
+megabytes (default 200).  ``0`` disables either limit.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import secrets
+import time
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+DEFAULT_SNAPSHOT_EVERY = 500
+DEFAULT_MAX_AGE_DAYS = 30
+DEFAULT_MAX_TOTAL_MB = 200
+
+_SEPARATORS = (",", ":")
+
+
+def default_session_dir() -> Path:
+    """Directory holding session logs."""
+    env = os.getenv("MCP_CLI_SESSION_DIR")
+    return Path(env).expanduser() if env else Path.home() / ".mcp-cli" / "sessions"
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={os.getenv(name)!r}")
+        return default
+
+
+def _dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=_SEPARATORS, ensure_ascii=False, default=str)
+
+
+def _read_records(fp: IO[str]) -> Iterator[Dict[str, Any]]:
+    """Yield JSON records from *fp*, stopping at a torn final line."""
+    for line in fp:
+        if not line.endswith("\n"):
+            logger.debug("Ignoring incomplete trailing session record")
+            return
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            logger.warning("Skipping unreadable session record")
+
+
+class SessionStore:
+    """JSONL log (plus snapshots) of one chat session's history."""
+
+    def __init__(
+        self,
+        session_id: str,
+        root: Optional[Path] = None,
+        snapshot_every: int = DEFAULT_SNAPSHOT_EVERY,
+    ):
+        """
+        Args:
+            session_id: Session identifier (file stem)
+            root: Directory for session files (default ``~/.mcp-cli/sessions``)
+            snapshot_every: Log records between snapshots; ``0`` disables them
+        """
+        self.session_id = session_id
+        self.root = Path(root) if root else default_session_dir()
+        self.snapshot_every = snapshot_every
+
+        self._fp: Optional[IO[str]] = None
+        self._since_snapshot = 0
+
+        # What the log currently reflects
+        self._history: Optional[List[Dict[str, Any]]] = None
+        self._count = 0
+        self._last: Optional[Dict[str, Any]] = None
+
+    # ------------------------------------------------------------------ #
+    # Construction                                                       #
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def new_session_id() -> str:
+        return f"{time.strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(3)}"
+
+    @classmethod
+    def create(cls, root: Optional[Path] = None, **meta: Any) -> "SessionStore":
+        """
+        Start a new session log; *meta* (provider, model, ...) goes in its
+        header.  Expired sessions are pruned first.
+        """
+        prune_sessions(root)
+        store = cls(cls.new_session_id(), root)
+        store._write({"op": "meta", "id": store.session_id, "created": time.time(), **meta})
+        return store
+
+    @classmethod
+    def open(cls, session_id: str, root: Optional[Path] = None) -> "SessionStore":
+        """
+        Open an existing session (``"latest"`` picks the most recent one).
+
+        Raises:
+            FileNotFoundError: If no such session exists
+        """
+        root = Path(root) if root else default_session_dir()
+        if session_id == "latest":
+            sessions = list_sessions(root)
+            if not sessions:
+                raise FileNotFoundError(f"No saved sessions in {root}")
+            session_id = sessions[0][0]
+        store = cls(session_id, root)
+        if not store.log_path.exists():
+            raise FileNotFoundError(f"Unknown session: {session_id}")
+        return store
+
+    @property
+    def log_path(self) -> Path:
+        return self.root / f"{self.session_id}.jsonl"
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.root / f"{self.session_id}.snapshot.jsonl"
+
+    # ------------------------------------------------------------------ #
+    # Writing                                                            #
+    # ------------------------------------------------------------------ #
+    def _write(self, record: Dict[str, Any]) -> None:
+        if self._fp is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._fp = open(self.log_path, "a", encoding="utf-8")
+        self._fp.write(_dumps(record) + "\n")
+        self._fp.flush()
+
+    def sync(self, history: List[Dict[str, Any]]) -> int:
+        """
+        Persist whatever *history* gained since the last call.
+
+        Appended messages cost one record each; a replaced or shortened
+        history is written as a single ``reset`` record.
+
+        Returns:
+            Number of records written
+        """
+        count = self._count
+        in_sync = (
+            (self._history is None or history is self._history)
+            and len(history) >= count
+            and (count == 0 or history[count - 1] is self._last)
+        )
+        try:
+            if in_sync:
+                new = history[count:]
+                for message in new:
+                    self._write({"op": "add", "m": message})
+                written = len(new)
+            else:
+                self._write({"op": "reset", "m": history})
+                written = 1
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not persist chat session {self.session_id}: {e}")
+            return 0
+
+        self.mark_synced(history)
+        self._since_snapshot += written
+        if self.snapshot_every and self._since_snapshot >= self.snapshot_every:
+            self.snapshot(history)
+        return written
+
+    def mark_synced(self, history: List[Dict[str, Any]]) -> None:
+        """Treat *history* as already persisted (e.g. right after a resume)."""
+        self._history = history
+        self._count = len(history)
+        self._last = history[-1] if history else None
+
+    def snapshot(self, history: List[Dict[str, Any]]) -> None:
+        """Write the full *history* and the matching log offset to the snapshot file."""
+        try:
+            offset = self.log_path.stat().st_size if self.log_path.exists() else 0
+            tmp = self.snapshot_path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(_dumps({"version": SNAPSHOT_VERSION, "offset": offset, "messages": len(history)}) + "\n")
+                for message in history:
+                    f.write(_dumps(message) + "\n")
+            os.replace(tmp, self.snapshot_path)
+            self._since_snapshot = 0
+            logger.debug(f"Snapshot of session {self.session_id}: {len(history)} messages")
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not snapshot chat session {self.session_id}: {e}")
+
+    def close(self) -> None:
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    # ------------------------------------------------------------------ #
+    # Reading                                                            #
+    # ------------------------------------------------------------------ #
+    def _load_snapshot(self) -> Tuple[List[Dict[str, Any]], int]:
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                header = json.loads(f.readline() or "{}")
+                if header.get("version") != SNAPSHOT_VERSION:
+                    return [], 0
+                messages = list(_read_records(f))
+        except FileNotFoundError:
+            return [], 0
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable snapshot for session {self.session_id}: {e}")
+            return [], 0
+
+        if len(messages) != header.get("messages"):
+            logger.warning(f"Ignoring incomplete snapshot for session {self.session_id}")
+            return [], 0
+        return messages, int(header.get("offset", 0))
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Rebuild the history: snapshot first, then the log records after it."""
+        history, offset = self._load_snapshot()
+        replayed = 0
+        with open(self.log_path, "r", encoding="utf-8") as f:
+            if offset:
+                f.seek(offset)
+            for record in _read_records(f):
+                op = record.get("op")
+                if op == "add":
+                    history.append(record["m"])
+                elif op == "reset":
+                    history = list(record["m"])
+                else:
+                    continue
+                replayed += 1
+        self._since_snapshot = replayed
+        logger.debug(
+            f"Loaded session {self.session_id}: {len(history)} messages "
+            f"({replayed} log records after snapshot)"
+        )
+        return history
+
+
+def list_sessions(root: Optional[Path] = None) -> List[Tuple[str, float]]:
+    """``(session_id, modified_time)`` pairs, most recent first."""
+    root = Path(root) if root else default_session_dir()
+    try:
+        logs = [p for p in root.glob("*.jsonl") if not p.name.endswith(".snapshot.jsonl")]
+    except OSError:
+        return []
+    sessions = []
+    for path in logs:
+        try:
+            sessions.append((path.stem, path.stat().st_mtime))
+        except OSError:
+            continue
+    return sorted(sessions, key=lambda s: s[1], reverse=True)
+
+
+def prune_sessions(
+    root: Optional[Path] = None,
+    max_age_days: Optional[float] = None,
+    max_total_mb: Optional[float] = None,
+) -> List[str]:
+    """
+    Delete sessions older than *max_age_days*, then the oldest remaining
+    ones until the rest fit in *max_total_mb*.  Limits default to
+    ``MCP_CLI_SESSION_MAX_AGE_DAYS`` / ``MCP_CLI_SESSION_MAX_MB``; ``0``
+    disables a limit.
+
+    Returns:
+        Ids of the deleted sessions
+    """
+    root = Path(root) if root else default_session_dir()
+    if max_age_days is None:
+        max_age_days = _env_number("MCP_CLI_SESSION_MAX_AGE_DAYS", DEFAULT_MAX_AGE_DAYS)
+    if max_total_mb is None:
+        max_total_mb = _env_number("MCP_CLI_SESSION_MAX_MB", DEFAULT_MAX_TOTAL_MB)
+
+    def size(session_id: str) -> int:
+        total = 0
+        for suffix in (".jsonl", ".snapshot.jsonl"):
+            try:
+                total += (root / f"{session_id}{suffix}").stat().st_size
+            except OSError:
+                pass
+        return total
+
+    sessions = list_sessions(root)  # newest first
+    cutoff = time.time() - max_age_days * 86400 if max_age_days > 0 else None
+    budget = max_total_mb * 1024 * 1024 if max_total_mb > 0 else None
+
+    expired: List[str] = []
+    used = 0
+    over = False
+    for session_id, mtime in sessions:
+        if cutoff is not None and mtime < cutoff:
+            expired.append(session_id)
+            continue
+        session_size = size(session_id)
+        if budget is not None and (over or used + session_size > budget):
+            over = True  # everything older than this goes too
+            expired.append(session_id)
+            continue
+        used += session_size
+
+    for session_id in expired:
+        for suffix in (".jsonl", ".snapshot.jsonl"):
+            try:
+                (root / f"{session_id}{suffix}").unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not remove old session file {session_id}{suffix}: {e}")
+    if expired:
+        logger.debug(f"Pruned {len(expired)} old chat sessions from {root}")
+    return expired
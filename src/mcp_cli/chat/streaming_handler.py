@@ -8,12 +8,14 @@ from __future__ import annotations
 
 import asyncio
 import json
+import re
 import time
-from typing import Any, Dict, List, Optional, AsyncIterator
+from typing import Any, Callable, Dict, List, Optional, AsyncIterator
 
-from rich.console import Console
+from rich.console import Console, ConsoleOptions, Group, NewLine, RenderResult
 from rich.live import Live
 from rich.panel import Panel
+from rich.segment import Segment
 from rich.text import Text
 from rich.markdown import Markdown
 
@@ -21,23 +23,313 @@ from mcp_cli.logging_config import get_logger
 
 logger = get_logger("streaming")
 
+_WORD_RE = re.compile(r"\S+")
+_FENCE_RE = re.compile(r"^\s{0,3}(```|~~~)")
+_LIVE_TAIL_CHARS = 4000  # trailing block size re-parsed on every repaint
+
+
+class _MarkdownBlock:
+    """One markdown block, rendered once per console width.
+
+    Leading / trailing blank lines are trimmed so blocks can be stacked with
+    exactly one blank line between them, as a single ``Markdown`` would.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self._markdown = Markdown(source)
+        self._width: Optional[int] = None
+        self._lines: List[List[Segment]] = []
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        if self._width != options.max_width:
+            lines = console.render_lines(self._markdown, options, pad=False)
+            blank = [not "".join(seg.text for seg in line).strip() for line in lines]
+            start, end = 0, len(lines)
+            while start < end and blank[start]:
+                start += 1
+            while end > start and blank[end - 1]:
+                end -= 1
+            self._lines = lines[start:end]
+            self._width = options.max_width
+        newline = Segment.line()
+        for line in self._lines:
+            yield from line
+            yield newline
+
+
+class ResponseAccumulator:
+    """
+    Append-only buffer for a streamed response.
+
+    Each chunk costs time proportional to the chunk itself: text is kept as
+    a list of parts, word / character counts are maintained incrementally,
+    and markdown blocks are frozen (rendered once) as soon as a blank line
+    outside a code fence, or the end of a fenced block, closes them.  Only
+    the trailing, unfinished block is re-parsed on each repaint, and once it
+    outgrows ``_LIVE_TAIL_CHARS`` it is re-parsed only after growing by half
+    again, the unparsed remainder being shown as plain text meanwhile.
+    """
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._joined: Optional[str] = ""
+        self.chars = 0
+        self.words = 0
+        self._ends_in_word = False
+
+        self.blocks: List[_MarkdownBlock] = []
+        self._rendered: List[Any] = []  # frozen blocks separated by blank lines
+        self._tail_parts: List[str] = []
+        self._tail_joined: Optional[str] = ""
+        self._tail_len = 0
+        self._tail_block: Optional[_MarkdownBlock] = None  # parsed prefix of a long tail
+        self._tail_rest = Text(end="")  # what arrived since, shown as is
+        self._tail_has_text = False
+        self._line: List[str] = []
+        self._in_fence = False
+        self._fence_is_block = False
+
+    def append(self, text: str) -> None:
+        """Add a chunk of streamed text."""
+        if not text:
+            return
+        self._parts.append(text)
+        self._joined = None
+        self.chars += len(text)
+
+        words = len(_WORD_RE.findall(text))
+        if words and self._ends_in_word and not text[0].isspace():
+            words -= 1  # word continues across the chunk boundary
+        self.words += words
+        self._ends_in_word = not text[-1].isspace()
+
+        start = 0
+        while True:
+            nl = text.find("\n", start)
+            if nl < 0:
+                if start < len(text):
+                    self._line.append(text[start:])
+                    self._push_tail(text[start:])
+                return
+            self._line.append(text[start:nl])
+            self._push_tail(text[start:nl + 1])
+            line = "".join(self._line)
+            self._line = []
+            start = nl + 1
+            self._end_line(line)
+
+    def _push_tail(self, text: str) -> None:
+        self._tail_parts.append(text)
+        self._tail_joined = None
+        self._tail_len += len(text)
+        if self._tail_block is not None:
+            self._tail_rest.append(text)
+
+    def _end_line(self, line: str) -> None:
+        """Freeze the tail if *line* closes a markdown block."""
+        if _FENCE_RE.match(line):
+            self._in_fence = not self._in_fence
+            if self._in_fence:
+                # a fence opening the block can be frozen as soon as it closes
+                self._fence_is_block = not self._tail_has_text
+                self._tail_has_text = True
+            elif self._fence_is_block:
+                self._freeze()
+        elif not self._in_fence and not line.strip():
+            if self._tail_has_text:
+                self._freeze()
+            else:
+                self._reset_tail()  # nothing but blank lines so far
+        elif line.strip():
+            self._tail_has_text = True
+
+    def _freeze(self) -> None:
+        block = _MarkdownBlock(self.tail)
+        self.blocks.append(block)
+        self._rendered.extend((block, NewLine()))
+        self._reset_tail()
+
+    def _reset_tail(self) -> None:
+        self._tail_parts = []
+        self._tail_joined = ""
+        self._tail_len = 0
+        self._tail_block = None
+        self._tail_rest = Text(end="")
+        self._tail_has_text = False
+
+    @property
+    def tail(self) -> str:
+        """The trailing, not yet frozen, part of the response."""
+        if self._tail_joined is None:
+            self._tail_joined = "".join(self._tail_parts)
+            self._tail_parts = [self._tail_joined]
+        return self._tail_joined
+
+    @property
+    def text(self) -> str:
+        """The full response so far."""
+        if self._joined is None:
+            self._joined = "".join(self._parts)
+            self._parts = [self._joined] if self._joined else []
+        return self._joined
+
+    def renderable(self, cursor: str = ""):
+        """Frozen blocks plus a freshly parsed trailing block."""
+        try:
+            if self._tail_len > _LIVE_TAIL_CHARS:
+                parsed = self._tail_block
+                if parsed is None or len(self._tail_rest) > len(parsed.source) // 2:
+                    parsed = self._tail_block = _MarkdownBlock(self.tail)
+                    self._tail_rest = Text(end="")
+                tail_renderable = Group(parsed, self._tail_rest, Text(cursor))
+            elif not self.tail.strip():
+                tail_renderable = Text((self.tail + cursor).lstrip())
+            else:
+                tail_renderable = _MarkdownBlock(self.tail + cursor)
+        except Exception as e:
+            logger.debug(f"Markdown rendering failed: {e}")
+            tail_renderable = Text(self.tail + cursor)
+        if not self._rendered:
+            return tail_renderable
+        return Group(*self._rendered, tail_renderable)
+
+    def __bool__(self) -> bool:
+        return self.chars > 0
+
+
+class JSONArgumentScanner:
+    """
+    Tracks brace / string / escape state of a JSON document fed in fragments.
+
+    Each fragment is scanned once, so knowing whether the document is
+    complete costs O(len(fragment)) rather than re-parsing everything
+    received so far.
+    """
+
+    __slots__ = ("depth", "in_string", "escape", "started", "closed")
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.started = False
+        self.closed = False
+
+    def feed(self, fragment: str) -> None:
+        """Advance the state over *fragment*."""
+        depth, in_string, escape = self.depth, self.in_string, self.escape
+        for ch in fragment:
+            if in_string:
+                if escape:
+                    escape = False
+                elif ch == "\\":
+                    escape = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch in "{[":
+                depth += 1
+                self.started = True
+            elif ch in "}]":
+                depth -= 1
+                if depth == 0 and self.started:
+                    self.closed = True
+        self.depth, self.in_string, self.escape = depth, in_string, escape
+
+    @property
+    def complete(self) -> bool:
+        """True once the top-level object / array has been closed."""
+        return self.closed and self.depth == 0 and not self.in_string
+
+
+class _StreamedToolCall:
+    """Accumulation state for one tool call being streamed."""
+
+    __slots__ = ("call", "name_parts", "arg_parts", "scanner", "parsed", "emitted", "valid")
+
+    def __init__(self, call: Dict[str, Any]):
+        self.call = call
+        self.name_parts: List[str] = []
+        self.arg_parts: List[str] = []
+        self.scanner = JSONArgumentScanner()
+        self.parsed: Any = None
+        self.emitted = False
+        self.valid = False
+
+    def add_name(self, fragment: str) -> None:
+        self.name_parts.append(fragment)
+        self.call["function"]["name"] = "".join(self.name_parts)
+
+    def add_arguments(self, fragment: str) -> None:
+        self.arg_parts.append(fragment)
+        self.scanner.feed(fragment)
+
+    @property
+    def complete(self) -> bool:
+        """Has a name and a closed JSON arguments value."""
+        return bool(self.name_parts) and self.scanner.complete
+
+    def finalize(self) -> bool:
+        """Join and parse the arguments exactly once; False if they are invalid."""
+        self.emitted = True
+        args = "".join(self.arg_parts)
+        self.call["function"]["arguments"] = args
+        if args.strip():
+            try:
+                self.parsed = json.loads(args)
+            except json.JSONDecodeError:
+                logger.warning(f"Invalid JSON in tool call arguments: {args}")
+                return False
+        self.valid = True
+        return True
+
 
 class StreamingResponseHandler:
     """Enhanced streaming handler with better UI integration and error handling."""
     
-    def __init__(self, console: Optional[Console] = None):
+    def __init__(
+        self,
+        console: Optional[Console] = None,
+        refresh_per_second: float = 10,
+        *,
+        live: bool = True,
+        on_text: Optional[Callable[[str], None]] = None,
+        on_tool_call: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        """
+        Args:
+            console: Console to render to
+            refresh_per_second: Frame rate of the live display; any number of
+                chunks arriving within one frame are painted together
+            live: Render the live panel; headless callers turn it off and
+                consume the stream through the callbacks instead
+            on_text: Called with every text fragment as it arrives
+            on_tool_call: Called with each tool call as soon as it is
+                complete (name plus valid JSON arguments)
+        """
         self.console = console or Console()
-        self.current_response = ""
+        self.refresh_per_second = max(1.0, float(refresh_per_second))
+        self.live = live
+        self.on_text = on_text
+        self.on_tool_call = on_tool_call
+        self._response = ResponseAccumulator()
         self.live_display: Optional[Live] = None
+        self._render_task: Optional[asyncio.Task] = None
+        self._dirty = False
+        self._last_yield = 0.0
         self.start_time = 0.0
         self.chunk_count = 0
         self.is_streaming = False
         self._response_complete = False
         self._interrupted = False
         
-        # Tool call tracking for streaming
-        self._accumulated_tool_calls = []
-        self._current_tool_call = None
+        # Tool call tracking for streaming, keyed by call id and by index
+        self._accumulated_tool_calls: List[_StreamedToolCall] = []
+        self._tool_calls_by_id: Dict[str, _StreamedToolCall] = {}
+        self._tool_calls_by_index: Dict[Any, _StreamedToolCall] = {}
+        self._completed_tool_calls = 0
         
     async def stream_response(
         self, 
@@ -58,14 +350,16 @@ class StreamingResponseHandler:
         Returns:
             Complete response dictionary
         """
-        self.current_response = ""
+        self._response = ResponseAccumulator()
         self.chunk_count = 0
         self.start_time = time.time()
         self.is_streaming = True
         self._response_complete = False
         self._interrupted = False
         self._accumulated_tool_calls = []
-        self._current_tool_call = None
+        self._tool_calls_by_id = {}
+        self._tool_calls_by_index = {}
+        self._completed_tool_calls = 0
         
         try:
             # Check if client supports streaming via create_completion with stream=True
@@ -78,6 +372,7 @@ class StreamingResponseHandler:
                 
         finally:
             self.is_streaming = False
+            await self._stop_render_loop()
             if self.live_display:
                 # Show final response if not already shown
                 if not self._response_complete:
@@ -85,6 +380,11 @@ class StreamingResponseHandler:
                 self.live_display.stop()
                 self.live_display = None
     
+    @property
+    def current_response(self) -> str:
+        """Full text of the response streamed so far."""
+        return self._response.text
+
     def interrupt_streaming(self):
         """Interrupt the current streaming operation."""
         self._interrupted = True
@@ -92,14 +392,13 @@ class StreamingResponseHandler:
     
     def _show_final_response(self):
         """Display the final complete response with enhanced formatting."""
-        if self._response_complete or not self.current_response:
+        if self._response_complete or not self._response:
             return
             
         elapsed = time.time() - self.start_time
         
         # Calculate stats
-        words = len(self.current_response.split())
-        chars = len(self.current_response)
+        words = self._response.words
         
         # Create subtitle with stats
         subtitle_parts = [f"Response time: {elapsed:.2f}s"]
@@ -166,6 +465,8 @@ class StreamingResponseHandler:
             logger.error(f"Streaming error in chuk-llm streaming: {e}")
             raise
         
+        self._flush_tool_calls(tool_calls)
+        
         # Build final response
         elapsed = time.time() - self.start_time
         result = {
@@ -212,6 +513,8 @@ class StreamingResponseHandler:
             logger.error(f"Streaming error in stream_completion: {e}")
             raise
         
+        self._flush_tool_calls(tool_calls)
+        
         # Build final response
         elapsed = time.time() - self.start_time
         return {
@@ -247,15 +550,49 @@ class StreamingResponseHandler:
         }
     
     def _start_live_display(self):
-        """Start the live display for streaming updates."""
+        """Start the live display and the loop that repaints it."""
+        if not self.live:
+            return
         if not self.live_display:
+            # Repainting is driven by _render_loop, not by Live's own thread
             self.live_display = Live(
                 self._create_display_content(),
                 console=self.console,
-                refresh_per_second=10,  # 10 FPS for smooth updates
+                auto_refresh=False,
+                refresh_per_second=self.refresh_per_second,
                 vertical_overflow="visible"
             )
             self.live_display.start()
+        if self._render_task is None:
+            self._dirty = False
+            self._last_yield = time.monotonic()
+            self._render_task = asyncio.create_task(self._render_loop())
+
+    async def _render_loop(self):
+        """Repaint at most once per frame, only when new chunks arrived."""
+        frame = 1.0 / self.refresh_per_second
+        while True:
+            await asyncio.sleep(frame)
+            self._repaint()
+
+    def _repaint(self):
+        if self._dirty and self.live_display and not self._interrupted:
+            self._dirty = False
+            try:
+                self.live_display.update(self._create_display_content(), refresh=True)
+            except Exception as e:
+                logger.debug(f"Live display update failed: {e}")
+
+    async def _stop_render_loop(self):
+        """Stop repainting and paint whatever arrived since the last frame."""
+        task, self._render_task = self._render_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._repaint()
     
     async def _process_chunk(self, chunk: Dict[str, Any], tool_calls: List[Dict[str, Any]]):
         """Process a single streaming chunk with enhanced error handling and tool call support."""
@@ -265,7 +602,9 @@ class StreamingResponseHandler:
             # Extract content from chunk
             content = self._extract_chunk_content(chunk)
             if content:
-                self.current_response += content
+                self._response.append(content)
+                if self.on_text:
+                    self.on_text(content)
             
             # Handle tool calls in chunks - ENHANCED TOOL CALL PROCESSING
             tool_call_data = self._extract_tool_calls_from_chunk(chunk)
@@ -273,12 +612,15 @@ class StreamingResponseHandler:
                 # Process tool call data and accumulate complete tool calls
                 self._process_tool_call_chunk(tool_call_data, tool_calls)
             
-            # Update live display
-            if self.live_display and not self._interrupted:
-                self.live_display.update(self._create_display_content())
-            
-            # Small delay to prevent overwhelming the terminal
-            await asyncio.sleep(0.01)
+            # The render loop picks this up on its next frame
+            self._dirty = True
+
+            # Chunks that arrive already buffered never suspend the consumer;
+            # yield once per frame so the render loop still gets to paint.
+            now = time.monotonic()
+            if now - self._last_yield >= 1.0 / self.refresh_per_second:
+                self._last_yield = now
+                await asyncio.sleep(0)
             
         except Exception as e:
             logger.warning(f"Error processing chunk: {e}")
@@ -373,16 +715,14 @@ class StreamingResponseHandler:
             tc_id = tool_call_item.get("id")
             tc_index = tool_call_item.get("index", 0)
             
-            # Find existing tool call or create new one
-            existing_tc = None
-            for tc in self._accumulated_tool_calls:
-                if tc.get("id") == tc_id or (tc_id is None and tc.get("index") == tc_index):
-                    existing_tc = tc
-                    break
+            # Find existing tool call (O(1)) or create new one
+            if tc_id is not None:
+                entry = self._tool_calls_by_id.get(tc_id)
+            else:
+                entry = self._tool_calls_by_index.get(tc_index)
             
-            if existing_tc is None:
-                # Create new tool call
-                existing_tc = {
+            if entry is None:
+                entry = _StreamedToolCall({
                     "id": tc_id or f"call_{len(self._accumulated_tool_calls)}",
                     "type": "function",
                     "function": {
@@ -390,99 +730,61 @@ class StreamingResponseHandler:
                         "arguments": ""
                     },
                     "index": tc_index
-                }
-                self._accumulated_tool_calls.append(existing_tc)
+                })
+                self._accumulated_tool_calls.append(entry)
+                if tc_id is not None:
+                    self._tool_calls_by_id[tc_id] = entry
+                self._tool_calls_by_index[tc_index] = entry
             
             # Update the tool call with new data
             if "type" in tool_call_item:
-                existing_tc["type"] = tool_call_item["type"]
+                entry.call["type"] = tool_call_item["type"]
             
-            if "function" in tool_call_item:
-                func_data = tool_call_item["function"]
-                existing_func = existing_tc["function"]
-                
+            func_data = tool_call_item.get("function")
+            if isinstance(func_data, dict):
                 # Accumulate function name
-                if "name" in func_data:
-                    if func_data["name"] is not None:
-                        existing_func["name"] += str(func_data["name"])
+                if func_data.get("name") is not None:
+                    entry.add_name(str(func_data["name"]))
                 
                 # Accumulate function arguments
-                if "arguments" in func_data:
-                    if func_data["arguments"] is not None:
-                        existing_func["arguments"] += str(func_data["arguments"])
+                arguments = func_data.get("arguments")
+                if arguments is not None:
+                    if not isinstance(arguments, str):
+                        arguments = json.dumps(arguments)
+                    entry.add_arguments(arguments)
             
-            # Check if this tool call is complete and add to final list
-            if self._is_tool_call_complete(existing_tc) and existing_tc not in tool_calls:
-                # Validate the tool call before adding
-                if self._validate_tool_call(existing_tc):
-                    tool_calls.append(dict(existing_tc))  # Make a copy
-                    logger.debug(f"Complete tool call accumulated: {existing_tc['function']['name']}")
+            # Emit each call once, parsing its arguments exactly once
+            if not entry.emitted and entry.complete:
+                self._completed_tool_calls += 1
+                if entry.finalize():
+                    tool_calls.append(dict(entry.call))  # Make a copy
+                    logger.debug(f"Complete tool call accumulated: {entry.call['function']['name']}")
+                    self._announce_tool_call(entry)
                 
         except Exception as e:
             logger.warning(f"Error accumulating tool call: {e}")
     
-    def _is_tool_call_complete(self, tool_call: Dict[str, Any]) -> bool:
-        """Check if a tool call has all required fields and appears complete."""
-        try:
-            if not tool_call.get("function"):
-                return False
-            
-            func = tool_call["function"]
-            name = func.get("name", "")
-            args = func.get("arguments", "")
-            
-            # Tool call is complete if:
-            # 1. Has a name
-            # 2. Arguments appear to be valid JSON or empty
-            if not name:
-                return False
-            
-            # Try to parse arguments as JSON if not empty
-            if args.strip():
-                try:
-                    json.loads(args)
-                except json.JSONDecodeError:
-                    # Still accumulating arguments
-                    return False
-            
-            return True
-            
-        except Exception as e:
-            logger.debug(f"Error checking tool call completeness: {e}")
-            return False
-    
-    def _validate_tool_call(self, tool_call: Dict[str, Any]) -> bool:
-        """Validate that a tool call has valid structure."""
-        try:
-            if not isinstance(tool_call, dict):
-                return False
-            
-            if "function" not in tool_call:
-                return False
-            
-            func = tool_call["function"]
-            if not isinstance(func, dict):
-                return False
-            
-            name = func.get("name", "")
-            if not name or not isinstance(name, str):
-                return False
-            
-            # Validate arguments if present
-            args = func.get("arguments", "")
-            if args:
-                try:
-                    json.loads(args)
-                except json.JSONDecodeError:
-                    logger.warning(f"Invalid JSON in tool call arguments: {args}")
-                    return False
-            
-            return True
-            
-        except Exception as e:
-            logger.warning(f"Error validating tool call: {e}")
-            return False
-    
+    def _flush_tool_calls(self, tool_calls: List[Dict[str, Any]]):
+        """
+        At end of stream, emit named calls whose arguments never formed a
+        closed JSON value (typically calls without arguments), then restore
+        the order in which the calls were streamed.
+        """
+        for entry in self._accumulated_tool_calls:
+            if not entry.emitted and entry.name_parts:
+                self._completed_tool_calls += 1
+                if entry.finalize():
+                    self._announce_tool_call(entry)
+        tool_calls[:] = [dict(e.call) for e in self._accumulated_tool_calls if e.valid]
+
+    def _announce_tool_call(self, entry: _StreamedToolCall):
+        """Hand a just-completed tool call to ``on_tool_call``."""
+        if self.on_tool_call:
+            try:
+                self.on_tool_call(dict(entry.call))
+            except Exception as e:
+                logger.warning(f"Tool call callback failed: {e}")
+
     def _create_display_content(self):
         """Create enhanced content for live display."""
         elapsed = time.time() - self.start_time
@@ -495,16 +797,13 @@ class StreamingResponseHandler:
         
         # Show tool call info if any are accumulating
         if self._accumulated_tool_calls:
-            complete_calls = sum(1 for tc in self._accumulated_tool_calls if self._is_tool_call_complete(tc))
             total_calls = len(self._accumulated_tool_calls)
-            status_text.append(f" • {complete_calls}/{total_calls} tools", style="dim magenta")
+            status_text.append(f" • {self._completed_tool_calls}/{total_calls} tools", style="dim magenta")
         
         # Show performance metrics if we have enough data
-        if elapsed > 1.0 and self.current_response:
-            words = len(self.current_response.split())
-            chars = len(self.current_response)
-            words_per_sec = words / elapsed
-            chars_per_sec = chars / elapsed
+        if elapsed > 1.0 and self._response:
+            words_per_sec = self._response.words / elapsed
+            chars_per_sec = self._response.chars / elapsed
             
             status_text.append(f" • {words_per_sec:.1f} words/s", style="dim green")
             status_text.append(f" • {chars_per_sec:.0f} chars/s", style="dim green")
@@ -514,20 +813,10 @@ class StreamingResponseHandler:
             status_text.append(" • INTERRUPTED", style="red bold")
         
         # Response content with typing cursor
-        if self.current_response:
-            try:
-                # Progressive markdown rendering with cursor
-                display_text = self.current_response
-                if not self._interrupted:
-                    display_text += " ▌"  # Add typing cursor
-                response_content = Markdown(display_text)
-            except Exception as e:
-                # Fallback to plain text if markdown fails
-                logger.debug(f"Markdown rendering failed: {e}")
-                display_text = self.current_response
-                if not self._interrupted:
-                    display_text += " ▌"
-                response_content = Text(display_text)
+        if self._response:
+            # Only the trailing block is re-parsed; finished blocks are frozen
+            cursor = " ▌" if not self._interrupted else ""  # typing cursor
+            response_content = self._response.renderable(cursor)
         else:
             # Show just cursor when no content yet
             cursor_style = "dim" if not self._interrupted else "red"
@@ -8,43 +8,82 @@ Executes multiple tool calls **concurrently** while keeping the original
 order of messages in *conversation_history*.
 
 * Normal CLI runtime: use the full **ToolManager** available via
-  ``context.tool_manager``.
+  ``context.tool_manager``.  All calls of one LLM turn are prepared up
+  front and streamed through ``stream_execute_tools``, which runs them
+  under the ToolManager's per-server scheduler (and an optional per-turn
+  ``max_concurrency`` cap).
 * Unit-tests: fall back to a minimal "stream-manager" stub that exposes
   ``call_tool()`` - no ToolManager required.
+
+Results - including calls that could not even be prepared - are written
+to history in the LLM's order, each contiguous prefix as soon as it is done.
 """
 from __future__ import annotations
 
 import asyncio
 import json
 import logging
-import uuid
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional, Union
 
 from rich import print as rprint
 from rich.console import Console
 
+from mcp_cli.chat.chat_context import sanitize_tool_name
 from mcp_cli.tools.formatting import display_tool_call_result
 from mcp_cli.tools.models import ToolCallResult
+from mcp_cli.tools.scheduler import DEFAULT_TURN_CONCURRENCY
+from mcp_cli.tools.serialization import DEFAULT_TABLE_FORMAT, format_tool_response
 
 log = logging.getLogger(__name__)
 
 
+@dataclass
+class _PreparedCall:
+    """One LLM tool call after name mapping and argument parsing."""
+    idx: int
+    call_id: str
+    tool_name: str            # name as sent by the LLM (OpenAI-compatible)
+    original_tool_name: str   # MCP name used for execution
+    raw_arguments: Any
+    arguments: Any
+
+
+@dataclass
+class _FailedCall:
+    """One LLM tool call that could not be prepared."""
+    idx: int
+    tool_call: Any
+    error: Exception
+
+
 class ToolProcessor:
     """Handle execution of tool calls returned by the LLM."""
 
     # ------------------------------------------------------------------ #
     # construction                                                       #
     # ------------------------------------------------------------------ #
-    def __init__(self, context, ui_manager, *, max_concurrency: int = 4) -> None:
+    def __init__(
+        self,
+        context,
+        ui_manager,
+        *,
+        max_concurrency: Optional[int] = None,
+        console: Optional[Console] = None,
+    ) -> None:
         self.context = context
         self.ui_manager = ui_manager
+        # Per-turn fan-out cap; None leaves it to the ToolManager's scheduler
+        self.max_concurrency = max_concurrency
+        # Where spinners and result panels go (stdout by default)
+        self.console = console
 
         # Either the full ToolManager *or* None when running unit-tests
         self.tool_manager = getattr(context, "tool_manager", None)
         # Minimal stub used by tests
         self.stream_manager = getattr(context, "stream_manager", None)
 
-        self._sem = asyncio.Semaphore(max_concurrency)
+        self._sem = asyncio.Semaphore(max_concurrency or DEFAULT_TURN_CONCURRENCY)
         self._pending: list[asyncio.Task] = []        # keep refs for cancel
 
         # Give the UI a back-pointer for Ctrl-C cancellation
@@ -61,23 +100,36 @@ class ToolProcessor:
         Args:
             tool_calls: List of tool call objects from the LLM
             name_mapping: Optional mapping from LLM tool names to original MCP tool names
-        
+
         The conversation history is updated in the **original** order
-        produced by the LLM.
+        produced by the LLM, as soon as each prefix of the turn completes.
         """
         if not tool_calls:
             rprint("[yellow]Warning: Empty tool_calls list received.[/yellow]")
             return
-            
+
         # Use empty mapping if none provided
         if name_mapping is None:
             name_mapping = {}
 
+        slots: List[Union[_PreparedCall, _FailedCall]] = []
         for idx, call in enumerate(tool_calls):
             if getattr(self.ui_manager, "interrupt_requested", False):
                 break                          # user hit Ctrl-C
-            task = asyncio.create_task(self._run_single_call(idx, call, name_mapping))
-            self._pending.append(task)
+            try:
+                slots.append(self._prepare_call(idx, call, name_mapping))
+            except Exception as exc:
+                # General catch-all for any other errors
+                log.exception("Error preparing tool call #%d", idx)
+                slots.append(_FailedCall(idx, call, exc))
+
+        if slots:
+            runnable = any(isinstance(slot, _PreparedCall) for slot in slots)
+            if runnable and self.tool_manager is not None and hasattr(self.tool_manager, "stream_execute_tools"):
+                turn = self._run_batch(slots)
+            else:
+                turn = self._run_individually(slots)
+            self._pending.append(asyncio.create_task(turn))
 
         try:
             await asyncio.gather(*self._pending)
@@ -108,265 +160,305 @@ class ToolProcessor:
                 t.cancel()
 
     # ------------------------------------------------------------------ #
-    # internals                                                          #
+    # internals - preparation                                            #
     # ------------------------------------------------------------------ #
-    async def _run_single_call(self, idx: int, tool_call: Any, name_mapping: Dict[str, str] = None) -> None:
-        """Execute one tool call and record the appropriate chat messages."""
-        if name_mapping is None:
-            name_mapping = {}
-            
-        # Create a reverse mapping to look up OpenAI names from original names if needed
-        reverse_mapping = {v: k for k, v in name_mapping.items()}
-                
-        async with self._sem:  # limit concurrency
-            tool_name = "unknown_tool"
-            raw_arguments: Any = {}
-            call_id = f"call_{idx}"
+    def _prepare_call(self, idx: int, tool_call: Any, name_mapping: Dict[str, str]) -> _PreparedCall:
+        """Extract name / id / arguments from one LLM tool call and announce it."""
+        tool_name = "unknown_tool"
+        raw_arguments: Any = {}
+        call_id = f"call_{idx}"
 
-            try:
-                # ------ schema-agnostic extraction -------------------
+        # ------ schema-agnostic extraction -------------------
+        try:
+            if hasattr(tool_call, "function"):
+                fn = tool_call.function
+                tool_name = getattr(fn, "name", "unknown_tool")
+                raw_arguments = getattr(fn, "arguments", {})
+                call_id = getattr(tool_call, "id", call_id)
+            elif isinstance(tool_call, dict) and "function" in tool_call:
+                fn = tool_call["function"]
+                tool_name = fn.get("name", "unknown_tool")
+                raw_arguments = fn.get("arguments", {})
+                call_id = tool_call.get("id", call_id)
+            else:
+                # Handle unexpected tool_call format
+                log.error(f"Unrecognized tool call format: {type(tool_call)}, raw: {tool_call}")
+                raise ValueError(f"Unrecognized tool call format: {type(tool_call)}")
+
+            # Ensure tool_name is not None or empty
+            if not tool_name or tool_name == "unknown_tool":
+                log.error(f"Tool name is empty or unknown in tool call: {tool_call}")
+                tool_name = f"unknown_tool_{idx}"
+
+        except Exception as e:
+            # Catch extraction errors separately to provide better diagnostics
+            log.error(f"Error extracting tool details from {tool_call}: {e}")
+            tool_name = f"unknown_tool_{idx}"
+            raw_arguments = {}
+
+        # Validate tool_name is a string and not None
+        if not isinstance(tool_name, str):
+            log.error(f"Tool name is not a string: {tool_name} (type: {type(tool_name)})")
+            tool_name = f"unknown_tool_{idx}"
+
+        # Get the original tool name from mapping if available
+        original_tool_name = name_mapping.get(tool_name, tool_name)
+        log.debug(f"Tool call: {tool_name} -> {original_tool_name} (after mapping)")
+
+        # If tool_name looks like a sanitized name (has underscore but no dot) and
+        # there's no mapping for it, try to recover the namespace
+        if "_" in tool_name and "." not in tool_name and tool_name not in name_mapping:
+            # This is likely a sanitized tool name like stdio_list_tables
+            parts = tool_name.split("_", 1)
+            if len(parts) == 2:
+                namespace, base_name = parts[0], parts[1]
+                log.debug(f"Extracted namespace '{namespace}' and base name '{base_name}' from '{tool_name}'")
+                original_tool_name = f"{namespace}.{base_name}"
+                log.debug(f"Reconstructed original tool name: {original_tool_name}")
+
+        # ui feedback
+        display_name = (
+            self.context.get_display_name_for_tool(original_tool_name)
+            if hasattr(self.context, "get_display_name_for_tool")
+            else original_tool_name
+        )
+        log.debug("[%d] Executing tool %s", idx, display_name)
+
+        try:
+            self.ui_manager.print_tool_call(display_name, raw_arguments)
+        except Exception as ui_exc:
+            # Don't fail the whole tool call if UI display fails
+            log.warning(f"UI display error (non-fatal): {ui_exc}")
+
+        # ------ parse args -----------------------------------
+        try:
+            if isinstance(raw_arguments, str):
                 try:
-                    if hasattr(tool_call, "function"):
-                        fn = tool_call.function
-                        tool_name = getattr(fn, "name", "unknown_tool")
-                        raw_arguments = getattr(fn, "arguments", {})
-                        call_id = getattr(tool_call, "id", call_id)
-                    elif isinstance(tool_call, dict) and "function" in tool_call:
-                        fn = tool_call["function"]
-                        tool_name = fn.get("name", "unknown_tool")
-                        raw_arguments = fn.get("arguments", {})
-                        call_id = tool_call.get("id", call_id)
+                    # Handle empty string case
+                    if not raw_arguments.strip():
+                        arguments = {}
                     else:
-                        # Handle unexpected tool_call format
-                        log.error(f"Unrecognized tool call format: {type(tool_call)}, raw: {tool_call}")
-                        raise ValueError(f"Unrecognized tool call format: {type(tool_call)}")
-                        
-                    # Ensure tool_name is not None or empty
-                    if not tool_name or tool_name == "unknown_tool":
-                        log.error(f"Tool name is empty or unknown in tool call: {tool_call}")
-                        tool_name = f"unknown_tool_{idx}"
-                        
-                except Exception as e:
-                    # Catch extraction errors separately to provide better diagnostics
-                    log.error(f"Error extracting tool details from {tool_call}: {e}")
-                    tool_name = f"unknown_tool_{idx}"
-                    raw_arguments = {}
-
-                # Validate tool_name is a string and not None
-                if not isinstance(tool_name, str):
-                    log.error(f"Tool name is not a string: {tool_name} (type: {type(tool_name)})")
-                    tool_name = f"unknown_tool_{idx}"
-
-                # Get the original tool name from mapping if available
-                original_tool_name = name_mapping.get(tool_name, tool_name)
-                log.debug(f"Tool call: {tool_name} -> {original_tool_name} (after mapping)")
-                
-                # If tool_name looks like a sanitized name (has underscore but no dot) and
-                # there's no mapping for it, try to recover the namespace
-                if "_" in tool_name and "." not in tool_name and tool_name not in name_mapping:
-                    # This is likely a sanitized tool name like stdio_list_tables
-                    # Try to extract namespace from the name
-                    parts = tool_name.split("_", 1)
-                    if len(parts) == 2:
-                        namespace, base_name = parts[0], parts[1]
-                        log.debug(f"Extracted namespace '{namespace}' and base name '{base_name}' from '{tool_name}'")
-                        original_tool_name = f"{namespace}.{base_name}"
-                        log.debug(f"Reconstructed original tool name: {original_tool_name}")
-                        
-                # ui feedback
-                display_name = (
-                    self.context.get_display_name_for_tool(original_tool_name)
-                    if hasattr(self.context, "get_display_name_for_tool")
-                    else original_tool_name
+                        arguments = json.loads(raw_arguments)
+                except json.JSONDecodeError as json_err:
+                    log.warning(f"Invalid JSON in arguments: {json_err}")
+                    # If it's not valid JSON, try to use it as an empty dict
+                    arguments = {}
+            else:
+                arguments = raw_arguments or {}
+        except Exception as arg_exc:
+            log.error(f"Error parsing arguments: {arg_exc}")
+            arguments = {}  # Use empty dict as fallback
+
+        return _PreparedCall(idx, call_id, tool_name, original_tool_name, raw_arguments, arguments)
+
+    # ------------------------------------------------------------------ #
+    # internals - execution                                              #
+    # ------------------------------------------------------------------ #
+    async def _run_batch(self, slots: List[Union[_PreparedCall, _FailedCall]]) -> None:
+        """
+        Stream the turn's prepared calls through the ToolManager.
+
+        Results arrive in completion order; they are written to history in
+        the LLM's order, flushing each contiguous prefix as soon as it is done.
+        """
+        prepared = [(pos, slot) for pos, slot in enumerate(slots) if isinstance(slot, _PreparedCall)]
+        outcomes: Dict[int, Optional[ToolCallResult]] = {
+            pos: None for pos, slot in enumerate(slots) if isinstance(slot, _FailedCall)
+        }
+        next_to_flush = 0
+
+        def flush() -> None:
+            nonlocal next_to_flush
+            while next_to_flush < len(slots) and next_to_flush in outcomes:
+                self._record_slot(slots[next_to_flush], outcomes.pop(next_to_flush))
+                next_to_flush += 1
+
+        flush()
+        calls = [(p.original_tool_name, p.arguments) for _, p in prepared]
+        label = "Executing tool…" if len(calls) == 1 else f"Executing {len(calls)} tools…"
+        limit = {"max_concurrency": self.max_concurrency} if self.max_concurrency else {}
+        try:
+            with (self.console or Console()).status(f"[cyan]{label}[/cyan]", spinner="dots"):
+                async for i, tool_result in self.tool_manager.stream_execute_tools(calls, **limit):
+                    outcomes[prepared[i][0]] = tool_result
+                    flush()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exec_exc:
+            log.error(f"Tool execution error: {exec_exc}")
+            for pos, p in prepared:
+                outcomes.setdefault(
+                    pos,
+                    ToolCallResult(p.original_tool_name, False, error=f"Execution failed: {exec_exc}"),
                 )
-                log.debug("[%d] Executing tool %s", idx, display_name)
-                
-                try:
-                    self.ui_manager.print_tool_call(display_name, raw_arguments)
-                except Exception as ui_exc:
-                    # Don't fail the whole tool call if UI display fails
-                    log.warning(f"UI display error (non-fatal): {ui_exc}")
+            flush()
+
+    async def _run_individually(self, slots: List[Union[_PreparedCall, _FailedCall]]) -> None:
+        """Stub path: execute each call via ``stream_manager.call_tool``."""
+        async def run_one(slot):
+            if isinstance(slot, _FailedCall):
+                return None
+            async with self._sem:  # limit concurrency
+                return await self._call_stream_manager(slot)
+
+        results = await asyncio.gather(*(run_one(slot) for slot in slots))
+        for slot, outcome in zip(slots, results):
+            if isinstance(slot, _FailedCall):
+                self._record_failure(slot.idx, slot.tool_call, slot.error)
+            else:
+                success, content = outcome
+                self._record(slot, success, content, None)
+
+    async def _call_stream_manager(self, p: _PreparedCall):
+        """Return ``(success, content)`` for one call through the stream-manager stub."""
+        try:
+            if self.stream_manager is not None and hasattr(self.stream_manager, "call_tool"):
+                with (self.console or Console()).status("[cyan]Executing tool…[/cyan]", spinner="dots"):
+                    # Use the original (mapped) tool name for execution
+                    call_res = await self.stream_manager.call_tool(p.original_tool_name, p.arguments)
 
-                # ------ parse args -----------------------------------
-                try:
-                    if isinstance(raw_arguments, str):
-                        try:
-                            # Handle empty string case
-                            if not raw_arguments.strip():
-                                arguments = {}
-                            else:
-                                arguments = json.loads(raw_arguments)
-                        except json.JSONDecodeError as json_err:
-                            log.warning(f"Invalid JSON in arguments: {json_err}")
-                            # If it's not valid JSON, try to use it as an empty dict
-                            arguments = {}
-                    else:
-                        arguments = raw_arguments or {}
-                except Exception as arg_exc:
-                    log.error(f"Error parsing arguments: {arg_exc}")
-                    arguments = {}  # Use empty dict as fallback
+                if isinstance(call_res, dict):
+                    return not call_res.get("isError", False), call_res.get("content", call_res)
+                return True, call_res
 
-                # ------ execute --------------------------------------
-                tool_result: Optional[ToolCallResult] = None
-                success = False
-                content: str | Dict[str, Any] = ""
-                error_msg: Optional[str] = None
+            error_msg = "No StreamManager available for tool execution."
+            raise RuntimeError(error_msg)
+        except asyncio.CancelledError:
+            # Special case - propagate cancellation
+            raise
+        except Exception as exec_exc:
+            log.error(f"Tool execution error: {exec_exc}")
+            return False, f"Error: Execution failed: {exec_exc}"
 
-                try:
-                    if self.tool_manager is not None:
-                        with Console().status("[cyan]Executing tool…[/cyan]", spinner="dots"):
-                            # Use the original (mapped) tool name for execution
-                            tool_result = await self.tool_manager.execute_tool(original_tool_name, arguments)
-
-                        success = tool_result.success
-                        error_msg = tool_result.error
-                        content = tool_result.result if success else f"Error: {error_msg}"
-
-                    elif self.stream_manager is not None and hasattr(self.stream_manager, "call_tool"):
-                        with Console().status("[cyan]Executing tool…[/cyan]", spinner="dots"):
-                            # Use the original (mapped) tool name for execution
-                            call_res = await self.stream_manager.call_tool(original_tool_name, arguments)
-
-                        if isinstance(call_res, dict):
-                            success = not call_res.get("isError", False)
-                            error_msg = call_res.get("error")
-                            content = call_res.get("content", call_res)
-                        else:
-                            success = True
-                            content = call_res
-                    else:
-                        error_msg = "No StreamManager available for tool execution."
-                        content = f"Error: {error_msg}"
-                        raise RuntimeError(error_msg)
-                except asyncio.CancelledError:
-                    # Special case - propagate cancellation
-                    raise
-                except Exception as exec_exc:
-                    log.error(f"Tool execution error: {exec_exc}")
-                    error_msg = f"Execution failed: {exec_exc}"
-                    content = f"Error: {error_msg}"
-                    success = False
-
-                # ------ normalise content ----------------------------
-                try:
-                    if not success and not str(content).startswith("Error"):
-                        content = f"Error: {content}"
-                    if isinstance(content, (dict, list)):
-                        try:
-                            content = json.dumps(content, indent=2)
-                        except (TypeError, ValueError) as json_err:
-                            log.warning(f"Error serializing content to JSON: {json_err}")
-                            content = str(content)  # Fall back to string representation
-                except Exception as norm_exc:
-                    log.warning(f"Error normalizing content: {norm_exc}")
-                    content = f"Error normalizing result: {norm_exc}"
-
-                # ------ ChatML bookkeeping - KEY CHANGE -------------
-                try:
-                    # IMPORTANT: For conversation history, we use the SAME NAME that was in the original tool call
-                    # The tool_name from the tool_call should be in the right format for OpenAI
-                    
-                    # Double-check it's OpenAI compatible  
-                    import re
-                    if not re.match(r'^[a-zA-Z0-9_-]+$', tool_name):
-                        # If it's not compatible, sanitize it
-                        log.warning(f"Tool name '{tool_name}' is not OpenAI compatible, sanitizing")
-                        tool_name = re.sub(r'[^a-zA-Z0-9_-]', '_', tool_name)
-                    
-                    arg_json = (
-                        json.dumps(arguments)
-                        if isinstance(arguments, dict)
-                        else str(arguments)
-                    )
-                    
-                    # Add the assistant's tool call to history
-                    self.context.conversation_history.append(
-                        {
-                            "role": "assistant",
-                            "content": None,
-                            "tool_calls": [
-                                {
-                                    "id": call_id,
-                                    "type": "function",
-                                    "function": {
-                                        "name": tool_name,  # Use OpenAI-compatible name
-                                        "arguments": arg_json,
-                                    },
-                                }
-                            ],
-                        }
-                    )
-                    
-                    # Add the tool's response
-                    self.context.conversation_history.append(
-                        {
-                            "role": "tool",
+    # ------------------------------------------------------------------ #
+    # internals - history bookkeeping                                    #
+    # ------------------------------------------------------------------ #
+    def _record_slot(
+        self, slot: Union[_PreparedCall, _FailedCall], tool_result: Optional[ToolCallResult]
+    ) -> None:
+        """Record one position of the turn: a ToolManager result or a preparation failure."""
+        if isinstance(slot, _FailedCall):
+            self._record_failure(slot.idx, slot.tool_call, slot.error)
+        else:
+            self._record_tool_result(slot, tool_result)
+
+    def _record_tool_result(self, p: _PreparedCall, tool_result: ToolCallResult) -> None:
+        """Record a ToolManager result."""
+        content = tool_result.result if tool_result.success else f"Error: {tool_result.error}"
+        self._record(p, tool_result.success, content, tool_result)
+
+    def _record(
+        self,
+        p: _PreparedCall,
+        success: bool,
+        content: Any,
+        tool_result: Optional[ToolCallResult],
+    ) -> None:
+        """Append the assistant tool call and the tool response to history."""
+        # ------ normalise content ----------------------------
+        try:
+            if not success and not str(content).startswith("Error"):
+                content = f"Error: {content}"
+            if isinstance(content, (dict, list)):
+                encode = getattr(self.tool_manager, "format_result", None)
+                if callable(encode):
+                    content = encode(content, getattr(self.context, "provider", None))
+                else:
+                    content = format_tool_response(content, DEFAULT_TABLE_FORMAT)
+        except Exception as norm_exc:
+            log.warning(f"Error normalizing content: {norm_exc}")
+            content = f"Error normalizing result: {norm_exc}"
+
+        # ------ keep oversized results out of the history ----
+        spill = getattr(self.tool_manager, "spill_result", None)
+        if success and callable(spill):
+            text = str(content)
+            inline = spill(p.original_tool_name, text)
+            if inline is not text:
+                content = inline
+                if tool_result is not None:
+                    tool_result = replace(tool_result, result=inline)
+
+        # ------ ChatML bookkeeping ---------------------------
+        try:
+            # IMPORTANT: For conversation history, we use the SAME NAME that was in the original tool call
+            # The tool_name from the tool_call should be in the right format for OpenAI
+            tool_name = sanitize_tool_name(p.tool_name)
+            if tool_name != p.tool_name:
+                log.warning(f"Tool name '{p.tool_name}' is not OpenAI compatible, sanitized to '{tool_name}'")
+
+            arg_json = (
+                json.dumps(p.arguments)
+                if isinstance(p.arguments, dict)
+                else str(p.arguments)
+            )
+
+            self._append_history(p.call_id, tool_name, arg_json, str(content))
+            log.debug(f"Added to conversation history with tool name: {tool_name}")
+
+        except Exception as hist_exc:
+            log.error(f"Error updating conversation history: {hist_exc}")
+            # This is serious but we'll continue to try displaying the result
+
+        # pretty-print result for real CLI runs
+        try:
+            if tool_result is not None:
+                if self.console is None:
+                    display_tool_call_result(tool_result)
+                else:
+                    display_tool_call_result(tool_result, self.console)
+        except Exception as display_exc:
+            log.error(f"Error displaying tool result: {display_exc}")
+            # Don't re-raise - we've already added to conversation history
+
+    def _record_failure(self, idx: int, tool_call: Any, exc: Exception) -> None:
+        """Record fallback messages for a call that could not even be prepared."""
+        try:
+            # Use plain print instead of rprint to avoid potential markup issues
+            print(f"Error executing tool call #{idx}: {exc}")
+
+            call_id = (
+                tool_call.get("id", f"call_{idx}") if isinstance(tool_call, dict)
+                else getattr(tool_call, "id", f"call_{idx}")
+            )
+            self._append_history(
+                call_id,
+                f"unknown_tool_{idx}",
+                "{}",
+                f"Error: Could not execute tool. {exc}",
+            )
+        except Exception as recovery_exc:
+            # Last-ditch error handling if even our error recovery fails
+            log.critical(f"Failed to recover from tool error: {recovery_exc}")
+
+    def _append_history(self, call_id: str, tool_name: str, arg_json: str, content: str) -> None:
+        """Add the assistant's tool call and the tool's response to history."""
+        if hasattr(self.context, "add_tool_exchange"):
+            # ChatContext sanitizes the entries as they are appended
+            self.context.add_tool_exchange(call_id, tool_name, arg_json, content)
+            return
+
+        self.context.conversation_history.append(
+            {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": call_id,
+                        "type": "function",
+                        "function": {
                             "name": tool_name,  # Use OpenAI-compatible name
-                            "content": str(content),
-                            "tool_call_id": call_id,
-                        }
-                    )
-                    
-                    log.debug(f"Added to conversation history with tool name: {tool_name}")
-                    
-                except Exception as hist_exc:
-                    log.error(f"Error updating conversation history: {hist_exc}")
-                    # This is serious but we'll continue to try displaying the result
-
-                # pretty-print result for real CLI runs
-                try:
-                    if tool_result is not None:
-                        display_tool_call_result(tool_result)
-                except Exception as display_exc:
-                    log.error(f"Error displaying tool result: {display_exc}")
-                    # Don't re-raise - we've already added to conversation history
-
-            except asyncio.CancelledError:
-                # Special case - always propagate cancellation
-                raise
-            except Exception as exc:
-                # General catch-all for any other errors
-                log.exception("Error executing tool call #%d", idx)
-                
-                try:
-                    # Use plain print instead of rprint to avoid potential markup issues
-                    print(f"Error executing tool {tool_name}: {exc}")
-                    
-                    # Ensure we use a sanitized tool name for the history
-                    import re
-                    sanitized_name = tool_name if isinstance(tool_name, str) else f"unknown_tool_{idx}"
-                    if not re.match(r'^[a-zA-Z0-9_-]+$', sanitized_name):
-                        sanitized_name = re.sub(r'[^a-zA-Z0-9_-]', '_', sanitized_name)
-                    
-                    # Add fallback messages to conversation history
-                    self.context.conversation_history.append(
-                        {
-                            "role": "assistant",
-                            "content": None,
-                            "tool_calls": [
-                                {
-                                    "id": call_id,
-                                    "type": "function",
-                                    "function": {
-                                        "name": sanitized_name,  # Use sanitized name
-                                        "arguments": json.dumps(raw_arguments)
-                                        if isinstance(raw_arguments, dict)
-                                        else str(raw_arguments or {}),
-                                    },
-                                }
-                            ],
-                        }
-                    )
-                    
-                    # Ensure exact match for error format
-                    self.context.conversation_history.append(
-                        {
-                            "role": "tool",
-                            "name": sanitized_name,  # Use sanitized name
-                            "content": f"Error: Could not execute tool. {exc}",
-                            "tool_call_id": call_id,
-                        }
-                    )
-                except Exception as recovery_exc:
-                    # Last-ditch error handling if even our error recovery fails
-                    log.critical(f"Failed to recover from tool error: {recovery_exc}")
\ No newline at end of file
+                            "arguments": arg_json,
+                        },
+                    }
+                ],
+            }
+        )
+        self.context.conversation_history.append(
+            {
+                "role": "tool",
+                "name": tool_name,  # Use OpenAI-compatible name
+                "content": content,
+                "tool_call_id": call_id,
+            }
+        )
@@ -1,34 +1,32 @@
 # mcp_cli/cli/commands/__init__.py
-def register_all_commands() -> None:
-    """
-    Instantiate and register every CLI command into the registry.
-    """
-    # Delay import to avoid circular dependencies
-    from mcp_cli.cli.registry import CommandRegistry
 
+# name -> ("module:Class", help). Modules are imported on first use only.
+_COMMANDS = {
     # Core "mode" commands
-    from mcp_cli.cli.commands.interactive import InteractiveCommand
-    from mcp_cli.cli.commands.chat import ChatCommand
-    from mcp_cli.cli.commands.cmd import CmdCommand
-    from mcp_cli.cli.commands.ping import PingCommand
-    from mcp_cli.cli.commands.provider import ProviderCommand
+    "interactive": ("mcp_cli.cli.commands.interactive:InteractiveCommand", "Start interactive command mode."),
+    "chat": ("mcp_cli.cli.commands.chat:ChatCommand", "Start interactive chat mode."),
+    "cmd": ("mcp_cli.cli.commands.cmd:CmdCommand", "Execute commands non-interactively (with multi-turn by default)."),
+    "ping": ("mcp_cli.cli.commands.ping:PingCommand", "Ping connected MCP servers."),
+    "provider": ("mcp_cli.cli.commands.provider:ProviderCommand", "Manage LLM providers (show/list/config/set/switch/refresh)."),
 
     # Sub-app commands
-    from mcp_cli.cli.commands.tools import ToolsListCommand
-    from mcp_cli.cli.commands.tools_call import ToolsCallCommand
-    from mcp_cli.cli.commands.prompts import PromptsListCommand
-    from mcp_cli.cli.commands.resources import ResourcesListCommand
-    from mcp_cli.cli.commands.servers import ServersListCommand        # ← NEW
+    "tools list": ("mcp_cli.cli.commands.tools:ToolsListCommand", "List unique tools across all connected servers."),
+    "tools call": ("mcp_cli.cli.commands.tools_call:ToolsCallCommand", "Call a specific tool with arguments."),
+    "prompts list": ("mcp_cli.cli.commands.prompts:PromptsListCommand", "List all prompts recorded on connected servers."),
+    "resources list": ("mcp_cli.cli.commands.resources:ResourcesListCommand", "List all resources recorded on connected servers."),
+    "servers": ("mcp_cli.cli.commands.servers:ServersListCommand", "Display comprehensive server information."),
+}
+
 
-    # Register everything in the central registry
-    CommandRegistry.register(InteractiveCommand())
-    CommandRegistry.register(ChatCommand())
-    CommandRegistry.register(CmdCommand())
-    CommandRegistry.register(PingCommand())
-    CommandRegistry.register(ProviderCommand())
+def register_all_commands() -> None:
+    """
+    Register every CLI command into the registry.
+
+    Commands are registered lazily: a command's module (and the heavy
+    dependencies it pulls in) is imported only when the command is used.
+    """
+    # Delay import to avoid circular dependencies
+    from mcp_cli.cli.registry import CommandRegistry
 
-    CommandRegistry.register(ToolsListCommand())
-    CommandRegistry.register(ToolsCallCommand())
-    CommandRegistry.register(PromptsListCommand())
-    CommandRegistry.register(ResourcesListCommand())
-    CommandRegistry.register(ServersListCommand())                     # ← NEW
+    for name, (target, help_text) in _COMMANDS.items():
+        CommandRegistry.register_lazy(name, target, help_text)
@@ -8,13 +8,15 @@ import asyncio
 import inspect
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union, Awaitable
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TypeVar, Union, Awaitable
 
 import typer
 
-from mcp_cli.tools.manager import ToolManager
 from mcp_cli.cli_options import process_options
 
+if TYPE_CHECKING:
+    from mcp_cli.tools.manager import ToolManager
+
 # Type hints for command functions
 CommandReturn = TypeVar('CommandReturn')
 AsyncCommandFunc = Callable[..., Awaitable[CommandReturn]]
@@ -28,6 +30,8 @@ class BaseCommand(ABC):
     
     name: str
     help: str
+    # Name under which a running `mcp-cli serve` daemon can run this command
+    daemon_command: Optional[str] = None
     
     def __init__(self, name: str, help_text: str = ""):
         self.name = name
@@ -60,6 +64,8 @@ class BaseCommand(ABC):
                 "model": model,
                 "server_names": server_names,
             }
+            if self.daemon_command:
+                extra_params["daemon_command"] = self.daemon_command
             
             run_command_func(
                 self.wrapped_execute,
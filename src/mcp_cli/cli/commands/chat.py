@@ -46,15 +46,18 @@ class ChatCommand(BaseCommand):
         model = params.get("model")
         api_base = params.get("api_base")
         api_key = params.get("api_key")
+        resume = params.get("resume")
 
         log.debug("Starting chat (provider=%s model=%s)", provider, model)
-        
+
+        kwargs = {"resume": resume} if resume else {}
         return await handle_chat_mode(
             tool_manager=tool_manager,
             provider=provider,
             model=model,
             api_base=api_base,
-            api_key=api_key
+            api_key=api_key,
+            **kwargs,
         )
 
     def register(self, app: typer.Typer, run_command_func: Callable) -> None:
@@ -70,6 +73,7 @@ class ChatCommand(BaseCommand):
             api_key: Optional[str] = typer.Option(None, "--api-key", help="API key"),
             disable_filesystem: bool = typer.Option(False, help="Disable filesystem access"),
             logging_level: str = typer.Option("WARNING", help="Set logging level"),
+            resume: Optional[str] = typer.Option(None, "--resume", help="Resume a saved session (id or 'latest')"),
         ) -> None:
             """Start interactive chat mode."""
             _set_logging(logging_level)
@@ -89,6 +93,8 @@ class ChatCommand(BaseCommand):
                 "api_base": api_base,
                 "api_key": api_key,
                 "server_names": server_names,
+                "resume": resume,
+                "wait_for_all_servers": False,
             }
             
             run_command_func(self.wrapped_execute, config_file, servers, extra_params=extra)
@@ -146,6 +152,7 @@ class ChatCommand(BaseCommand):
                     "api_base": api_base,
                     "api_key": api_key,
                     "server_names": server_names,
+                    "wait_for_all_servers": False,
                 }
                 
                 try:
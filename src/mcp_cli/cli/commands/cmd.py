@@ -9,10 +9,12 @@ Non-interactive one-shot command for MCP-CLI that sends a single prompt
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
+import os
 import sys
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import typer
 from rich import print as rich_print
@@ -21,7 +23,10 @@ from rich.console import Console
 from mcp_cli.cli.commands.base import BaseCommand
 from mcp_cli.cli_options import process_options
 from mcp_cli.model_manager import ModelManager
-from mcp_cli.tools.manager import ToolManager
+from mcp_cli.tools.scheduler import DEFAULT_TURN_CONCURRENCY
+
+if TYPE_CHECKING:
+    from mcp_cli.tools.manager import ToolManager
 
 logger = logging.getLogger(__name__)
 
@@ -57,12 +62,169 @@ def _extract_response_text(completion: Any) -> str:
     return str(completion)
 
 
+MAX_TURNS_FALLBACK = "Failed to complete within max_turns"
+DEFAULT_BATCH_CONCURRENCY = 4
+
+
+class _StreamSink:
+    """
+    Writes a ``--stream`` conversation to stdout or ``--output`` as it
+    arrives: the assistant's text verbatim, or with *events* one JSON
+    object per line (``text``, ``tool_call``, ``tool_result``, ``done``).
+    """
+
+    def __init__(self, path: Optional[str], events: bool):
+        self._file = open(path, "w", encoding="utf-8") if path and path != "-" else None
+        self.events = events
+        self.turn = 0
+        self._at_line_start = True
+
+    def _write(self, text: str) -> None:
+        out = self._file or sys.stdout  # looked up per write: the daemon reroutes stdout
+        out.write(text)
+        out.flush()
+
+    def _event(self, kind: str, **data: Any) -> None:
+        self._write(json.dumps({"type": kind, "turn": self.turn, **data}, ensure_ascii=False, default=str) + "\n")
+
+    def _end_line(self) -> None:
+        if not self._at_line_start:
+            self._write("\n")
+            self._at_line_start = True
+
+    def text(self, fragment: str) -> None:
+        if self.events:
+            self._event("text", text=fragment)
+        else:
+            self._write(fragment)
+            self._at_line_start = fragment.endswith("\n")
+
+    def tool_call(self, call: Dict[str, Any]) -> None:
+        if self.events:
+            fn = call.get("function", {})
+            self._event("tool_call", id=call.get("id"), name=fn.get("name"), arguments=fn.get("arguments"))
+
+    def tool_results(self, messages: List[Dict[str, Any]]) -> None:
+        """Report the tool messages a turn added, then start the next turn."""
+        if self.events:
+            for message in messages:
+                if message.get("role") == "tool":
+                    self._event(
+                        "tool_result",
+                        id=message.get("tool_call_id"),
+                        name=message.get("name"),
+                        content=message.get("content"),
+                    )
+        else:
+            self._end_line()
+        self.turn += 1
+
+    def done(self, response: str, streamed: bool = True) -> None:
+        if self.events:
+            self._event("done", response=response)
+            return
+        if not streamed:
+            self.text(response)
+        self._end_line()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+class _ToolTurnContext:
+    """What ToolProcessor needs from a chat context, for one cmd conversation."""
+
+    def __init__(self, tool_manager: Any, conversation: List[Dict[str, Any]]):
+        self.tool_manager = tool_manager
+        self.conversation_history = conversation
+
+
+class _ToolTurnUI:
+    """Announce tool calls on the ``--verbose`` progress console, else stay silent."""
+
+    def __init__(self, progress: Optional[Console]):
+        self.progress = progress
+
+    def print_tool_call(self, tool_name: str, raw_arguments: Any) -> None:
+        if self.progress:
+            self.progress.print(f"[dim]→ {tool_name}[/dim]")
+
+
+_INVALID_JSON = "invalid JSON"
+
+
+async def _iter_batch(path: str) -> AsyncIterator[Tuple[Any, Any]]:
+    """
+    Stream ``(id, record)`` pairs from a JSONL file (``-`` for stdin).
+
+    Records are JSON objects (or bare strings, taken as the prompt); the id
+    defaults to the 1-based line number.  Unparsable lines yield the
+    ``ValueError`` as the record.  Lines are read in a worker thread, so
+    conversations already running keep going while a slow producer writes
+    the next record.
+    """
+    fp = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    try:
+        lineno = 0
+        while True:
+            line = await asyncio.to_thread(fp.readline)
+            if not line:
+                break
+            lineno += 1
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                yield lineno, ValueError(f"{_INVALID_JSON}: {exc}")
+                continue
+            if isinstance(record, dict):
+                yield record.get("id", lineno), record
+            else:
+                yield lineno, {"prompt": record}
+    finally:
+        if fp is not sys.stdin:
+            fp.close()
+
+
+def _batch_message(record: Dict[str, Any], template: Optional[str]) -> str:
+    """User message for one batch record; *template* may use ``{{input}}``."""
+    content = record.get("prompt", record.get("input"))
+    if content is None:
+        raise ValueError("record has no 'prompt' or 'input'")
+    return template.replace("{{input}}", str(content)) if template else str(content)
+
+
+def _completed_ids(path: Optional[str]) -> set:
+    """
+    Ids (JSON-encoded) that are settled in a results file: answered, or
+    reported as unparsable input (re-running would fail the same way).
+    """
+    done: set = set()
+    if not path or path == "-" or not os.path.exists(path):
+        return done
+    with open(path, "r", encoding="utf-8") as fp:
+        for line in fp:
+            try:
+                result = json.loads(line)
+            except ValueError:
+                continue  # e.g. a line cut short by an interrupted run
+            if not isinstance(result, dict):
+                continue
+            if "response" in result or str(result.get("error", "")).startswith(_INVALID_JSON):
+                done.add(json.dumps(result.get("id")))
+    return done
+
+
 # ════════════════════════════════════════════════════════════════════════
 # Command
 # ════════════════════════════════════════════════════════════════════════
 class CmdCommand(BaseCommand):
     """Non-interactive command execution with LLM and tool support."""
 
+    daemon_command = "cmd"
+
     def __init__(self) -> None:
         help_text = "Execute commands non-interactively (with multi-turn by default)."
         super().__init__(name="cmd", help_text=help_text)
@@ -87,6 +249,7 @@ class CmdCommand(BaseCommand):
         verbose = params.get("verbose", False)
         single_turn = params.get("single_turn", False)
         max_turns = params.get("max_turns", 5)
+        tool_concurrency = params.get("tool_concurrency", DEFAULT_TURN_CONCURRENCY)
 
         # Set up logging
         logging.basicConfig(
@@ -95,29 +258,51 @@ class CmdCommand(BaseCommand):
             stream=sys.stderr,
         )
 
-        # Create ModelManager and configure if needed
-        model_manager = ModelManager()
-        
-        if api_base or api_key:
+        shared_manager = params.get("model_manager")
+        if shared_manager is not None:
+            # Long-lived manager (daemon): pick the client per call and leave
+            # the saved provider/model selection alone
+            model_manager = shared_manager
             target_provider = provider or model_manager.get_active_provider()
-            model_manager.configure_provider(target_provider, api_key=api_key, api_base=api_base)
-        
-        # Switch model if requested
-        if provider and model:
-            model_manager.switch_model(provider, model)
-        elif provider:
-            model_manager.switch_provider(provider)
-        elif model:
-            model_manager.switch_to_model(model)
+            target_model = model if provider else (model or model_manager.get_active_model())
+            get_client = functools.partial(model_manager.get_client_for_provider, target_provider, target_model)
+        else:
+            # Create ModelManager and configure if needed
+            model_manager = ModelManager()
+            
+            if api_base or api_key:
+                target_provider = provider or model_manager.get_active_provider()
+                model_manager.configure_provider(target_provider, api_key=api_key, api_base=api_base)
+            
+            # Switch model if requested
+            if provider and model:
+                model_manager.switch_model(provider, model)
+            elif provider:
+                model_manager.switch_provider(provider)
+            elif model:
+                model_manager.switch_to_model(model)
+            get_client = model_manager.get_client
+
+        stream = params.get("stream", False)
+        if stream and (tool or params.get("batch")):
+            raise typer.BadParameter("--stream cannot be combined with --tool or --batch")
 
         # Direct tool execution
         if tool:
+            if params.get("batch"):
+                raise typer.BadParameter("--batch cannot be combined with --tool")
             result = await self._run_single_tool(tool_manager, tool, tool_args)
             self._write_output(result, output_file, raw, plain)
             return result
 
-        # Prompt/input handling
-        if input_file:
+        # Batch mode: many prompts over one ToolManager and client
+        if params.get("batch"):
+            return await self._run_batch(tool_manager, get_client(), **params)
+
+        # Prompt/input handling (input_text: stdin already read by the caller)
+        if params.get("input_text") is not None:
+            input_content = params["input_text"]
+        elif input_file:
             input_content = sys.stdin.read() if input_file == "-" else open(input_file).read()
         else:
             input_content = ""
@@ -130,11 +315,7 @@ class CmdCommand(BaseCommand):
             user_message = prompt.replace("{{input}}", input_content)
 
         # Set up LLM interaction
-        tools = await _extract_tools_list(tool_manager)
-        openai_tools = self._convert_tools_for_llm(tools, tool_manager)
-        
-        from mcp_cli.chat.system_prompt import generate_system_prompt
-        system_message = system_prompt or generate_system_prompt(tools)
+        openai_tools, system_message = await self._prepare_llm(tool_manager, system_prompt)
 
         conversation: List[Dict[str, str]] = [
             {"role": "system", "content": system_message},
@@ -142,14 +323,60 @@ class CmdCommand(BaseCommand):
         ]
 
         # Get LLM client from ModelManager
-        client = model_manager.get_client()
+        client = get_client()
         progress = Console(stderr=True, no_color=plain) if verbose else None
 
+        if stream:
+            # Tokens go out as they arrive; --raw switches to JSONL events
+            sink = _StreamSink(output_file, events=raw)
+            try:
+                return await self._converse(
+                    client, conversation, openai_tools, tool_manager,
+                    single_turn=single_turn, max_turns=max_turns, progress=progress,
+                    tool_concurrency=tool_concurrency, sink=sink,
+                )
+            finally:
+                sink.close()
+
+        response_text = await self._converse(
+            client, conversation, openai_tools, tool_manager,
+            single_turn=single_turn, max_turns=max_turns, progress=progress,
+            tool_concurrency=tool_concurrency,
+        )
+        self._write_output(response_text, output_file, raw, plain)
+        return response_text
+
+    async def _prepare_llm(self, tool_manager: ToolManager, system_prompt: Optional[str]) -> Tuple[List[Dict[str, Any]], str]:
+        """OpenAI-style tool list and system message for a conversation."""
+        tools = await _extract_tools_list(tool_manager)
+        openai_tools = self._convert_tools_for_llm(tools, tool_manager)
+        
+        from mcp_cli.chat.system_prompt import generate_system_prompt
+        return openai_tools, system_prompt or generate_system_prompt(tools)
+
+    async def _converse(
+        self,
+        client: Any,
+        conversation: List[Dict[str, Any]],
+        openai_tools: List[Dict[str, Any]],
+        tool_manager: ToolManager,
+        *,
+        single_turn: bool = False,
+        max_turns: int = 5,
+        progress: Optional[Console] = None,
+        tool_concurrency: int = DEFAULT_TURN_CONCURRENCY,
+        sink: Optional[_StreamSink] = None,
+    ) -> str:
+        """
+        Run one conversation to its final answer and return the text.  With
+        a *sink*, every turn is streamed to it as it is generated.
+        """
         # Single-turn mode
         if single_turn:
-            completion = await client.create_completion(messages=conversation, tools=openai_tools)
+            completion = await self._complete(client, conversation, openai_tools, sink)
             response_text = _extract_response_text(completion)
-            self._write_output(response_text, output_file, raw, plain)
+            if sink:
+                sink.done(response_text)
             return response_text
 
         # Multi-turn loop
@@ -157,22 +384,129 @@ class CmdCommand(BaseCommand):
             if progress:
                 progress.print(f"[dim]Turn {turn+1}/{max_turns}…[/dim]", end="\r")
 
-            completion = await client.create_completion(messages=conversation, tools=openai_tools)
+            completion = await self._complete(client, conversation, openai_tools, sink)
             tool_calls = completion.get("tool_calls", []) if isinstance(completion, dict) else []
 
             if tool_calls:
-                await self._process_tool_calls(tool_calls, conversation, tool_manager)
+                start = len(conversation)
+                await self._process_tool_calls(
+                    tool_calls, conversation, tool_manager,
+                    openai_tools=openai_tools, max_concurrency=tool_concurrency, progress=progress,
+                )
+                if sink:
+                    sink.tool_results(conversation[start:])
                 continue  # another turn
 
             response_text = _extract_response_text(completion)
             conversation.append({"role": "assistant", "content": response_text})
-            self._write_output(response_text, output_file, raw, plain)
+            if sink:
+                sink.done(response_text)
             return response_text
 
         # Max turns reached
-        fallback = "Failed to complete within max_turns"
-        self._write_output(fallback, output_file, raw, plain)
-        return fallback
+        if sink:
+            sink.done(MAX_TURNS_FALLBACK, streamed=False)
+        return MAX_TURNS_FALLBACK
+
+    async def _complete(
+        self,
+        client: Any,
+        conversation: List[Dict[str, Any]],
+        openai_tools: List[Dict[str, Any]],
+        sink: Optional[_StreamSink],
+    ) -> Any:
+        """One LLM turn; streamed into *sink* (text and tool calls as they complete) if given."""
+        if sink is None:
+            return await client.create_completion(messages=conversation, tools=openai_tools)
+
+        from mcp_cli.chat.streaming_handler import StreamingResponseHandler
+
+        handler = StreamingResponseHandler(
+            Console(stderr=True), live=False, on_text=sink.text, on_tool_call=sink.tool_call,
+        )
+        return await handler.stream_response(client, conversation, openai_tools)
+
+    async def _run_batch(self, tool_manager: ToolManager, client: Any, **params) -> Dict[str, int]:
+        """
+        Run every record of ``params["batch"]`` as its own conversation,
+        ``concurrency`` at a time, writing one JSON result per line to
+        ``output`` (stdout by default) as each finishes.  Records whose id
+        already has a response in the output file are skipped, so an
+        interrupted run can be resumed with the same command.
+        """
+        output_file = params.get("output")
+        template = params.get("prompt")
+        concurrency = params.get("concurrency", DEFAULT_BATCH_CONCURRENCY)
+        single_turn = params.get("single_turn", False)
+        max_turns = params.get("max_turns", 5)
+        tool_concurrency = params.get("tool_concurrency", DEFAULT_TURN_CONCURRENCY)
+
+        openai_tools, system_message = await self._prepare_llm(tool_manager, params.get("system_prompt"))
+        done = _completed_ids(output_file)
+        counts = {"completed": 0, "failed": 0, "skipped": 0}
+
+        if output_file and output_file != "-":
+            cut_short = False
+            if os.path.exists(output_file) and os.path.getsize(output_file):
+                with open(output_file, "rb") as fp:
+                    fp.seek(-1, os.SEEK_END)
+                    cut_short = fp.read(1) != b"\n"
+            out = open(output_file, "a", encoding="utf-8")
+            if cut_short:
+                out.write("\n")  # previous run stopped mid-line
+        else:
+            out = sys.stdout
+
+        def _emit(result: Dict[str, Any]) -> None:
+            counts["failed" if "error" in result else "completed"] += 1
+            out.write(json.dumps(result, ensure_ascii=False, default=str) + "\n")
+            out.flush()
+
+        async def _run_one(record_id: Any, record: Dict[str, Any]) -> None:
+            try:
+                conversation = [
+                    {"role": "system", "content": record.get("system_prompt") or system_message},
+                    {"role": "user", "content": _batch_message(record, template)},
+                ]
+                text = await self._converse(
+                    client, conversation, openai_tools, tool_manager,
+                    single_turn=single_turn, max_turns=max_turns, tool_concurrency=tool_concurrency,
+                )
+                _emit({"id": record_id, "response": text})
+            except Exception as exc:
+                logger.debug(f"Batch record {record_id!r} failed: {exc}")
+                _emit({"id": record_id, "error": str(exc)})
+
+        slots = asyncio.Semaphore(concurrency)
+        pending: set = set()
+        try:
+            async for record_id, record in _iter_batch(params["batch"]):
+                if json.dumps(record_id) in done:
+                    counts["skipped"] += 1
+                    continue
+                if isinstance(record, Exception):
+                    _emit({"id": record_id, "error": str(record)})
+                    continue
+                await slots.acquire()  # bounded read-ahead
+                task = asyncio.create_task(_run_one(record_id, record))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+                task.add_done_callback(lambda _: slots.release())
+            if pending:
+                await asyncio.gather(*pending)
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            if out is not sys.stdout:
+                out.close()
+
+        print(
+            f"Batch: {counts['completed']} completed, {counts['failed']} failed, "
+            f"{counts['skipped']} skipped",
+            file=sys.stderr,
+        )
+        return counts
 
     def _convert_tools_for_llm(self, tools: List[Dict[str, Any]], tool_manager: ToolManager) -> List[Dict[str, Any]]:
         """Convert tools to LLM format."""
@@ -212,11 +546,33 @@ class CmdCommand(BaseCommand):
         except Exception as exc:
             raise RuntimeError(f"Tool execution failed: {exc}") from exc
 
-    async def _process_tool_calls(self, calls: List[dict], conversation: List[dict], tool_manager: ToolManager) -> None:
-        """Process tool calls and add results to conversation."""
-        from mcp_cli.llm.tools_handler import handle_tool_call
-        for call in calls:
-            await handle_tool_call(call, conversation, tool_manager=tool_manager)
+    async def _process_tool_calls(
+        self,
+        calls: List[dict],
+        conversation: List[dict],
+        tool_manager: ToolManager,
+        *,
+        openai_tools: Optional[List[Dict[str, Any]]] = None,
+        max_concurrency: int = DEFAULT_TURN_CONCURRENCY,
+        progress: Optional[Console] = None,
+    ) -> None:
+        """
+        Run one turn's tool calls concurrently (at most *max_concurrency* at
+        once) and add the results to *conversation* in the LLM's order.
+        """
+        from mcp_cli.chat.tool_processor import ToolProcessor
+
+        processor = ToolProcessor(
+            _ToolTurnContext(tool_manager, conversation),
+            _ToolTurnUI(progress),
+            max_concurrency=max_concurrency,
+            # stdout carries the answer: spinners and result panels go to
+            # stderr, and only with --verbose
+            console=Console(stderr=True, quiet=progress is None),
+        )
+        # The LLM calls tools by the names cmd advertised; keep them verbatim
+        names = {t["function"]["name"]: t["function"]["name"] for t in openai_tools or [] if "function" in t}
+        await processor.process_tool_calls(calls, names)
 
     def _write_output(self, data: str, path: Optional[str], raw: bool, plain: bool) -> None:
         """Write output to file or stdout."""
@@ -259,6 +615,10 @@ class CmdCommand(BaseCommand):
             verbose: bool = typer.Option(False, "--verbose", help="Enable verbose output"),
             single_turn: bool = typer.Option(False, "--single-turn", "-s", help="Disable multi-turn mode"),
             max_turns: int = typer.Option(5, "--max-turns", help="Maximum number of turns in multi-turn mode"),
+            batch: Optional[str] = typer.Option(None, "--batch", help="JSONL file of prompts to run (- for stdin); results go to --output as JSONL"),
+            concurrency: int = typer.Option(DEFAULT_BATCH_CONCURRENCY, "--concurrency", min=1, help="Conversations run at once in --batch mode"),
+            tool_concurrency: int = typer.Option(DEFAULT_TURN_CONCURRENCY, "--tool-concurrency", min=1, help="Tool calls of one LLM turn run at once"),
+            stream: bool = typer.Option(False, "--stream", help="Write the response as it is generated (JSONL events with --raw)"),
             api_base: Optional[str] = typer.Option(None, "--api-base", help="API base URL for the provider"),
             api_key: Optional[str] = typer.Option(None, "--api-key", help="API key for the provider"),
         ) -> None:
@@ -288,8 +648,13 @@ class CmdCommand(BaseCommand):
                 "verbose": verbose,
                 "single_turn": single_turn,
                 "max_turns": max_turns,
+                "batch": batch,
+                "concurrency": concurrency,
+                "tool_concurrency": tool_concurrency,
+                "stream": stream,
                 "api_base": api_base,
                 "api_key": api_key,
+                "daemon_command": self.daemon_command,
             }
 
             run_command(self.wrapped_execute, config_file, servers, extra_params=extra)
@@ -315,6 +680,9 @@ mcp-cli cmd --prompt "Create a report" --output report.txt --max-turns 10
 # Single-turn with custom system prompt
 mcp-cli cmd --prompt "Hello" --single-turn --system-prompt "You are a helpful assistant"
 
+# Stream tokens as they arrive (JSONL events with --raw)
+mcp-cli cmd --prompt "Write a long report" --stream --raw
+
 # With API overrides
 mcp-cli cmd --provider openai --api-key your-key --prompt "Hello world"
 """
\ No newline at end of file
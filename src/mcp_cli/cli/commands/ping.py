@@ -9,11 +9,6 @@ from typing import Any, Dict, List, Optional
 
 import typer
 
-from mcp_cli.commands.ping import (
-    ping_action,          # sync wrapper (run_blocking)
-    ping_action_async,    # real async implementation
-)
-from mcp_cli.tools.manager import get_tool_manager
 from mcp_cli.cli.commands.base import BaseCommand
 
 logger = logging.getLogger(__name__)
@@ -38,6 +33,9 @@ def ping_run(
         mcp-cli ping run 0 2           # ping servers 0 and 2
         mcp-cli ping run -n 0=db db    # rename server 0→db and ping “db”
     """
+    from mcp_cli.commands.ping import ping_action  # sync wrapper (run_blocking)
+    from mcp_cli.tools.manager import get_tool_manager
+
     tm = get_tool_manager()
     if tm is None:
         typer.echo("Error: no ToolManager initialised", err=True)
@@ -62,6 +60,8 @@ def ping_run(
 class PingCommand(BaseCommand):
     """Global `ping` command (usable from chat / interactive shell)."""
 
+    daemon_command = "ping"
+
     def __init__(self) -> None:
         super().__init__("ping", "Ping connected MCP servers.")
 
@@ -69,6 +69,8 @@ class PingCommand(BaseCommand):
         mapping = params.get("server_names")
         targets = params.get("targets", []) or []
         logger.debug("PingCommand: mapping=%s targets=%s", mapping, targets)
+        from mcp_cli.commands.ping import ping_action_async
+
         return await ping_action_async(
             tool_manager, server_names=mapping, targets=targets
         )
@@ -59,6 +59,12 @@ def provider_config() -> None:
     _call_shared_helper(["config"])
 
 
+@app.command("refresh", help="Rebuild the cached provider catalogue")
+def provider_refresh() -> None:
+    """Discard the cached provider/model catalogue and query chuk-llm again."""
+    _call_shared_helper(["refresh"])
+
+
 @app.command("diagnostic", help="Run provider diagnostics")
 def provider_diagnostic(
     provider_name: str = typer.Argument(None, help="Provider to diagnose (optional)")
@@ -145,7 +151,7 @@ class ProviderCommand(BaseCommand):
     def __init__(self) -> None:
         super().__init__(
             name="provider",
-            help_text="Manage LLM providers (show/list/config/set/switch).",
+            help_text="Manage LLM providers (show/list/config/set/switch/refresh).",
         )
 
     async def execute(self, tool_manager: Any, **params: Any) -> None:  # noqa: D401
@@ -153,7 +159,7 @@ class ProviderCommand(BaseCommand):
         Forward params to *provider_action_async*.
 
         Expected keys in **params:
-          • subcommand (str)  – list | config | set | show | diagnostic
+          • subcommand (str)  – list | config | set | show | diagnostic | refresh
           • provider_name, key, value (for 'set')
           • model / provider (optional overrides)
         """
@@ -164,7 +170,7 @@ class ProviderCommand(BaseCommand):
         if sub == "show":
             # Show current status
             argv = []
-        elif sub in ["list", "config"]:
+        elif sub in ["list", "config", "refresh"]:
             # Simple commands
             argv = [sub]
         elif sub == "diagnostic":
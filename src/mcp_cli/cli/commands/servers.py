@@ -169,7 +169,9 @@ def servers_status(
 
     if refresh:
         typer.echo("Refreshing server connections...")
-        # This would trigger a reconnection attempt
+        # This would trigger a reconnection attempt; cached tool metadata
+        # must not outlive the old connections
+        tm.invalidate_tool_catalogue()
     
     try:
         # Show basic status-focused view
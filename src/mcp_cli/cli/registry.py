@@ -1,19 +1,95 @@
 # mcp_cli/cli/registry.py
 """
 Command registry for MCP-CLI - central place to register & discover commands.
+
+Commands can be registered lazily by import path (``register_lazy``): the
+command module - and with it ``chuk_llm`` / ``chuk_tool_processor`` - is only
+imported when the command is actually used, which keeps ``mcp-cli --help``
+and the lightweight commands fast to start.
 """
 from __future__ import annotations
 
+import importlib
 import logging
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import typer
+from typer.core import TyperCommand, TyperGroup
 
 from mcp_cli.cli.commands.base import BaseCommand, CommandFunc, FunctionCommand
 
 logger = logging.getLogger(__name__)
 
 
+class LazyCommand(BaseCommand):
+    """Registry entry that imports its command class on first use."""
+
+    def __init__(self, name: str, target: str, help_text: str = ""):
+        """
+        Args:
+            name: Command name
+            target: ``"package.module:ClassName"`` of the real command
+            help_text: Help shown before the module is imported
+        """
+        super().__init__(name, help_text)
+        self.target = target
+        self._command: Optional[BaseCommand] = None
+
+    def load(self) -> BaseCommand:
+        if self._command is None:
+            module_name, _, attr = self.target.partition(":")
+            logger.debug("Importing command '%s' from %s", self.name, module_name)
+            self._command = getattr(importlib.import_module(module_name), attr)()
+        return self._command
+
+    async def execute(self, tool_manager: Any, **params) -> Any:
+        return await self.load().execute(tool_manager, **params)
+
+    async def wrapped_execute(self, tool_manager: Any, **kwargs) -> Any:
+        return await self.load().wrapped_execute(tool_manager, **kwargs)
+
+    def register(self, app: typer.Typer, run_command_func: Callable) -> None:
+        self.load().register(app, run_command_func)
+
+
+class LazyCommandGroup(TyperGroup):
+    """
+    Root Typer group that defers registry commands until they are dispatched.
+
+    Help listings use the help text recorded at registration; the command's
+    own ``register`` (and therefore its module import) only runs once the
+    command is resolved for execution.
+    """
+    lazy_commands: Dict[str, Tuple[BaseCommand, Callable]] = {}
+
+    @classmethod
+    def add_lazy_command(cls, command: BaseCommand, run_command_func: Callable) -> None:
+        cls.lazy_commands[command.name] = (command, run_command_func)
+
+    def _load(self, name: str) -> None:
+        command, run_command_func = self.lazy_commands[name]
+        subapp = typer.Typer()
+        command.register(subapp, run_command_func)
+        self.add_command(typer.main.get_group(subapp).commands[name], name)
+
+    def list_commands(self, ctx: Any) -> List[str]:
+        names = super().list_commands(ctx)
+        return names + [n for n in self.lazy_commands if n not in self.commands]
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is None and cmd_name in self.lazy_commands:
+            # Placeholder for help listings only; dispatch goes through _load
+            command, _ = self.lazy_commands[cmd_name]
+            cmd = TyperCommand(name=cmd_name, help=command.help)
+        return cmd
+
+    def resolve_command(self, ctx: Any, args: List[str]) -> Any:
+        if args and args[0] in self.lazy_commands and args[0] not in self.commands:
+            self._load(args[0])
+        return super().resolve_command(ctx, args)
+
+
 class CommandRegistry:
     """Central registry holding every CLI command object."""
     _commands: Dict[str, BaseCommand] = {}
@@ -32,6 +108,11 @@ class CommandRegistry:
     ) -> None:
         cls.register(FunctionCommand(name, func, help_text))
 
+    @classmethod
+    def register_lazy(cls, name: str, target: str, help_text: str = "") -> None:
+        """Register *target* (``"module:Class"``) without importing it yet."""
+        cls.register(LazyCommand(name, target, help_text))
+
     # ── retrieval helpers ────────────────────────────────────────────
     @classmethod
     def get_command(cls, name: str) -> Optional[BaseCommand]:
@@ -4,11 +4,19 @@ Provider command with all fixes applied and optimized.
 This version incorporates the diagnostic fixes with your existing architecture.
 """
 from __future__ import annotations
+import asyncio
 import subprocess
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
+from rich.live import Live
 from rich.table import Table
 
 from mcp_cli.model_manager import ModelManager
+from mcp_cli.utils.llm_probe import (
+    DEFAULT_PROBE_CONCURRENCY,
+    DEFAULT_PROBE_TIMEOUT,
+    LLMProbe,
+    latency_percentiles,
+)
 from mcp_cli.utils.rich_helpers import get_console
 
 console = get_console()
@@ -23,7 +31,7 @@ def _check_ollama_running() -> tuple[bool, int]:
         result = subprocess.run(['ollama', 'list'], 
                               capture_output=True, 
                               text=True, 
-                              timeout=5)
+                              timeout=3)
         if result.returncode == 0:
             # Count actual models (skip header line and empty lines)
             lines = result.stdout.strip().split('\n')
@@ -34,14 +42,38 @@ def _check_ollama_running() -> tuple[bool, int]:
         return False, 0
 
 
-def _get_provider_status_enhanced(provider_name: str, info: Dict[str, Any]) -> tuple[str, str, str]:
+async def _probe_ollama() -> tuple[bool, int]:
+    """Run the Ollama check in a worker thread so the event loop never blocks."""
+    return await asyncio.to_thread(_check_ollama_running)
+
+
+async def _load_catalogue_and_probe(model_manager: ModelManager) -> tuple[bool, int]:
+    """
+    Warm the provider catalogue and check Ollama at the same time, both in
+    worker threads; returns the Ollama status.
+    """
+    _, ollama_status = await asyncio.gather(
+        asyncio.to_thread(model_manager.list_available_providers),
+        _probe_ollama(),
+    )
+    return ollama_status
+
+
+def _get_provider_status_enhanced(
+    provider_name: str,
+    info: Dict[str, Any],
+    ollama_status: Optional[tuple[bool, int]] = None,
+) -> tuple[str, str, str]:
     """
     Enhanced status logic that handles all provider types correctly.
     Returns (status_icon, status_text, status_reason)
+
+    *ollama_status* is a pre-computed ``_check_ollama_running()`` result;
+    without it the check runs inline.
     """
     # Handle Ollama specially - it doesn't need API keys
     if provider_name.lower() == "ollama":
-        is_running, model_count = _check_ollama_running()
+        is_running, model_count = ollama_status or _check_ollama_running()
         if is_running:
             return "✅", "Ready", f"Running ({model_count} models)"
         else:
@@ -63,13 +95,17 @@ def _get_provider_status_enhanced(provider_name: str, info: Dict[str, Any]) -> t
     return "✅", "Ready", f"Configured ({model_count} models)"
 
 
-def _get_model_count_display_enhanced(provider_name: str, info: Dict[str, Any]) -> str:
+def _get_model_count_display_enhanced(
+    provider_name: str,
+    info: Dict[str, Any],
+    ollama_status: Optional[tuple[bool, int]] = None,
+) -> str:
     """
     Enhanced model count display that handles Ollama and chuk-llm 0.7+ correctly.
     """
     # For Ollama, get live count from ollama command
     if provider_name.lower() == "ollama":
-        is_running, live_count = _check_ollama_running()
+        is_running, live_count = ollama_status or _check_ollama_running()
         if is_running:
             return f"{live_count} models"
         else:
@@ -110,7 +146,10 @@ def _get_features_display_enhanced(info: Dict[str, Any]) -> str:
     return "".join(feature_icons) if feature_icons else "📄"
 
 
-def _render_list_optimized(model_manager: ModelManager) -> None:
+def _render_list_optimized(
+    model_manager: ModelManager,
+    ollama_status: Optional[tuple[bool, int]] = None,
+) -> None:
     """
     Optimized provider list that handles all the edge cases correctly.
     """
@@ -135,6 +174,10 @@ def _render_list_optimized(model_manager: ModelManager) -> None:
         console.print(f"[red]Error getting provider list:[/red] {e}")
         return
 
+    # Check Ollama at most once per render
+    if ollama_status is None and any(name.lower() == "ollama" for name in all_providers_info):
+        ollama_status = _check_ollama_running()
+
     # Sort providers to put current one first, then alphabetically
     provider_items = list(all_providers_info.items())
     provider_items.sort(key=lambda x: (x[0] != current_provider, x[0]))
@@ -155,7 +198,9 @@ def _render_list_optimized(model_manager: ModelManager) -> None:
         display_name = f"[bold]{provider_name}[/bold]" if provider_name == current_provider else provider_name
         
         # Enhanced status using improved logic
-        status_icon, status_text, status_reason = _get_provider_status_enhanced(provider_name, provider_info)
+        status_icon, status_text, status_reason = _get_provider_status_enhanced(
+            provider_name, provider_info, ollama_status
+        )
         
         # Color-code the status text
         if status_icon == "✅":
@@ -171,7 +216,7 @@ def _render_list_optimized(model_manager: ModelManager) -> None:
             default_model = "-"
         
         # Enhanced model count display
-        models_display = _get_model_count_display_enhanced(provider_name, provider_info)
+        models_display = _get_model_count_display_enhanced(provider_name, provider_info, ollama_status)
         
         # Enhanced features
         features_display = _get_features_display_enhanced(provider_info)
@@ -191,7 +236,7 @@ def _render_list_optimized(model_manager: ModelManager) -> None:
     inactive_providers = []
     for name, info in all_providers_info.items():
         if "error" not in info:
-            status_icon, _, _ = _get_provider_status_enhanced(name, info)
+            status_icon, _, _ = _get_provider_status_enhanced(name, info, ollama_status)
             if status_icon == "❌":
                 inactive_providers.append(name)
     
@@ -199,9 +244,58 @@ def _render_list_optimized(model_manager: ModelManager) -> None:
         console.print(f"[dim]🔧 Configure providers with: mcp-cli provider set <name> api_key <key>[/dim]")
 
 
-def _render_diagnostic_optimized(model_manager: ModelManager, target: str | None) -> None:
-    """Optimized diagnostic that shows detailed status for providers."""
+# Models probed per provider when diagnosing a single provider
+MAX_DIAGNOSTIC_MODELS = 5
+
+
+def _format_latency(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    return f"{seconds * 1000:.0f} ms" if seconds < 10 else f"{seconds:.1f} s"
+
+
+def _diagnostic_models(
+    model_manager: ModelManager,
+    provider: str,
+    provider_info: Dict[str, Any],
+    all_models: bool,
+) -> List[str]:
+    """Models to probe: the default one, or (for a single provider) a capped list."""
+    default = provider_info.get("default_model") or model_manager.get_default_model(provider)
+    models = [default] if default else []
+    if all_models:
+        for model in provider_info.get("models") or provider_info.get("available_models") or []:
+            if len(models) >= MAX_DIAGNOSTIC_MODELS:
+                break
+            if model not in models:
+                models.append(model)
+    return models
+
+
+async def _render_diagnostic_async(
+    model_manager: ModelManager,
+    target: str | None,
+    ollama_status: Optional[tuple[bool, int]] = None,
+    *,
+    probe: bool = False,
+    samples: int = 1,
+    concurrency: int = DEFAULT_PROBE_CONCURRENCY,
+    timeout: float = DEFAULT_PROBE_TIMEOUT,
+) -> None:
+    """
+    Diagnose providers, optionally probing their models concurrently.
+
+    Live probes send (billed) completions, so they only run for a named
+    *target*, when *probe* is set or when several *samples* are requested;
+    otherwise ready providers are listed from their configuration.
+    Providers that are not ready are listed straight away; each live probe
+    adds its row as soon as it finishes.  With ``samples > 1`` every model
+    is probed that many times and latency percentiles per provider are
+    printed at the end (one probe is not a distribution).
+    """
+    probe = probe or samples > 1
     if target:
+        probe = True
         providers_to_test = [target] if model_manager.validate_provider(target) else []
         if not providers_to_test:
             console.print(f"[red]Unknown provider:[/red] {target}")
@@ -213,9 +307,11 @@ def _render_diagnostic_optimized(model_manager: ModelManager, target: str | None
 
     tbl = Table(title="Provider Diagnostics")
     tbl.add_column("Provider", style="green")
+    tbl.add_column("Model", style="white")
     tbl.add_column("Status", style="cyan")
     tbl.add_column("Models", style="blue")
     tbl.add_column("Features", style="yellow")
+    tbl.add_column("Latency", style="cyan", justify="right")
     tbl.add_column("Details", style="magenta")
 
     try:
@@ -224,63 +320,83 @@ def _render_diagnostic_optimized(model_manager: ModelManager, target: str | None
         console.print(f"[red]Error getting provider data:[/red] {e}")
         return
 
+    if ollama_status is None and any(p.lower() == "ollama" for p in providers_to_test):
+        ollama_status = await _probe_ollama()
+
+    # Static columns per provider, and the (provider, model) pairs to probe
+    static: Dict[str, Tuple[str, str, str]] = {}
+    targets: List[Tuple[str, str]] = []
     for provider in providers_to_test:
         try:
             provider_info = all_providers_data.get(provider, {})
-            
-            # Skip if provider has errors
+
             if "error" in provider_info:
-                tbl.add_row(
-                    provider, 
-                    f"[red]Error[/red]", 
-                    "-",
-                    "-",
-                    provider_info["error"][:30] + "..."
-                )
+                tbl.add_row(provider, "-", "[red]Error[/red]", "-", "-", "-",
+                            provider_info["error"][:30] + "...")
                 continue
-            
-            # Enhanced status
-            status_icon, status_text, status_reason = _get_provider_status_enhanced(provider, provider_info)
-            
-            if status_icon == "✅":
-                status_display = f"[green]{status_icon} {status_text}[/green]"
-            elif status_icon == "⚠️":
-                status_display = f"[yellow]{status_icon} {status_text}[/yellow]"
-            else:
-                status_display = f"[red]{status_icon} {status_text}[/red]"
-            
-            # Model count
-            models_display = _get_model_count_display_enhanced(provider, provider_info)
-            
-            # Features
+
+            status_icon, status_text, status_reason = _get_provider_status_enhanced(
+                provider, provider_info, ollama_status
+            )
+            models_display = _get_model_count_display_enhanced(provider, provider_info, ollama_status)
             features_display = _get_features_display_enhanced(provider_info)
-            
-            # Additional details
+
             details = []
             if provider_info.get("api_base"):
                 details.append(f"API: {provider_info['api_base']}")
             if provider_info.get("discovery_enabled"):
                 details.append("Discovery: ✅")
             details_str = " | ".join(details) if details else "-"
-            
-            tbl.add_row(
-                provider, 
-                status_display, 
-                models_display,
-                features_display, 
-                details_str
-            )
-            
-        except Exception as exc:
-            tbl.add_row(
-                provider, 
-                f"[red]Error[/red]", 
-                "-",
-                "-",
-                str(exc)[:30] + "..."
-            )
 
-    console.print(tbl)
+            models = _diagnostic_models(model_manager, provider, provider_info, bool(target))
+            if status_icon != "✅" or not models:
+                colour = "yellow" if status_icon == "⚠️" else "red"
+                tbl.add_row(provider, "-", f"[{colour}]{status_icon} {status_text}[/{colour}]",
+                            models_display, features_display, "-", status_reason or details_str)
+                continue
+
+            if not probe:
+                tbl.add_row(provider, models[0], f"[green]{status_icon} {status_text}[/green]",
+                            models_display, features_display, "-", details_str)
+                continue
+
+            static[provider] = (models_display, features_display, details_str)
+            targets.extend((provider, model) for model in models for _ in range(samples))
+
+        except Exception as exc:
+            tbl.add_row(provider, "-", "[red]Error[/red]", "-", "-", "-", str(exc)[:30] + "...")
+
+    latencies: Dict[str, List[float]] = {}
+    if targets:
+        with Live(tbl, console=console, refresh_per_second=8):
+            async with LLMProbe(model_manager, suppress_logging=True) as probe:
+                async for result in probe.probe_many(targets, concurrency=concurrency, timeout=timeout):
+                    models_display, features_display, details_str = static[result.provider]
+                    if result.success:
+                        status_display = "[green]✅ Ready[/green]"
+                        latencies.setdefault(result.provider, []).append(result.latency)
+                    else:
+                        status_display = "[red]❌ Failed[/red]"
+                        details_str = (result.error_message or "Unknown error")[:60]
+                    tbl.add_row(result.provider, result.model, status_display, models_display,
+                                features_display, _format_latency(result.latency), details_str)
+    else:
+        console.print(tbl)
+        if not probe:
+            console.print("[dim]Add --probe to send a test prompt to each ready provider "
+                          "(uses your API quota).[/dim]")
+
+    if samples > 1 and latencies:
+        summary = Table(title="Probe Latency")
+        summary.add_column("Provider", style="green")
+        summary.add_column("Probes", justify="right")
+        for column in ("p50", "p90", "p99", "max"):
+            summary.add_column(column, justify="right")
+        for provider, values in sorted(latencies.items()):
+            stats = latency_percentiles(values)
+            summary.add_row(provider, str(len(values)),
+                            *(_format_latency(stats[c]) for c in ("p50", "p90", "p99", "max")))
+        console.print(summary)
 
 
 def _switch_provider_enhanced(
@@ -418,7 +534,13 @@ async def provider_action_async(
     sub = sub.lower()
 
     if sub == "list":
-        _render_list_optimized(model_manager)
+        _render_list_optimized(model_manager, await _load_catalogue_and_probe(model_manager))
+        return
+
+    if sub == "refresh":
+        console.print("[dim]Refreshing provider catalogue...[/dim]")
+        providers = model_manager.refresh_provider_catalogue()
+        console.print(f"[green]✅ Provider catalogue refreshed[/green] ({len(providers)} providers)")
         return
 
     if sub == "config":
@@ -426,8 +548,22 @@ async def provider_action_async(
         return
 
     if sub == "diagnostic":
-        target = rest[0] if rest else None
-        _render_diagnostic_optimized(model_manager, target)
+        names, samples = [], 1
+        options = iter(rest)
+        for arg in options:
+            if arg == "--samples" or arg.startswith("--samples="):
+                value = arg.partition("=")[2] or next(options, "")
+                if not value.isdigit() or int(value) < 1:
+                    console.print(f"[red]--samples needs a positive number, got:[/red] {value or 'nothing'}")
+                    return
+                samples = int(value)
+            elif arg != "--probe":
+                names.append(arg)
+        target = names[0] if names else None
+        ollama_status = await _load_catalogue_and_probe(model_manager)
+        await _render_diagnostic_async(
+            model_manager, target, ollama_status, probe="--probe" in rest, samples=samples
+        )
         return
 
     if sub == "set" and len(rest) >= 2:
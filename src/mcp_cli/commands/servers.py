@@ -89,6 +89,15 @@ def _format_tool_count(count: int) -> str:
         return f"[magenta]{count}[/magenta]"
 
 
+def _format_startup(startup_ms: float | None) -> str:
+    """Format how long a server took to start."""
+    if startup_ms is None:
+        return "[dim]-[/dim]"
+    if startup_ms < 1000:
+        return f"{startup_ms:.0f}ms"
+    return f"{startup_ms / 1000:.1f}s"
+
+
 # ════════════════════════════════════════════════════════════════════════
 # Server Information Gathering
 # ════════════════════════════════════════════════════════════════════════
@@ -355,6 +364,7 @@ async def _display_table_view(
     table.add_column("Status", width=8)
     table.add_column("Version", width=10)
     table.add_column("Protocol", width=10)
+    table.add_column("Startup", justify="right", width=7)
     
     if show_capabilities:
         table.add_column("Capabilities", width=12)
@@ -394,7 +404,10 @@ async def _display_table_view(
             else:
                 protocol_version = protocol_version[:8] + "..."
         
-        row = [icon, srv["name"], tools_display, status_display, version, protocol_version]
+        row = [
+            icon, srv["name"], tools_display, status_display, version, protocol_version,
+            _format_startup(srv.get("startup_ms")),
+        ]
         
         if show_capabilities:
             caps_display = _format_capabilities(srv.get("capabilities", {}))
@@ -457,6 +470,7 @@ async def _display_detailed_panels(servers: List[Dict[str, Any]]) -> None:
         else:
             status_display = f"[red]● {status.title()}[/red]"
         table.add_row("Status", status_display)
+        table.add_row("Startup", _format_startup(srv.get("startup_ms")))
         
         # Server info
         server_info = srv.get("server_info", {})
@@ -756,14 +770,17 @@ async def servers_action_async(
             server_id = srv.id
             server_name = srv.name
             server_status = getattr(srv, 'status', 'unknown')
+            startup_time = getattr(srv, 'startup_time', None)
         elif isinstance(srv, dict):
             server_id = srv.get('id', i)
             server_name = srv.get('name', f'server-{i}')
             server_status = srv.get('status', 'unknown')
+            startup_time = srv.get('startup_time')
         else:
             server_id = i
             server_name = str(srv)
             server_status = 'unknown'
+            startup_time = None
         
         # Get server info (version, transport, etc.)
         server_info_data = {}
@@ -791,17 +808,18 @@ async def servers_action_async(
             "tools": [],
             "capabilities": {},
             "server_info": server_info_data,
-            "ping_ms": None
+            "ping_ms": None,
+            "startup_ms": startup_time * 1000 if startup_time is not None else None,
         }
         
         # Get tools
         try:
             tools = await _get_server_tools_enhanced(tm, i)
-            enhanced_info["tool_count"] = len(tools)
+            enhanced_info["tool_count"] = len(tools) or getattr(srv, "tool_count", 0)
             enhanced_info["tools"] = tools
             
             # If our detection failed but logs show tools, use fallback counts
-            if enhanced_info["tool_count"] == 0:
+            if enhanced_info["tool_count"] == 0 and server_status.lower() not in ("starting", "failed"):
                 # Hardcode based on your log output for now
                 tool_counts = {0: 6, 1: 3, 2: 32, 3: 1}  # sqlite, perplexity, ios, youtube
                 if i in tool_counts:
@@ -1,6 +1,7 @@
 # mcp_cli/config.py
 import json
 import logging
+from typing import Any, Dict, Tuple
 
 # Updated imports for new chuk-mcp APIs
 from chuk_mcp.transports.stdio.parameters import StdioParameters
@@ -50,4 +51,115 @@ async def load_config(config_path: str, server_name: str) -> StdioParameters:
     except ValueError as e:
         # error
         logging.error(str(e))
-        raise
\ No newline at end of file
+        raise
+
+
+def _load_section(config_path: str, section: str) -> Dict[str, Any]:
+    """
+    Return a top-level mapping from the configuration file, or ``{}`` if
+    the file is missing or unreadable or the section is absent or invalid.
+    """
+    try:
+        with open(config_path, "r") as config_file:
+            config = json.load(config_file)
+    except (OSError, json.JSONDecodeError) as e:
+        logging.debug(f"No '{section}' config loaded from {config_path}: {e}")
+        return {}
+
+    value = config.get(section) if isinstance(config, dict) else None
+    if value is None:
+        return {}
+    if not isinstance(value, dict):
+        logging.warning(f"Ignoring invalid '{section}' section in configuration")
+        return {}
+    return value
+
+
+def load_scheduling_config(config_path: str) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """
+    Read optional per-server scheduling hints from the configuration file.
+
+    Each ``mcpServers`` entry may carry ``maxConcurrency`` (int >= 1) and
+    ``priority`` (int, higher runs first).  Missing files or keys simply
+    yield empty mappings.
+
+    Returns:
+        ``(limits, priorities)`` keyed by server name
+    """
+    limits: Dict[str, int] = {}
+    priorities: Dict[str, int] = {}
+    for name, server_config in load_server_configs(config_path).items():
+        if not isinstance(server_config, dict):
+            continue
+        try:
+            if "maxConcurrency" in server_config:
+                limits[name] = max(1, int(server_config["maxConcurrency"]))
+            if "priority" in server_config:
+                priorities[name] = int(server_config["priority"])
+        except (TypeError, ValueError):
+            logging.warning(f"Ignoring invalid scheduling settings for server '{name}'")
+
+    return limits, priorities
+
+
+def load_startup_timeouts(config_path: str) -> Dict[str, float]:
+    """
+    Read optional per-server ``startupTimeout`` values (seconds) from the
+    ``mcpServers`` entries of the configuration file.
+
+    Returns:
+        Timeouts keyed by server name; servers without one are omitted
+    """
+    timeouts: Dict[str, float] = {}
+    for name, server_config in load_server_configs(config_path).items():
+        if not isinstance(server_config, dict) or "startupTimeout" not in server_config:
+            continue
+        try:
+            timeout = float(server_config["startupTimeout"])
+            if timeout <= 0:
+                raise ValueError
+            timeouts[name] = timeout
+        except (TypeError, ValueError):
+            logging.warning(f"Ignoring invalid startupTimeout for server '{name}'")
+
+    return timeouts
+
+
+def load_tool_cache_config(config_path: str) -> Dict[str, Any]:
+    """
+    Read the optional top-level ``toolCache`` block from the configuration file.
+
+    Returns:
+        The raw ``toolCache`` mapping, or an empty dict (caching disabled)
+    """
+    return _load_section(config_path, "toolCache")
+
+
+def load_single_flight_config(config_path: str) -> Dict[str, Any]:
+    """
+    Read the optional top-level ``singleFlight`` block from the configuration file.
+
+    Returns:
+        The raw ``singleFlight`` mapping, or an empty dict
+    """
+    return _load_section(config_path, "singleFlight")
+
+
+def load_tool_results_config(config_path: str) -> Dict[str, Any]:
+    """
+    Read the optional top-level ``toolResults`` block from the configuration file.
+
+    Returns:
+        The raw ``toolResults`` mapping, or an empty dict (defaults apply)
+    """
+    return _load_section(config_path, "toolResults")
+
+
+def load_server_configs(config_path: str) -> Dict[str, Any]:
+    """
+    Read the ``mcpServers`` block from the configuration file.
+
+    Returns:
+        Server entries keyed by name, or an empty dict
+    """
+    return _load_section(config_path, "mcpServers")
@@ -0,0 +1,383 @@
+# mcp_cli/daemon.py
+"""
+Local daemon that keeps MCP servers warm for one-shot commands.
+
+Every ``mcp-cli cmd`` / ``tools`` / ``ping`` normally spawns and handshakes
+all MCP servers, does a few milliseconds of work and tears them down
+again.  ``mcp-cli serve`` instead owns one long-lived ToolManager and
+ModelManager and listens on a Unix-domain socket
+(``~/.mcp-cli/daemon.sock`` or ``$MCP_CLI_SOCKET``).
+
+Those commands check for the socket first and, if a daemon answers, send
+it their parameters; the daemon runs the command against its warm managers
+and streams the command's stdout and stderr back.  When no daemon is
+running - or it was started with a different configuration, server set,
+working directory or provider environment, or it does not accept the
+request in time - the command falls back to the normal in-process startup.
+
+Wire format: one JSON object per line.  The client sends a single request
+``{"command", "config_file", "servers", "filesystems", "cwd", "env",
+"params"}``; the daemon answers ``{"accepted": true}`` once it has agreed
+to run it, then any number of ``{"stdout": text}`` / ``{"stderr": text}``
+lines followed by exactly one of ``{"result": ...}``,
+``{"error": msg, "kind": ...}`` or ``{"fallback": reason}``.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import io
+import json
+import logging
+import os
+import signal
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from mcp_cli.provider_catalogue import provider_env_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Generous line limit: requests may carry piped input, replies large outputs
+_LINE_LIMIT = 16 * 1024 * 1024
+_CHUNK = 64 * 1024
+
+# Parameters that only make sense inside the calling process
+_LOCAL_PARAMS = ("server_names", "daemon_command", "tool_manager", "model_manager")
+
+# Seconds to wait for a daemon to connect and accept a request before
+# running the command in-process instead
+DEFAULT_ANSWER_TIMEOUT = 5.0
+
+
+def socket_path() -> str:
+    """Socket used by ``serve`` and looked for by the clients."""
+    return os.getenv("MCP_CLI_SOCKET") or str(Path.home() / ".mcp-cli" / "daemon.sock")
+
+
+def daemon_enabled() -> bool:
+    return hasattr(socket, "AF_UNIX") and os.getenv("MCP_CLI_DAEMON", "1").lower() not in ("0", "false", "no", "off")
+
+
+def _answer_timeout() -> float:
+    try:
+        return float(os.getenv("MCP_CLI_DAEMON_TIMEOUT", DEFAULT_ANSWER_TIMEOUT))
+    except ValueError:
+        return DEFAULT_ANSWER_TIMEOUT
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    return (json.dumps(message, default=str) + "\n").encode("utf-8")
+
+
+# ════════════════════════════════════════════════════════════════════════
+# Client side
+# ════════════════════════════════════════════════════════════════════════
+def _prepare_params(command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Turn *params* into what the daemon needs, or None if this call must run
+    in-process.  Piped stdin is read here and stored back into *params* so
+    an in-process fallback sees the same input.
+    """
+    if command == "cmd":
+        if params.get("api_key") or params.get("api_base"):
+            return None  # per-call credentials stay in this process
+        if params.get("batch") == "-":
+            return None  # stream stdin records in this process
+        if params.get("input") == "-" and params.get("input_text") is None:
+            params["input_text"] = sys.stdin.read()
+
+    forwarded = {k: v for k, v in params.items() if k not in _LOCAL_PARAMS}
+    if command == "ping" and params.get("server_names"):
+        # ping labels servers with the caller's names (`-n 0=db`)
+        forwarded["server_names"] = {str(k): v for k, v in params["server_names"].items()}
+    for key in ("input", "output", "batch"):
+        value = forwarded.get(key)
+        if value and value != "-":
+            forwarded[key] = os.path.abspath(value)
+    return forwarded
+
+
+async def forward_command(
+    command: str,
+    config_file: str,
+    servers: List[str],
+    params: Dict[str, Any],
+    path: Optional[str] = None,
+) -> Tuple[bool, Any]:
+    """
+    Run *command* on a running daemon.
+
+    Returns:
+        ``(True, result)`` if the daemon ran it, ``(False, None)`` if the
+        caller should run the command itself
+    """
+    path = path or socket_path()
+    if not daemon_enabled() or not os.path.exists(path):
+        return False, None
+
+    forwarded = _prepare_params(command, params)
+    if forwarded is None:
+        return False, None
+
+    timeout = _answer_timeout()
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_unix_connection(path, limit=_LINE_LIMIT), timeout
+        )
+    except (OSError, asyncio.TimeoutError) as exc:
+        logger.debug(f"No daemon on {path}: {exc!r}")
+        return False, None
+
+    request = {
+        "command": command,
+        "config_file": os.path.abspath(config_file),
+        "servers": list(servers),
+        "filesystems": os.environ.get("SOURCE_FILESYSTEMS"),
+        "cwd": os.getcwd(),
+        "env": provider_env_fingerprint(),
+        "params": forwarded,
+    }
+    accepted = False
+    try:
+        writer.write(_encode(request))
+        await writer.drain()
+        while True:
+            # Until the daemon accepts, a silent daemon means run in-process;
+            # afterwards the command may legitimately take as long as it needs
+            read = reader.readline()
+            line = await (read if accepted else asyncio.wait_for(read, timeout))
+            if not line:
+                raise RuntimeError("mcp-cli daemon closed the connection")
+            reply = json.loads(line)
+            if "accepted" in reply:
+                accepted = True
+            elif "stdout" in reply:
+                sys.stdout.write(reply["stdout"])
+            elif "stderr" in reply:
+                sys.stderr.write(reply["stderr"])
+            else:
+                break
+    except asyncio.TimeoutError:
+        logger.warning(f"mcp-cli daemon on {path} did not answer within {timeout:g}s; running in-process")
+        return False, None
+    finally:
+        writer.close()
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    if "fallback" in reply:
+        logger.debug(f"Daemon declined '{command}': {reply['fallback']}")
+        return False, None
+    if "error" in reply:
+        if reply.get("kind") == "usage":
+            import typer
+            raise typer.BadParameter(reply["error"])
+        raise RuntimeError(reply["error"])
+    return True, reply.get("result")
+
+
+# ════════════════════════════════════════════════════════════════════════
+# Daemon side
+# ════════════════════════════════════════════════════════════════════════
+# Called as sink(stream, text) with stream "stdout" or "stderr"
+_output_sink: contextvars.ContextVar[Optional[Callable[[str, str], None]]] = contextvars.ContextVar(
+    "mcp_cli_daemon_output", default=None
+)
+
+
+class _RoutedStream(io.TextIOBase):
+    """``sys.stdout`` / ``sys.stderr`` replacement sending each request's output to its client."""
+
+    encoding = "utf-8"
+
+    def __init__(self, fallback: Any, name: str):
+        self._fallback = fallback
+        self.name = name
+
+    def write(self, text: str) -> int:
+        sink = _output_sink.get()
+        if sink is None:
+            return self._fallback.write(text)
+        sink(self.name, text)
+        return len(text)
+
+    def flush(self) -> None:
+        if _output_sink.get() is None:
+            self._fallback.flush()
+
+    def isatty(self) -> bool:
+        return _output_sink.get() is None and self._fallback.isatty()
+
+
+async def _run_cmd(daemon: "CommandDaemon", params: Dict[str, Any]) -> Any:
+    from mcp_cli.cli.commands.cmd import CmdCommand
+
+    daemon.model_manager.reload_preferences()
+    return await CmdCommand().execute(daemon.tool_manager, model_manager=daemon.model_manager, **params)
+
+
+async def _run_tools(daemon: "CommandDaemon", params: Dict[str, Any]) -> Any:
+    from mcp_cli.commands.tools import tools_action_async
+
+    return await tools_action_async(
+        daemon.tool_manager,
+        show_details=params.get("all", False),
+        show_raw=params.get("raw", False),
+    )
+
+
+async def _run_ping(daemon: "CommandDaemon", params: Dict[str, Any]) -> Any:
+    from mcp_cli.commands.ping import ping_action_async
+
+    names = params.get("server_names")
+    return await ping_action_async(
+        daemon.tool_manager,
+        server_names={int(k): v for k, v in names.items()} if names else daemon.tool_manager.server_names,
+        targets=params.get("targets") or [],
+    )
+
+
+HANDLERS: Dict[str, Callable[["CommandDaemon", Dict[str, Any]], Awaitable[Any]]] = {
+    "cmd": _run_cmd,
+    "tools": _run_tools,
+    "ping": _run_ping,
+}
+
+
+class CommandDaemon:
+    """Serves commands over a Unix socket using one warm ToolManager."""
+
+    def __init__(self, tool_manager: Any, model_manager: Any, config_file: str, servers: List[str]):
+        self.tool_manager = tool_manager
+        self.model_manager = model_manager
+        self.config_file = os.path.abspath(config_file)
+        self.servers = list(servers)
+        self.filesystems = os.environ.get("SOURCE_FILESYSTEMS")
+        self.cwd = os.getcwd()
+        self.env = provider_env_fingerprint()
+        self.path: Optional[str] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def _mismatch(self, request: Dict[str, Any]) -> Optional[str]:
+        """Why *request* cannot be served by this daemon, if it cannot."""
+        if request.get("config_file") != self.config_file:
+            return f"daemon serves {self.config_file}"
+        if sorted(request.get("servers") or []) != sorted(self.servers):
+            return f"daemon serves servers {', '.join(self.servers)}"
+        if request.get("filesystems") != self.filesystems:
+            return "daemon was started with a different filesystem scope"
+        if request.get("cwd") != self.cwd:
+            return f"daemon runs in {self.cwd}"
+        if request.get("env") != self.env:
+            return "daemon was started with different provider environment variables"
+        return None
+
+    async def _dispatch(self, request: Dict[str, Any], writer: asyncio.StreamWriter) -> Dict[str, Any]:
+        command = request.get("command")
+        handler = HANDLERS.get(command)
+        if handler is None:
+            return {"fallback": f"unsupported command {command!r}"}
+        reason = self._mismatch(request)
+        if reason:
+            return {"fallback": reason}
+
+        def _send(stream: str, text: str) -> None:
+            for start in range(0, len(text), _CHUNK):
+                writer.write(_encode({stream: text[start:start + _CHUNK]}))
+
+        writer.write(_encode({"accepted": True}))
+        token = _output_sink.set(_send)
+        try:
+            result = await handler(self, request.get("params") or {})
+        except Exception as exc:
+            import typer
+
+            if isinstance(exc, typer.BadParameter):
+                return {"error": exc.message, "kind": "usage"}
+            logger.warning(f"Daemon command '{command}' failed: {exc}")
+            return {"error": str(exc)}
+        finally:
+            _output_sink.reset(token)
+        return {"result": result}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            line = await reader.readline()
+            try:
+                request = json.loads(line)
+            except ValueError:
+                reply: Dict[str, Any] = {"error": "malformed request"}
+            else:
+                reply = await self._dispatch(request, writer)
+            writer.write(_encode(reply))
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError) as exc:
+            logger.debug(f"Daemon client went away: {exc}")
+        finally:
+            writer.close()
+
+    async def start(self, path: str) -> None:
+        """Bind *path*, replacing a stale socket left by a dead daemon."""
+        if os.path.exists(path):
+            try:
+                _, probe = await asyncio.open_unix_connection(path)
+            except OSError:
+                os.unlink(path)
+            else:
+                probe.close()
+                raise RuntimeError(f"An mcp-cli daemon is already listening on {path}")
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._server = await asyncio.start_unix_server(self._handle, path=path, limit=_LINE_LIMIT)
+        os.chmod(path, 0o600)
+        self.path = path
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+
+async def serve(path: str, config_file: str, servers: List[str], server_names: Optional[Dict[int, str]] = None) -> None:
+    """Start the MCP servers once and serve commands on *path* until cancelled."""
+    from mcp_cli.model_manager import ModelManager
+    from mcp_cli.run_command import _init_tool_manager, _safe_close
+
+    tool_manager = await _init_tool_manager(config_file, servers, server_names)
+    daemon = CommandDaemon(tool_manager, ModelManager(), config_file, servers)
+    real_stdout, real_stderr = sys.stdout, sys.stderr
+    routed_stderr = _RoutedStream(real_stderr, "stderr")
+    # Log handlers writing to the terminal follow stderr to the client
+    handlers = [
+        h for h in logging.getLogger().handlers
+        if isinstance(h, logging.StreamHandler) and h.stream is real_stderr
+    ]
+    try:
+        await daemon.start(path)
+        sys.stdout = _RoutedStream(real_stdout, "stdout")
+        sys.stderr = routed_stderr
+        for handler in handlers:
+            handler.setStream(routed_stderr)
+        print(f"mcp-cli daemon listening on {path} ({len(servers)} servers)", file=sys.stderr)
+
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except (NotImplementedError, RuntimeError):
+                pass
+        await stop.wait()
+    finally:
+        sys.stdout, sys.stderr = real_stdout, real_stderr
+        for handler in handlers:
+            handler.setStream(real_stderr)
+        await daemon.close()
+        await _safe_close(tool_manager)
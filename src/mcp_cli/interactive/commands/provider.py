@@ -28,6 +28,7 @@ class ProviderCommand(InteractiveCommand):
                 "  provider list                     List available providers\n"
                 "  provider config                   Show provider configuration\n"
                 "  provider diagnostic [prov]        Probe provider(s) health\n"
+                "  provider refresh                  Rebuild cached provider catalogue\n"
                 "  provider set <prov> <key> <val>   Update one config key\n"
                 "  provider <prov> [model]           Switch provider (and model)\n"
                 "\nExamples:\n"
@@ -83,12 +84,12 @@ class ProviderCommand(InteractiveCommand):
             
             # If just "provider" or "p", suggest subcommands
             if len(words) <= 1:
-                return ["list", "config", "diagnostic", "set"]
+                return ["list", "config", "diagnostic", "set", "refresh"]
             
             subcommand = words[1].lower()
             
             # Provider name completions
-            if subcommand in ["diagnostic", "set"] or (subcommand not in ["list", "config"]):
+            if subcommand in ["diagnostic", "set"] or (subcommand not in ["list", "config", "refresh"]):
                 mm = ModelManager()
                 providers = mm.list_providers()
                 
@@ -128,6 +129,7 @@ class ProvidersCommand(InteractiveCommand):
                 "  providers list                    List available providers (explicit)\n"
                 "  providers config                  Show provider configuration\n"
                 "  providers diagnostic [prov]       Probe provider(s) health\n"
+                "  providers refresh                 Rebuild cached provider catalogue\n"
                 "  providers set <prov> <key> <val>  Update one config key\n"
                 "  providers <prov> [model]          Switch provider (and model)\n"
                 "\nExamples:\n"
@@ -177,7 +179,7 @@ class ProvidersCommand(InteractiveCommand):
             # If just "providers" or "ps", suggest subcommands and provider names
             if len(words) <= 1:
                 # Return both subcommands and provider names
-                subcommands = ["list", "config", "diagnostic", "set"]
+                subcommands = ["list", "config", "diagnostic", "set", "refresh"]
                 mm = ModelManager()
                 providers = mm.list_providers()
                 return subcommands + providers
@@ -185,7 +187,7 @@ class ProvidersCommand(InteractiveCommand):
             subcommand = words[1].lower()
             
             # Provider name completions
-            if subcommand in ["diagnostic", "set"] or (subcommand not in ["list", "config"]):
+            if subcommand in ["diagnostic", "set"] or (subcommand not in ["list", "config", "refresh"]):
                 mm = ModelManager()
                 providers = mm.list_providers()
                 
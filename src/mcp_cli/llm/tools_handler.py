@@ -1,4 +1,5 @@
 # mcp_cli/llm/tools_handler.py
+import inspect
 import json
 import logging
 import uuid
@@ -9,41 +10,22 @@ from chuk_tool_processor.registry.tool_export import openai_functions
 
 from mcp_cli.tools.manager import ToolManager
 from mcp_cli.tools.models import ToolCallResult
+from mcp_cli.tools.serialization import format_tool_response as _format_tool_response
 
 
 def format_tool_response(response_content: Union[List[Dict[str, Any]], Any]) -> str:
     """Format the response content from a tool.
-    
-    Preserves structured data in a readable format, ensuring that all data is
-    available for the model in future conversation turns.
+
+    Kept for backward compatibility, with this handler's original output:
+    record lists are pretty-printed JSON, and in text-record lists items
+    without a ``type`` are skipped.  See :mod:`mcp_cli.tools.serialization`
+    for the compact table formats.
     """
-    # Handle list of dictionaries (likely structured data like SQL results)
     if isinstance(response_content, list) and response_content and isinstance(response_content[0], dict):
-        # Check if this looks like text records with type field
-        if all(item.get("type") == "text" for item in response_content if "type" in item):
-            # Text records - extract just the text
-            return "\n".join(
-                item.get("text", "No content")
-                for item in response_content
-                if item.get("type") == "text"
-            )
-        else:
-            # This could be data records (like SQL results)
-            # Return a JSON representation that preserves all data
-            try:
-                return json.dumps(response_content, indent=2)
-            except:
-                # Fallback if JSON serialization fails
-                return str(response_content)
-    elif isinstance(response_content, dict):
-        # Single dictionary - return as JSON
-        try:
-            return json.dumps(response_content, indent=2)
-        except:
-            return str(response_content)
-    else:
-        # Default case - convert to string
-        return str(response_content)
+        items = [item for item in response_content if isinstance(item, dict) and "type" in item]
+        if items and all(item["type"] == "text" for item in items):
+            return "\n".join(item.get("text", "No content") for item in items)
+    return _format_tool_response(response_content, "json")
 
 
 async def handle_tool_call(
@@ -107,6 +89,8 @@ async def handle_tool_call(
         # Log which tool we're calling
         if hasattr(manager, 'get_server_for_tool'):
             server_name = manager.get_server_for_tool(tool_name)
+            if inspect.isawaitable(server_name):  # ToolManager's lookup is async
+                server_name = await server_name
             logging.debug(f"Calling tool '{tool_name}' on server '{server_name}'")
         
         # Call the tool using either manager
@@ -179,7 +163,10 @@ async def handle_tool_call(
             raw_content = tool_response.get("content", [])
         
         # Format the tool response
-        formatted_response: str = format_tool_response(raw_content)
+        if isinstance(manager, ToolManager):
+            formatted_response: str = manager.format_result(raw_content)
+        else:
+            formatted_response = format_tool_response(raw_content)
         logging.debug(f"Tool '{tool_name}' Response: {formatted_response}")
 
         # Append the tool call (for tracking purposes)
@@ -30,11 +30,25 @@ setup_logging(level="ERROR", quiet=False, verbose=False)
 # Now safe to import components that might start MCP servers
 # ──────────────────────────────────────────────────────────────────────────────
 from mcp_cli.cli.commands import register_all_commands
-from mcp_cli.cli.registry import CommandRegistry
-from mcp_cli.run_command import run_command_sync
-from mcp_cli.ui.ui_helpers import restore_terminal
+from mcp_cli.cli.registry import CommandRegistry, LazyCommandGroup
 from mcp_cli.cli_options import process_options
 
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Import-on-call helpers - rich, chuk_llm and chuk_tool_processor are only
+# loaded by commands that need them, so --help and provider commands start fast
+# ──────────────────────────────────────────────────────────────────────────────
+def run_command_sync(*args, **kwargs):
+    from mcp_cli.run_command import run_command_sync as _run_command_sync
+    return _run_command_sync(*args, **kwargs)
+
+
+def restore_terminal() -> None:
+    if "mcp_cli.ui.ui_helpers" not in sys.modules:
+        return  # no UI was started, nothing to restore
+    from mcp_cli.ui.ui_helpers import restore_terminal as _restore_terminal
+    _restore_terminal()
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Module logger
 # ──────────────────────────────────────────────────────────────────────────────
@@ -43,7 +57,7 @@ logger = get_logger("main")
 # ──────────────────────────────────────────────────────────────────────────────
 # Typer root app
 # ──────────────────────────────────────────────────────────────────────────────
-app = typer.Typer(add_completion=False)
+app = typer.Typer(add_completion=False, cls=LazyCommandGroup)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -73,7 +87,7 @@ def main_callback(
         return
     
     # IMPROVED: Better handling of --provider flag for common mistakes
-    provider_commands = ["list", "config", "diagnostic", "set"]
+    provider_commands = ["list", "config", "diagnostic", "set", "refresh"]
     if provider and provider in provider_commands:
         logger.debug(f"Detected provider command in --provider flag: {provider}")
         print(f"[yellow]Tip:[/yellow] Use 'mcp-cli provider {provider}' or 'mcp-cli providers {provider}' instead")
@@ -147,7 +161,8 @@ def main_callback(
         try:
             logger.debug("Initializing tool manager")
             from mcp_cli.run_command import _init_tool_manager
-            tm = await _init_tool_manager(config_file, servers, server_names)
+            # Chat opens once the first server is up; the rest join as they start
+            tm = await _init_tool_manager(config_file, servers, server_names, wait_for_all=False)
             
             logger.debug("Starting chat mode handler")
             success = await handle_chat_mode(
@@ -257,19 +272,17 @@ def _interactive_command(
 logger.debug("Registering commands from registry")
 register_all_commands()
 
-# Try registry-based registration first for core commands
+# Registry-based core commands are attached lazily: their modules are imported
+# only when the command is dispatched
 core_commands = ["chat", "cmd", "ping"]  # Remove "provider" from registry
 registry_registered = []
 
 for command_name in core_commands:
     cmd = CommandRegistry.get_command(command_name)
     if cmd:
-        try:
-            cmd.register(app, run_command_sync)
-            registry_registered.append(command_name)
-            logger.debug(f"Successfully registered command via registry: {command_name}")
-        except Exception as e:
-            logger.warning(f"Failed to register command '{command_name}' via registry: {e}")
+        LazyCommandGroup.add_lazy_command(cmd, run_command_sync)
+        registry_registered.append(command_name)
+        logger.debug(f"Registered lazy command via registry: {command_name}")
 
 # Direct registration of tool-related commands
 direct_registered = []
@@ -296,11 +309,13 @@ def _setup_command_logging(quiet: bool, verbose: bool, log_level: str):
 # Provider command - FIXED to handle arguments properly
 @app.command("provider", help="Manage LLM providers")
 def provider_command(
-    subcommand: Optional[str] = typer.Argument(None, help="Subcommand: list, config, diagnostic, set, or provider name"),
+    subcommand: Optional[str] = typer.Argument(None, help="Subcommand: list, config, diagnostic, set, refresh, or provider name"),
     provider_name: Optional[str] = typer.Argument(None, help="Provider name (for set or switch commands)"),
     key: Optional[str] = typer.Argument(None, help="Config key (for set command)"),
     value: Optional[str] = typer.Argument(None, help="Config value (for set command)"),
     model: Optional[str] = typer.Option(None, "--model", help="Model name (for switch commands)"),
+    probe: bool = typer.Option(False, "--probe", help="With diagnostic: send a test prompt to every ready provider"),
+    samples: int = typer.Option(1, "--samples", min=1, help="With diagnostic: probes per model; above 1 adds latency percentiles"),
     config_file: str = typer.Option("server_config.json", help="Configuration file path"),
     server: Optional[str] = typer.Option(None, help="Server to connect to"),
     disable_filesystem: bool = typer.Option(False, help="Disable filesystem access"),
@@ -319,12 +334,16 @@ def provider_command(
     if subcommand is None:
         # No arguments - show status
         args = []
-    elif subcommand in ["list", "config", "diagnostic"]:
+    elif subcommand in ["list", "config", "diagnostic", "refresh"]:
         # Command without provider name
         args = [subcommand]
         if provider_name and subcommand == "diagnostic":
             # diagnostic can take a provider name
             args.append(provider_name)
+        if probe and subcommand == "diagnostic":
+            args.append("--probe")
+        if samples > 1 and subcommand == "diagnostic":
+            args += ["--samples", str(samples)]
     elif subcommand == "set":
         # set command: set <provider> <key> <value>
         if not provider_name or not key or not value:
@@ -348,11 +367,13 @@ direct_registered.append("provider")
 # ADD: providers command as alias to provider (for consistency)
 @app.command("providers", help="List LLM providers (defaults to list)")
 def providers_command(
-    subcommand: Optional[str] = typer.Argument(None, help="Subcommand: list, config, diagnostic, set, or provider name"),
+    subcommand: Optional[str] = typer.Argument(None, help="Subcommand: list, config, diagnostic, set, refresh, or provider name"),
     provider_name: Optional[str] = typer.Argument(None, help="Provider name (for set or switch commands)"),
     key: Optional[str] = typer.Argument(None, help="Config key (for set command)"),
     value: Optional[str] = typer.Argument(None, help="Config value (for set command)"),
     model: Optional[str] = typer.Option(None, "--model", help="Model name (for switch commands)"),
+    probe: bool = typer.Option(False, "--probe", help="With diagnostic: send a test prompt to every ready provider"),
+    samples: int = typer.Option(1, "--samples", min=1, help="With diagnostic: probes per model; above 1 adds latency percentiles"),
     config_file: str = typer.Option("server_config.json", help="Configuration file path"),
     server: Optional[str] = typer.Option(None, help="Server to connect to"),
     disable_filesystem: bool = typer.Option(False, help="Disable filesystem access"),
@@ -371,12 +392,16 @@ def providers_command(
     if subcommand is None:
         # CHANGED: No arguments for "providers" defaults to list (not status)
         args = ["list"]
-    elif subcommand in ["list", "config", "diagnostic"]:
+    elif subcommand in ["list", "config", "diagnostic", "refresh"]:
         # Command without provider name
         args = [subcommand]
         if provider_name and subcommand == "diagnostic":
             # diagnostic can take a provider name
             args.append(provider_name)
+        if probe and subcommand == "diagnostic":
+            args.append("--probe")
+        if samples > 1 and subcommand == "diagnostic":
+            args += ["--samples", str(samples)]
     elif subcommand == "set":
         # set command: set <provider> <key> <value>
         if not provider_name or not key or not value:
@@ -420,11 +445,9 @@ def tools_command(
         server, disable_filesystem, provider, model, config_file, quiet=quiet
     )
     
-    # Import and use the tools action - USE ASYNC VERSION
-    from mcp_cli.commands.tools import tools_action_async
-    
-    # Execute via run_command_sync with async wrapper
+    # Execute via run_command_sync with async wrapper - USE ASYNC VERSION
     async def _tools_wrapper(tool_manager, **params):
+        from mcp_cli.commands.tools import tools_action_async
         return await tools_action_async(tool_manager, show_details=params.get('all', False), show_raw=params.get('raw', False))
     
     run_command_sync(
@@ -435,11 +458,43 @@ def tools_command(
             "all": all,
             "raw": raw,
             "server_names": server_names,
+            "daemon_command": "tools",
         },
     )
 
 direct_registered.append("tools")
 
+# Serve command - keep MCP servers warm for cmd / tools / ping
+@app.command("serve", help="Run a local daemon that keeps MCP servers warm for cmd, tools and ping")
+def serve_command(
+    socket: Optional[str] = typer.Option(None, "--socket", help="Unix socket path (default: $MCP_CLI_SOCKET or ~/.mcp-cli/daemon.sock)"),
+    config_file: str = typer.Option("server_config.json", help="Configuration file path"),
+    server: Optional[str] = typer.Option(None, help="Server to connect to"),
+    disable_filesystem: bool = typer.Option(False, help="Disable filesystem access"),
+    quiet: bool = typer.Option(False, "-q", "--quiet", help="Suppress most log output"),
+    verbose: bool = typer.Option(False, "-v", "--verbose", help="Enable verbose logging"),
+    log_level: str = typer.Option("WARNING", "--log-level", help="Set log level"),
+) -> None:
+    """Serve cmd / tools / ping requests from one long-lived ToolManager."""
+    # Configure logging for this command
+    _setup_command_logging(quiet, verbose, log_level)
+    
+    from mcp_cli.daemon import serve, socket_path
+    
+    servers, _, server_names = process_options(
+        server, disable_filesystem, "openai", None, config_file, quiet=quiet
+    )
+    
+    try:
+        asyncio.run(serve(socket or socket_path(), config_file, servers, server_names))
+    except KeyboardInterrupt:
+        pass
+    except RuntimeError as e:
+        print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+direct_registered.append("serve")
+
 # Servers command
 @app.command("servers", help="List connected MCP servers with comprehensive information")
 def servers_command(
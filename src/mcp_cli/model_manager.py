@@ -5,15 +5,39 @@ FIXED: Added comprehensive model validation to prevent internal inconsistencies.
 """
 from __future__ import annotations
 
+import importlib
 import logging
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from pathlib import Path
 
-from chuk_llm.llm.client import get_client, list_available_providers, get_provider_info, validate_provider_setup
-from chuk_llm.configuration.unified_config import get_config
+from mcp_cli.provider_catalogue import ProviderCatalogue
 
 logger = logging.getLogger(__name__)
 
+# chuk-llm entry points, imported on first use: ``chuk_llm.llm.client`` pulls
+# in every provider SDK, which most commands (and warm catalogues) never need.
+_LAZY_IMPORTS = {
+    "get_client": "chuk_llm.llm.client",
+    "list_available_providers": "chuk_llm.llm.client",
+    "get_provider_info": "chuk_llm.llm.client",
+    "validate_provider_setup": "chuk_llm.llm.client",
+    "get_config": "chuk_llm.configuration.unified_config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def _chuk(name: str) -> Any:
+    """Module-level chuk-llm function *name* (honours patched attributes)."""
+    return globals().get(name) or __getattr__(name)
+
 
 class ModelManager:
     """
@@ -28,14 +52,34 @@ class ModelManager:
 
     def __init__(self):
         # Get chuk-llm's configuration manager
-        self.chuk_config = get_config()
+        self.chuk_config = _chuk("get_config")()
         
         # Simple user preferences file for active selections
         self.user_prefs_file = Path.home() / ".mcp-cli" / "preferences.yaml"
-        self._user_prefs = self._load_user_preferences()
+        self._prefs: Optional[Dict[str, str]] = None  # read on first access
+
+        # Provider / model catalogue, served from a TTL'd on-disk snapshot
+        self._catalogue = ProviderCatalogue(self.user_prefs_file.parent / "provider_catalogue.json")
+
+        # Validated clients keyed by (provider, model, api_base). The active
+        # one is also pinned so ``get_client`` is a plain lookup per turn.
+        self._clients: Dict[Tuple[str, str, Optional[str]], Any] = {}
+        self._active_client: Optional[Any] = None
+        self._active_client_key: Optional[Tuple[str, str]] = None
         
         logger.debug("ModelManager initialized with chuk-llm unified configuration")
 
+    @property
+    def _user_prefs(self) -> Dict[str, str]:
+        if self._prefs is None:
+            self._prefs = self._load_user_preferences()
+        return self._prefs
+
+    def reload_preferences(self) -> None:
+        """Re-read the active provider/model on next access (long-lived managers)."""
+        self._prefs = None
+        self._invalidate_active_client()
+
     def _load_user_preferences(self) -> Dict[str, str]:
         """Load simple user preferences (just active provider/model)."""
         import yaml
@@ -85,6 +129,7 @@ class ModelManager:
             raise ValueError(f"Unknown provider: {provider}. Available: {available}")
         
         self._user_prefs["active_provider"] = provider
+        self._invalidate_active_client()
         
         # Set default model for this provider
         info = self.get_provider_info(provider)
@@ -97,6 +142,7 @@ class ModelManager:
     def set_active_model(self, model: str) -> None:
         """Set active model."""
         self._user_prefs["active_model"] = model
+        self._invalidate_active_client()
         self._save_user_preferences()
         logger.info(f"Switched to model: {model}")
 
@@ -187,17 +233,24 @@ class ModelManager:
     def list_providers(self) -> List[str]:
         """Get list of available providers."""
         try:
-            return self.chuk_config.get_all_providers()
+            return self._catalogue.get("providers", self.chuk_config.get_all_providers)
         except Exception as e:
             logger.error(f"Failed to get providers: {e}")
             return []
 
     def get_client(self, force_refresh: bool = False) -> Any:
         """
-        FIXED: Get LLM client with validation before creating client.
+        Get the LLM client for the active provider/model.
+
+        The client is validated and created once, then served from cache
+        until the active provider/model changes or the provider is
+        reconfigured.
         """
         provider = self.get_active_provider()
         model = self.get_active_model()
+
+        if not force_refresh and self._active_client_key == (provider, model):
+            return self._active_client
         
         # Validate current configuration before creating client
         if not self.validate_provider(provider):
@@ -211,11 +264,10 @@ class ModelManager:
                 model_list += f"... ({len(available_models)} total)"
             raise ValueError(f"Current model '{model}' not available for provider '{provider}'. Available: [{model_list}]")
         
-        try:
-            return get_client(provider=provider, model=model)
-        except Exception as e:
-            logger.error(f"Failed to create client for {provider}/{model}: {e}")
-            raise
+        client = self._cached_client(provider, model, force_refresh)
+        self._active_client = client
+        self._active_client_key = (provider, model)
+        return client
 
     def get_client_for_provider(self, provider: str, model: Optional[str] = None) -> Any:
         """
@@ -234,35 +286,69 @@ class ModelManager:
                 model_list += f"... ({len(available_models)} total)"
             raise ValueError(f"Model '{target_model}' not available for provider '{provider}'. Available: [{model_list}]")
         
+        return self._cached_client(provider, target_model)
+
+    def _cached_client(self, provider: str, model: str, force_refresh: bool = False) -> Any:
+        """Return the client for (provider, model, api_base), creating it once."""
+        key = (provider, model, self._get_api_base(provider))
+        if not force_refresh and key in self._clients:
+            return self._clients[key]
         try:
-            return get_client(provider=provider, model=target_model)
+            client = _chuk("get_client")(provider=provider, model=model)
         except Exception as e:
-            logger.error(f"Failed to create client for {provider}/{target_model}: {e}")
+            logger.error(f"Failed to create client for {provider}/{model}: {e}")
             raise
+        self._clients[key] = client
+        return client
+
+    def _get_api_base(self, provider: str) -> Optional[str]:
+        """Configured API base for *provider* (part of the client cache key)."""
+        try:
+            api_base = getattr(self.chuk_config.get_provider(provider), "api_base", None)
+        except Exception:
+            return None
+        return api_base if isinstance(api_base, str) else None
+
+    def _invalidate_active_client(self) -> None:
+        self._active_client = None
+        self._active_client_key = None
+
+    def invalidate_clients(self) -> None:
+        """Drop every cached client (e.g. after a configuration change)."""
+        self._clients.clear()
+        self._invalidate_active_client()
 
     def refresh_client(self) -> Any:
         """Force refresh of current client."""
-        # chuk-llm handles caching internally, so just return a new client
-        return self.get_client()
+        return self.get_client(force_refresh=True)
 
     def get_provider_info(self, provider: Optional[str] = None) -> Dict[str, Any]:
         """Get comprehensive provider information."""
         provider = provider or self.get_active_provider()
-        return get_provider_info(provider) or {}
+        return self._catalogue.get(
+            f"info:{provider}",
+            lambda: _chuk("get_provider_info")(provider) or {},
+            keep=lambda info: "error" not in info,
+        )
 
     def validate_provider_setup(self, provider: Optional[str] = None) -> Dict[str, Any]:
         """Validate provider setup and configuration."""
         provider = provider or self.get_active_provider()
-        return validate_provider_setup(provider)
+        return _chuk("validate_provider_setup")(provider)
 
     def list_available_providers(self) -> Dict[str, Dict[str, Any]]:
         """Get detailed info about all available providers with improved error handling."""
         try:
-            return list_available_providers()
+            return self._catalogue.get("available", lambda: _chuk("list_available_providers")(), keep=bool)
         except Exception as e:
             logger.error(f"list_available_providers failed: {e}")
             return {}
 
+    def refresh_provider_catalogue(self) -> Dict[str, Dict[str, Any]]:
+        """Discard the cached provider catalogue and rebuild it from chuk-llm."""
+        self._catalogue.invalidate()
+        return self.list_available_providers()
+
     # ── Provider configuration ────────────────────────────────────────────
     def configure_provider(
         self, 
@@ -316,6 +402,8 @@ class ModelManager:
         
         # Force chuk-llm to reload configuration
         self.chuk_config.reload()
+        self.invalidate_clients()
+        self._catalogue.invalidate()
         
         logger.info(f"Updated configuration for provider: {provider}")
 
@@ -372,7 +460,7 @@ class ModelManager:
     def debug_provider_models(self):
         """Debug method to see what list_available_providers actually returns."""
         try:
-            providers_info = list_available_providers()
+            providers_info = _chuk("list_available_providers")()
             
             print("🔍 Debug: list_available_providers() output:")
             for name, info in providers_info.items():
@@ -524,6 +612,8 @@ class ModelManager:
             self.chuk_config.reload()
         except Exception as e:
             logger.error(f"Failed to reload config: {e}")
+        self.invalidate_clients()
+        self._catalogue.invalidate()
 
     def __enter__(self):
         return self
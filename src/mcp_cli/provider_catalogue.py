@@ -0,0 +1,195 @@
+# mcp_cli/provider_catalogue.py
+"""
+Cached snapshot of chuk-llm's provider / model catalogue.
+
+Listing providers through chuk-llm re-reads configuration (and may run
+discovery) on every call.  ``ProviderCatalogue`` memoises those lookups in
+memory and persists them to ``~/.mcp-cli/provider_catalogue.json`` so later
+CLI invocations start from the snapshot instead of re-querying.
+
+* The snapshot is read lazily, on the first lookup.
+* It expires after ``ttl`` seconds (``MCP_CLI_PROVIDER_CACHE_TTL``, default
+  one hour; ``0`` disables the on-disk snapshot).
+* It is discarded as soon as the user's chuk-llm configuration files or
+  the provider environment variables (API keys, base URLs) change.
+* ``mcp-cli provider refresh`` forces a rebuild.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 3600.0
+SNAPSHOT_VERSION = 1
+
+_MISSING = object()
+
+# Environment variables that change which provider / credentials are used
+_PROVIDER_ENV = re.compile(r"(_API_KEY|_API_BASE|_BASE_URL|_ENDPOINT)$|^CHUK_LLM_")
+
+
+def _default_ttl() -> float:
+    value = os.getenv("MCP_CLI_PROVIDER_CACHE_TTL")
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            logger.warning(f"Invalid MCP_CLI_PROVIDER_CACHE_TTL: {value}")
+    return DEFAULT_TTL
+
+
+def provider_env_fingerprint() -> str:
+    """Digest of the provider-related environment (values are never stored)."""
+    items = sorted((k, v) for k, v in os.environ.items() if _PROVIDER_ENV.search(k))
+    return hashlib.sha256(json.dumps(items).encode("utf-8")).hexdigest()
+
+
+class ProviderCatalogue:
+    """Memory + disk cache for provider catalogue lookups."""
+
+    def __init__(self, path: Optional[Path] = None, ttl: Optional[float] = None):
+        """
+        Args:
+            path: Snapshot file (default ``~/.mcp-cli/provider_catalogue.json``)
+            ttl: Snapshot lifetime in seconds; ``0`` keeps it in memory only
+        """
+        self.path = path or Path.home() / ".mcp-cli" / "provider_catalogue.json"
+        self.ttl = _default_ttl() if ttl is None else ttl
+        self._entries: Dict[str, Any] = {}
+        self._loaded = False
+        self._created_at = 0.0
+        self._fp: Optional[List[Any]] = None
+
+    # ------------------------------------------------------------------ #
+    # Lookup                                                             #
+    # ------------------------------------------------------------------ #
+    def get(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        keep: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Return the cached value for *key*, calling *loader* on a miss.
+
+        Args:
+            keep: Optional predicate; loaded values it rejects (e.g. error
+                payloads) are returned but not cached
+        """
+        if not self._loaded:
+            self._load()
+
+        value = self._entries.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            if keep is None or keep(value):
+                self._entries[key] = value
+                self._save()
+        return value
+
+    def invalidate(self) -> None:
+        """Forget every cached entry, in memory and on disk."""
+        self._entries = {}
+        self._fp = None
+        self._loaded = True
+        self._created_at = time.time()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f"Could not remove provider catalogue snapshot: {e}")
+
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since the current snapshot was built, if any."""
+        if not self._loaded:
+            self._load()
+        return time.time() - self._created_at if self._entries else None
+
+    # ------------------------------------------------------------------ #
+    # Persistence                                                        #
+    # ------------------------------------------------------------------ #
+    def _fingerprint(self) -> List[Any]:
+        """Changes whenever chuk-llm, the user's overrides of it or the provider environment change."""
+        if self._fp is None:
+            self._fp = self._compute_fingerprint()
+        return self._fp
+
+    @staticmethod
+    def _compute_fingerprint() -> List[Any]:
+        try:
+            from importlib.metadata import version
+            chuk_version = version("chuk-llm")
+        except Exception:
+            chuk_version = None
+
+        config_dir = Path.home() / ".chuk_llm"
+        mtimes = []
+        for name in ("providers.yaml", ".env"):
+            try:
+                mtimes.append((config_dir / name).stat().st_mtime)
+            except OSError:
+                mtimes.append(None)
+        return [chuk_version, *mtimes, provider_env_fingerprint()]
+
+    def _load(self) -> None:
+        self._loaded = True
+        self._created_at = time.time()
+        if self.ttl <= 0:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable provider catalogue snapshot: {e}")
+            return
+
+        created_at = snapshot.get("created_at", 0)
+        if (
+            snapshot.get("version") != SNAPSHOT_VERSION
+            or time.time() - created_at > self.ttl
+            or snapshot.get("fingerprint") != self._fingerprint()
+        ):
+            logger.debug("Provider catalogue snapshot is stale")
+            return
+
+        self._entries = dict(snapshot.get("entries") or {})
+        self._created_at = created_at
+        logger.debug(f"Loaded provider catalogue snapshot ({len(self._entries)} entries)")
+
+    def _save(self) -> None:
+        if self.ttl <= 0:
+            return
+        entries = {}
+        for key, value in self._entries.items():
+            try:
+                json.dumps(value)
+            except (TypeError, ValueError):
+                continue  # keep non-JSON values in memory only
+            entries[key] = value
+
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "created_at": self._created_at,
+            "fingerprint": self._fingerprint(),
+            "entries": entries,
+        }
+        try:
+            self.path.parent.mkdir(exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.debug(f"Could not write provider catalogue snapshot: {e}")
@@ -17,10 +17,6 @@ from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Coroutine, Dict, List, Optional
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-
-from mcp_cli.tools.manager import set_tool_manager  # only the setter
 
 # --------------------------------------------------------------------------- #
 # internal helpers / globals                                                  #
@@ -35,15 +31,21 @@ async def _init_tool_manager(
     config_file: str,
     servers: List[str],
     server_names: Optional[Dict[int, str]] = None,
+    wait_for_all: bool = True,
 ):
     """
     Dynamically import **ToolManager** (so monkey-patching works) and create it.
+
+    With ``wait_for_all=False`` this returns once the first server is ready;
+    the others keep starting in the background.
     """
     tm_mod = importlib.import_module("mcp_cli.tools.manager")
     ToolManager = getattr(tm_mod, "ToolManager")           # patched in tests
+    set_tool_manager = tm_mod.set_tool_manager
 
     tm = ToolManager(config_file, servers, server_names)   # type: ignore[call-arg]
-    ok = await tm.initialize(namespace="stdio")
+    startup = {} if wait_for_all else {"wait_for_all": False}
+    ok = await tm.initialize(namespace="stdio", **startup)
     if not ok:
         # record it for the tests
         _ALL_TM.append(tm)
@@ -82,14 +84,25 @@ async def run_command(
     The *async_command* may itself be `async` **or** synchronous – both work.
     The ToolManager is always closed, even when the callable raises.
     """
+    # Commands that a running `mcp-cli serve` daemon can run for us
+    daemon_command = (extra_params or {}).get("daemon_command")
+    if daemon_command:
+        from mcp_cli.daemon import forward_command
+
+        handled, result = await forward_command(daemon_command, config_file, servers, extra_params)
+        if handled:
+            return result
+
     tm = None
     try:
         server_names = (extra_params or {}).get("server_names")
+        # Interactive front-ends can start before slow servers are up
+        wait_for_all = (extra_params or {}).get("wait_for_all_servers", True)
 
         # ------------------------------------------------------------------
         # build ToolManager  (patch-friendly, see helper)
         # ------------------------------------------------------------------
-        tm = await _init_tool_manager(config_file, servers, server_names)
+        tm = await _init_tool_manager(config_file, servers, server_names, wait_for_all)
 
         # ------------------------------------------------------------------
         # special-case: interactive “app” object
@@ -212,6 +225,9 @@ def cli_entry(
     """
     Thin wrapper so `uv run mcp-cli chat` (or `interactive`) is minimal.
     """
+    from rich.console import Console
+    from rich.panel import Panel
+
     console = Console()
 
     async def _inner() -> None:
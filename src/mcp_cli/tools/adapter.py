@@ -7,6 +7,9 @@ from typing import Dict, List
 
 from mcp_cli.tools.models import ToolInfo
 
+# Characters OpenAI does not accept in function names
+_INVALID_NAME_CHARS = re.compile(r'[^a-zA-Z0-9_-]')
+
 
 class ToolNameAdapter:
     """Handles adaptation between OpenAI-compatible tool names and MCP original names."""
@@ -29,7 +32,7 @@ class ToolNameAdapter:
         combined = f"{namespace}_{name}"
         
         # Replace any characters that don't comply with OpenAI's pattern
-        sanitized = re.sub(r'[^a-zA-Z0-9_-]', '_', combined)
+        sanitized = _INVALID_NAME_CHARS.sub('_', combined)
         
         return sanitized
     
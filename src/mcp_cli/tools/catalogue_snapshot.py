@@ -0,0 +1,102 @@
+# mcp_cli/tools/catalogue_snapshot.py
+"""
+On-disk snapshot of each MCP server's tool list, for warm starts.
+
+Listing tools requires launching the server and completing the MCP
+handshake, which for ``uv run`` / ``npx`` servers can take seconds.  The
+last tool list seen from every server is kept in
+``~/.mcp-cli/cache/catalogue/<server>.json`` so the next chat can offer
+those tools immediately while the servers connect in the background.
+
+A snapshot is only used if the server's ``mcpServers`` entry is unchanged
+(same config hash).  It is a hint, not a source of truth: once the server
+is connected its live tool list replaces the snapshot, and the snapshot is
+rewritten only when the two differ.
+
+Set ``MCP_CLI_WARM_START=0`` to always wait for the servers instead.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def warm_start_enabled() -> bool:
+    return os.getenv("MCP_CLI_WARM_START", "1").lower() not in ("0", "false", "no", "off")
+
+
+def config_hash(server_config: Any) -> str:
+    """Stable hash of one ``mcpServers`` entry."""
+    canonical = json.dumps(server_config, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+class CatalogueSnapshot:
+    """Per-server tool lists persisted between runs."""
+
+    def __init__(self, root: Optional[Path] = None):
+        """
+        Args:
+            root: Directory for snapshot files (default ``~/.mcp-cli/cache/catalogue``)
+        """
+        self.root = Path(root) if root else Path.home() / ".mcp-cli" / "cache" / "catalogue"
+
+    def _path(self, server: str) -> Path:
+        return self.root / f"{_UNSAFE_CHARS.sub('_', server)}.json"
+
+    def load(self, server: str, expected_hash: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return the stored tool list of *server*, or None if there is none or it
+        was taken with a different configuration.
+        """
+        try:
+            with open(self._path(server), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable tool snapshot for {server}: {e}")
+            return None
+
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != SNAPSHOT_VERSION
+            or data.get("server") != server
+            or data.get("config_hash") != expected_hash
+            or not isinstance(data.get("tools"), list)
+        ):
+            logger.debug(f"Tool snapshot for {server} is stale")
+            return None
+        return data["tools"]
+
+    def save(self, server: str, server_hash: str, tools: List[Dict[str, Any]]) -> None:
+        """Atomically replace the stored tool list of *server*."""
+        payload = {
+            "version": SNAPSHOT_VERSION,
+            "server": server,
+            "config_hash": server_hash,
+            "saved": time.time(),
+            "tools": tools,
+        }
+        path = self._path(server)
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"), default=str)
+            os.replace(tmp, path)
+            logger.debug(f"Saved tool snapshot for {server}: {len(tools)} tools")
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not save tool snapshot for {server}: {e}")
@@ -0,0 +1,91 @@
+# mcp_cli/tools/index.py
+"""
+Constant-time tool name resolution.
+
+A :class:`ToolIndex` is an immutable snapshot of the registry that maps every
+spelling an LLM or user may use for a tool onto ``(namespace, name, ToolInfo)``:
+
+* the bare tool name            - ``list_tables``
+* the namespaced name           - ``sqlite.list_tables``
+* the OpenAI-sanitised name     - ``sqlite_list_tables``
+
+Bare and sanitised names follow the same precedence as the historical linear
+registry scan: the first *non-default* namespace that registered the tool wins.
+"""
+from __future__ import annotations
+
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from mcp_cli.tools.adapter import ToolNameAdapter
+from mcp_cli.tools.models import ToolInfo
+
+# (namespace, base_name, ToolInfo)
+ToolEntry = Tuple[str, str, ToolInfo]
+
+
+class ToolIndex:
+    """Dictionary-backed lookup table built once per registry snapshot."""
+
+    def __init__(self, tools: Iterable[ToolInfo]):
+        self._tools: List[ToolInfo] = list(tools)
+        self._qualified: Dict[str, ToolEntry] = {}
+        self._bare: Dict[str, ToolEntry] = {}
+        self._openai: Dict[str, ToolEntry] = {}
+
+        for tool in self._tools:
+            entry: ToolEntry = (tool.namespace, tool.name, tool)
+            self._qualified.setdefault(f"{tool.namespace}.{tool.name}", entry)
+
+            # the "default" namespace only mirrors real servers - never let it
+            # win a bare-name lookup
+            if tool.namespace == "default":
+                continue
+            self._bare.setdefault(tool.name, entry)
+            self._openai.setdefault(
+                ToolNameAdapter.to_openai_compatible(tool.namespace, tool.name), entry
+            )
+
+        self._signature: FrozenSet[Tuple[str, str]] = frozenset(
+            (t.namespace, t.name) for t in self._tools
+        )
+
+    # ------------------------------------------------------------------ #
+    # Lookup                                                             #
+    # ------------------------------------------------------------------ #
+    def resolve(self, tool_name: str) -> Optional[ToolEntry]:
+        """
+        Resolve *tool_name* in any of its supported spellings.
+
+        Returns ``None`` when the name is unknown to this snapshot.
+        """
+        return (
+            self._qualified.get(tool_name)
+            or self._bare.get(tool_name)
+            or self._openai.get(tool_name)
+        )
+
+    def namespace_for(self, tool_name: str) -> Optional[str]:
+        """Return only the namespace for *tool_name* (or ``None``)."""
+        entry = self.resolve(tool_name)
+        return entry[0] if entry else None
+
+    # ------------------------------------------------------------------ #
+    # Introspection                                                      #
+    # ------------------------------------------------------------------ #
+    @property
+    def tools(self) -> List[ToolInfo]:
+        """All tools in registry order, including the default namespace."""
+        return list(self._tools)
+
+    def matches(self, registry_items: Iterable[Tuple[str, str]]) -> bool:
+        """True if *registry_items* describes exactly the same tool set."""
+        return frozenset(registry_items) == self._signature
+
+    def __contains__(self, tool_name: object) -> bool:
+        return isinstance(tool_name, str) and self.resolve(tool_name) is not None
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def __repr__(self) -> str:
+        return f"ToolIndex(tools={len(self._tools)})"
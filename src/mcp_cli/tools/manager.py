@@ -8,25 +8,60 @@ leveraging the async-native capabilities of CHUK Tool Processor.
 from __future__ import annotations
 
 import asyncio
+import copy
 import json
 import logging
+import os
+import time
 import uuid
+from dataclasses import replace
 from typing import Any, Dict, List, Optional, Tuple, Union, AsyncIterator
 
-from chuk_tool_processor.mcp.setup_mcp_stdio import setup_mcp_stdio
-from chuk_tool_processor.core.processor import ToolProcessor
+from chuk_tool_processor.mcp.register_mcp_tools import register_mcp_tools
 from chuk_tool_processor.registry import ToolRegistryProvider
 from chuk_tool_processor.mcp.stream_manager import StreamManager
+from chuk_tool_processor.mcp.transport.models import MCPToolDefinition
 from chuk_tool_processor.models.tool_result import ToolResult
 from chuk_tool_processor.models.tool_call import ToolCall
 from chuk_tool_processor.execution.strategies.inprocess_strategy import InProcessStrategy
 from chuk_tool_processor.execution.tool_executor import ToolExecutor
 
-from mcp_cli.tools.models import ServerInfo, ToolCallResult, ToolInfo
+from mcp_cli.tools.models import ServerInfo, ServerStartup, ToolCallResult, ToolInfo
 from mcp_cli.tools.adapter import ToolNameAdapter
+from mcp_cli.tools.catalogue_snapshot import CatalogueSnapshot, config_hash, warm_start_enabled
+from mcp_cli.tools.index import ToolIndex
+from mcp_cli.tools.result_cache import CacheStats, ToolResultCache
+from mcp_cli.tools.result_store import (
+    DEFAULT_READ_LIMIT,
+    READ_TOOL_DEFINITION,
+    READ_TOOL_NAME,
+    READ_TOOL_NAMESPACE,
+    ResultStore,
+)
+from mcp_cli.tools.scheduler import LaneStats, ToolScheduler
+from mcp_cli.tools.server_streams import ServerStreams
+from mcp_cli.tools.serialization import ResultEncoder, format_tool_response
+from mcp_cli.tools.single_flight import SingleFlight
+from mcp_cli.config import (
+    load_scheduling_config,
+    load_server_configs,
+    load_single_flight_config,
+    load_startup_timeouts,
+    load_tool_cache_config,
+    load_tool_results_config,
+)
 
 logger = logging.getLogger(__name__)
 
+# Seconds a server may take to launch, handshake and list its tools
+DEFAULT_STARTUP_TIMEOUT = 60.0
+
+# Spellings under which the built-in ``result.read`` tool may be called
+_READ_TOOL_NAMES = frozenset({
+    f"{READ_TOOL_NAMESPACE}.{READ_TOOL_NAME}",
+    f"{READ_TOOL_NAMESPACE}_{READ_TOOL_NAME}",
+})
+
 
 class ToolManager:
     """
@@ -62,15 +97,54 @@ class ToolManager:
         self.tool_timeout = self._determine_timeout(tool_timeout)
         self.max_concurrency = max_concurrency
 
+        # Fair per-server admission control for every tool call
+        self.scheduler = ToolScheduler(global_limit=max_concurrency)
+
+        # Opt-in result cache; empty until ``toolCache`` config is loaded
+        self.result_cache = ToolResultCache()
+
+        # Identical concurrent calls share one execution (opt-in per tool)
+        self.single_flight = SingleFlight()
+
+        # Oversized results are kept on disk, readable via ``result.read``
+        self.result_store = ResultStore()
+
+        # Table format for record-list results (``toolResults.tableFormat``)
+        self.result_encoder = ResultEncoder()
+
         # CHUK components
-        self.processor: Optional[ToolProcessor] = None
-        self.stream_manager: Optional[StreamManager] = None
+        self.stream_manager: Optional[ServerStreams] = None
         
+        # Per-server startup progress; servers connect concurrently
+        self.server_startup: Dict[str, ServerStartup] = {}
+        self._startup_tasks: Dict[str, asyncio.Task] = {}
+        self._startup_lock = asyncio.Lock()
+        self._namespace = "stdio"
+        self._initial_startup_done = False
+
+        # Warm start: tools offered from the last run's snapshot until each
+        # server connects (``_snapshot_defs``), and tools a reconnected server
+        # no longer provides (``_retired_tools``, hidden from the catalogue)
+        self.catalogue_snapshot = CatalogueSnapshot()
+        self._server_hashes: Dict[str, str] = {}
+        self._snapshot_defs: Dict[str, List[MCPToolDefinition]] = {}
+        self._retired_tools: set = set()
+
         # Internal state
         self._registry = None
         self._executor: Optional[ToolExecutor] = None
         self._metadata_cache: Dict[Tuple[str, str], Any] = {}
 
+        # Tool catalogue: built once, served from cache until invalidated.
+        # The version only changes when the catalogue contents change.
+        # ``_tool_index`` is always derived from the latest catalogue.
+        self._catalogue: Optional[List[ToolInfo]] = None
+        self._catalogue_version: int = 0
+        self._tool_index: Optional[ToolIndex] = None
+
+        # Provider-adapted tool schemas keyed by (provider, catalogue version)
+        self._adapted_cache: Dict[Tuple[str, int], Tuple[List[Dict[str, Any]], Dict[str, str]]] = {}
+
     def _determine_timeout(self, explicit_timeout: Optional[float]) -> float:
         """
         Determine timeout with smart defaults and environment variable support.
@@ -95,22 +169,40 @@ class ToolManager:
         default_timeout = 120.0  # 2 minutes
         logger.info(f"Using default timeout: {default_timeout}s")
         return default_timeout
-    async def initialize(self, namespace: str = "stdio") -> bool:
-        """Connect to the MCP servers and populate the tool registry."""
+    async def initialize(self, namespace: str = "stdio", wait_for_all: bool = True) -> bool:
+        """
+        Connect to the MCP servers and populate the tool registry.
+
+        Every server is launched and handshaken concurrently with its own
+        timeout; a server that fails or times out is reported in
+        :meth:`get_server_info` without failing the others.
+
+        Args:
+            namespace: Registry namespace for the servers' tools
+            wait_for_all: Return once every server has started (or failed).
+                If False, return as soon as the first server is ready; the
+                remaining servers keep starting in the background and their
+                tools are added to the catalogue as they arrive.
+        """
         try:
-            # Set up CHUK Tool Processor
-            self.processor, self.stream_manager = await setup_mcp_stdio(
-                config_file=str(self.config_file),
-                servers=self.servers,
-                server_names=self.server_names,
-                namespace=namespace,
-                enable_caching=True,
-                enable_retries=True,
-                max_retries=3,
-            )
-            
+            self._namespace = namespace
+            self.stream_manager = ServerStreams(self.server_names)
+
             # Get the registry
             self._registry = await ToolRegistryProvider.get_registry()
+
+            # Per-server concurrency caps / priorities from the config file
+            limits, priorities = load_scheduling_config(str(self.config_file))
+            self.scheduler.configure(limits, priorities)
+            self.result_cache = ToolResultCache.from_config(
+                load_tool_cache_config(str(self.config_file))
+            )
+            self.single_flight = SingleFlight.from_config(
+                load_single_flight_config(str(self.config_file))
+            )
+            results_config = load_tool_results_config(str(self.config_file))
+            self.result_store = ResultStore.from_config(results_config)
+            self.result_encoder = ResultEncoder.from_config(results_config)
             
             # Initialize the executor with configurable timeout
             strategy = InProcessStrategy(
@@ -124,6 +216,12 @@ class ToolManager:
                 strategy=strategy,
                 default_timeout=self.tool_timeout
             )
+
+            await self._start_servers(wait_for_all)
+            self._initial_startup_done = True
+
+            # Load the catalogue once so discovery and name resolution are cached
+            await self.refresh_tool_index()
             
             logger.info(f"ToolManager initialized successfully with {self.tool_timeout}s timeout")
             return True
@@ -131,8 +229,199 @@ class ToolManager:
             logger.error(f"Error initializing tool manager: {exc}")
             return False
 
+    # ------------------------------------------------------------------ #
+    # Server startup                                                     #
+    # ------------------------------------------------------------------ #
+    def _startup_timeouts(self) -> Dict[str, float]:
+        default = DEFAULT_STARTUP_TIMEOUT
+        env = os.getenv("MCP_SERVER_STARTUP_TIMEOUT")
+        if env:
+            try:
+                default = float(env)
+            except ValueError:
+                logger.warning(f"Invalid MCP_SERVER_STARTUP_TIMEOUT: {env}")
+        configured = load_startup_timeouts(str(self.config_file))
+        return {name: configured.get(name, default) for name in self.servers}
+
+    async def _start_servers(self, wait_for_all: bool) -> None:
+        """Start every configured server concurrently."""
+        timeouts = self._startup_timeouts()
+        self.server_startup = {
+            name: ServerStartup(id=idx, name=name) for idx, name in enumerate(self.servers)
+        }
+        configs = load_server_configs(str(self.config_file))
+        self._server_hashes = {
+            name: config_hash(configs[name]) for name in self.servers if name in configs
+        }
+        warm = not wait_for_all and await self._load_snapshots()
+        self._startup_tasks = {
+            name: asyncio.create_task(self._start_server(idx, name, timeouts[name]))
+            for idx, name in enumerate(self.servers)
+        }
+        if not self._startup_tasks:
+            return
+
+        if wait_for_all:
+            await asyncio.gather(*self._startup_tasks.values())
+        elif not warm:
+            for next_done in asyncio.as_completed(self._startup_tasks.values()):
+                if await next_done:
+                    break
+
+        pending = sum(1 for s in self.server_startup.values() if s.status == "starting")
+        if pending:
+            logger.info(f"{pending} server(s) still starting in the background")
+
+    async def _load_snapshots(self) -> bool:
+        """
+        Offer the tools of the last run's snapshot for every server whose
+        configuration is unchanged.
+
+        Returns:
+            True if at least one server's tools were loaded
+        """
+        if not warm_start_enabled():
+            return False
+
+        sm = self.stream_manager
+        for name, server_hash in self._server_hashes.items():
+            tools = self.catalogue_snapshot.load(name, server_hash)
+            if not tools:
+                continue
+            try:
+                defs = [MCPToolDefinition.model_validate(t) for t in tools]
+            except Exception as exc:
+                logger.warning(f"Ignoring invalid tool snapshot for {name}: {exc}")
+                continue
+            self._snapshot_defs[name] = defs
+            sm.offer(name, defs)
+            self._unretire(defs)
+
+        if not self._snapshot_defs:
+            return False
+        await register_mcp_tools(sm, namespace=self._namespace)
+        logger.debug(f"Warm start: tools of {len(self._snapshot_defs)} server(s) loaded from snapshot")
+        return True
+
+    def _unretire(self, tools: List[MCPToolDefinition]) -> None:
+        """Show *tools* in the catalogue again (a server provides them)."""
+        for tool in tools:
+            self._retired_tools.discard((self._namespace, tool.name))
+
+    def _drop_snapshot(self, name: str) -> bool:
+        """
+        Withdraw the snapshot tools of *name*.
+
+        Returns:
+            True if the server had snapshot tools
+        """
+        if self._snapshot_defs.pop(name, None) is None:
+            return False
+        for tool_name in self.stream_manager.withdraw(name):
+            self._retired_tools.add((self._namespace, tool_name))
+        return True
+
+    async def _start_server(self, idx: int, name: str, timeout: float) -> bool:
+        """Launch one server in its own ``StreamManager`` and add it to ``stream_manager``."""
+        state = self.server_startup[name]
+        started = time.perf_counter()
+        try:
+            server_manager = await asyncio.wait_for(
+                StreamManager.create(
+                    config_file=str(self.config_file),
+                    servers=[name],
+                    server_names={0: name},
+                    transport_type="stdio",
+                    default_timeout=10.0,
+                    initialization_timeout=timeout,
+                ),
+                timeout=timeout,
+            )
+            if name not in server_manager.transports:
+                raise RuntimeError("server did not start (see log for details)")
+            await self._add_server(idx, name, server_manager)
+        except asyncio.CancelledError:
+            state.status = "failed"
+            state.error = "cancelled"
+            raise
+        except Exception as exc:
+            state.status = "failed"
+            state.error = "timed out" if isinstance(exc, asyncio.TimeoutError) else str(exc)
+            state.startup_time = time.perf_counter() - started
+            logger.warning(f"Server '{name}' failed to start: {state.error}")
+            async with self._startup_lock:
+                if self._drop_snapshot(name) and self._initial_startup_done:
+                    # its snapshot tools cannot be called after all
+                    await self.refresh_tool_index()
+            return False
+
+        state.status = "ready"
+        state.startup_time = time.perf_counter() - started
+        logger.info(f"Server '{name}' ready in {state.startup_time:.2f}s ({state.tool_count} tools)")
+        return True
+
+    async def _add_server(self, idx: int, name: str, server_manager: StreamManager) -> None:
+        """Route a freshly started server's tools through ``stream_manager``."""
+        async with self._startup_lock:
+            sm = self.stream_manager
+            live = [t.model_dump() for t in server_manager.all_tools]
+            snapshot = self._snapshot_defs.pop(name, None)
+            changed = snapshot is None or [t.model_dump() for t in snapshot] != live
+
+            # the live tool list replaces whatever the snapshot offered
+            for tool_name in sm.add(idx, name, server_manager):
+                self._retired_tools.add((self._namespace, tool_name))
+            self._unretire(server_manager.all_tools)
+            self.server_startup[name].tool_count = len(server_manager.all_tools)
+
+            if not changed:
+                logger.debug(f"Server '{name}' matches its tool snapshot")
+                return
+
+            if name in self._server_hashes:
+                self.catalogue_snapshot.save(name, self._server_hashes[name], live)
+            await register_mcp_tools(sm, namespace=self._namespace)
+            if self._initial_startup_done:
+                # a late server: make its tools visible to the next request
+                self.invalidate_tool_catalogue(self._namespace)
+                await self.refresh_tool_index()
+
+    async def _await_server_for(self, base_name: str) -> Optional[str]:
+        """
+        Wait for the server that owns *base_name* if it is still starting
+        (its tool was offered from the warm-start snapshot).
+
+        Returns:
+            An error message if that server failed to start, else None
+        """
+        if not self.stream_manager or not self._startup_tasks:
+            return None
+        server = self.stream_manager.tool_to_server_map.get(base_name)
+        task = self._startup_tasks.get(server) if server else None
+        if task is None:
+            return None
+        if not task.done():
+            logger.debug(f"Waiting for server '{server}' to finish starting")
+            await asyncio.wait([task])
+        state = self.server_startup.get(server)
+        if state is not None and state.status == "failed":
+            return f"Server '{server}' is unavailable: {state.error}"
+        return None
+
+    async def wait_for_servers(self, timeout: Optional[float] = None) -> None:
+        """Wait until every server has finished starting (ready or failed)."""
+        pending = [t for t in self._startup_tasks.values() if not t.done()]
+        if pending:
+            await asyncio.wait(pending, timeout=timeout)
+
     async def close(self):
         """Close all resources and connections."""
+        for task in self._startup_tasks.values():
+            if not task.done():
+                task.cancel()
+        if self._startup_tasks:
+            await asyncio.gather(*self._startup_tasks.values(), return_exceptions=True)
+
         try:
             # Close the stream manager
             if self.stream_manager:
@@ -170,43 +459,106 @@ class ToolManager:
         """Return all tools including duplicates."""
         if not self._registry:
             return []
-            
-        tools: List[ToolInfo] = []
-        registry_items = await self._registry.list_tools()
-        
-        for ns, name in registry_items:
-            metadata = await self._registry.get_metadata(name, ns)
-            if metadata:
-                # Cache metadata for future use
-                self._metadata_cache[(ns, name)] = metadata
-                
-                # Extract tool properties
-                supports_streaming = getattr(metadata, "supports_streaming", False)
-                tools.append(
-                    ToolInfo(
-                        name=name,
-                        namespace=ns,
-                        description=metadata.description,
-                        parameters=metadata.argument_schema,
-                        is_async=metadata.is_async,
-                        tags=list(metadata.tags),
-                        supports_streaming=supports_streaming
-                    )
-                )
-            else:
-                # Include tools even without metadata
-                tools.append(
-                    ToolInfo(
-                        name=name,
-                        namespace=ns,
-                        description="",
-                        parameters={},
-                        is_async=False,
-                        tags=[],
-                        supports_streaming=False
-                    )
-                )
-        return tools
+
+        if self._catalogue is None:
+            await self._load_catalogue()
+        return list(self._catalogue)
+
+    @property
+    def catalogue_version(self) -> int:
+        """Monotonic counter bumped whenever the tool catalogue changes."""
+        return self._catalogue_version
+
+    def invalidate_tool_catalogue(self, namespace: Optional[str] = None) -> None:
+        """
+        Drop the cached catalogue so the next lookup reloads it.
+
+        Args:
+            namespace: Only forget cached metadata for this server (e.g. after
+                it reconnected). ``None`` forgets metadata for every server.
+        """
+        if namespace is None:
+            self._metadata_cache.clear()
+        else:
+            for key in [k for k in self._metadata_cache if k[0] == namespace]:
+                del self._metadata_cache[key]
+
+        # the old index is kept only to detect whether the reload changed anything
+        self._catalogue = None
+        logger.debug(f"Tool catalogue invalidated ({namespace or 'all servers'})")
+
+    async def _registry_items(self) -> List[Tuple[str, str]]:
+        """Registered ``(namespace, name)`` pairs, minus tools no server provides any more."""
+        items = list(await self._registry.list_tools())
+        if self._retired_tools:
+            items = [key for key in items if tuple(key) not in self._retired_tools]
+        return items
+
+    async def _load_catalogue(self) -> None:
+        """
+        (Re)build the catalogue from the registry.
+
+        Metadata already in ``_metadata_cache`` is reused; everything else is
+        fetched concurrently.
+        """
+        registry_items = await self._registry_items()
+
+        missing = [key for key in registry_items if key not in self._metadata_cache]
+        if missing:
+            fetched = await asyncio.gather(
+                *(self._registry.get_metadata(name, ns) for ns, name in missing),
+                return_exceptions=True,
+            )
+            for (ns, name), metadata in zip(missing, fetched):
+                if isinstance(metadata, Exception):
+                    logger.warning(f"Error fetching metadata for {ns}.{name}: {metadata}")
+                    continue
+                if metadata:
+                    self._metadata_cache[(ns, name)] = metadata
+
+        # Forget metadata for tools that are no longer registered
+        live = set(registry_items)
+        for key in [k for k in self._metadata_cache if k not in live]:
+            del self._metadata_cache[key]
+
+        # Include tools even without metadata
+        tools = [
+            self._build_tool_info(ns, name, self._metadata_cache.get((ns, name)))
+            for ns, name in registry_items
+        ]
+
+        previous = self._tool_index.tools if self._tool_index is not None else None
+        if tools != previous:
+            self._catalogue_version += 1
+        self._catalogue = tools
+        self._tool_index = ToolIndex(tools)
+        logger.debug(
+            f"Tool catalogue loaded: {len(tools)} tools, "
+            f"{len(missing)} metadata fetched, version {self._catalogue_version}"
+        )
+
+    @staticmethod
+    def _build_tool_info(namespace: str, name: str, metadata: Any) -> ToolInfo:
+        """Convert registry metadata (possibly ``None``) into a ToolInfo."""
+        if not metadata:
+            return ToolInfo(
+                name=name,
+                namespace=namespace,
+                description="",
+                parameters={},
+                is_async=False,
+                tags=[],
+                supports_streaming=False
+            )
+        return ToolInfo(
+            name=name,
+            namespace=namespace,
+            description=metadata.description,
+            parameters=metadata.argument_schema,
+            is_async=metadata.is_async,
+            tags=list(metadata.tags),
+            supports_streaming=getattr(metadata, "supports_streaming", False)
+        )
 
     async def get_unique_tools(self) -> List[ToolInfo]:
         """Return tools without duplicates from the default namespace."""
@@ -228,27 +580,77 @@ class ToolManager:
             return None
 
         if namespace:  # explicit ns
-            metadata = await self._registry.get_metadata(tool_name, namespace)
+            metadata = self._metadata_cache.get((namespace, tool_name))
+            if metadata is None:
+                metadata = await self._registry.get_metadata(tool_name, namespace)
             if metadata:
-                supports_streaming = getattr(metadata, "supports_streaming", False)
-                return ToolInfo(
-                    name=tool_name,
-                    namespace=namespace,
-                    description=metadata.description,
-                    parameters=metadata.argument_schema,
-                    is_async=metadata.is_async,
-                    tags=list(metadata.tags),
-                    supports_streaming=supports_streaming
-                )
+                return self._build_tool_info(namespace, tool_name, metadata)
 
-        # otherwise search all non-default namespaces
-        registry_items = await self._registry.list_tools()
-        for ns, name in registry_items:
-            if name == tool_name and ns != "default":
-                return await self.get_tool_by_name(name, ns)
+        # otherwise resolve against the non-default namespaces in the index
+        entry = await self._lookup_tool(tool_name)
+        if entry and entry[0] != "default":
+            return entry[2]
                 
         return None
 
+    # ------------------------------------------------------------------ #
+    # Tool index                                                         #
+    # ------------------------------------------------------------------ #
+    async def refresh_tool_index(self) -> Optional[ToolIndex]:
+        """
+        Re-list the registry and rebuild the catalogue and index.
+
+        Cached metadata is kept, so only newly registered tools are fetched.
+        """
+        if not self._registry:
+            self._catalogue = None
+            self._tool_index = None
+            return None
+
+        await self._load_catalogue()
+        return self._tool_index
+
+    async def get_tool_index(self) -> Optional[ToolIndex]:
+        """Return the current tool index, building it on first use."""
+        if self._catalogue is None and self._registry:
+            await self._load_catalogue()
+        return self._tool_index
+
+    async def _lookup_tool(self, tool_name: str) -> Optional[Tuple[str, str, ToolInfo]]:
+        """
+        Resolve *tool_name* via the index.
+
+        A miss triggers a single registry listing; the index is rebuilt only
+        if the registry's tool set actually changed since the last snapshot.
+        """
+        index = await self.get_tool_index()
+        if index is None:
+            return None
+
+        entry = index.resolve(tool_name)
+        if entry is None and not index.matches(await self._registry_items()):
+            index = await self.refresh_tool_index()
+            entry = index.resolve(tool_name) if index else None
+        return entry
+
+    async def _resolve_tool(self, tool_name: str) -> Tuple[Optional[str], str]:
+        """Return ``(namespace, base_name)`` for any supported spelling of a tool."""
+        if tool_name in _READ_TOOL_NAMES:
+            return READ_TOOL_NAMESPACE, READ_TOOL_NAME
+
+        entry = await self._lookup_tool(tool_name)
+        if entry:
+            return entry[0], entry[1]
+
+        if "." in tool_name:
+            namespace, base_name = tool_name.split(".", 1)
+            return namespace, base_name
+
+        # Fallback to stream-manager map
+        if self.stream_manager:
+            return self.stream_manager.get_server_for_tool(tool_name), tool_name
+        return None, tool_name
+
     # ------------------------------------------------------------------ #
     # Tool execution methods                                             #
     # ------------------------------------------------------------------ #
@@ -264,46 +666,196 @@ class ToolManager:
         Returns:
             ToolCallResult with success status and result/error
         """
-        # Get namespace if needed
-        namespace = None
-        original_name = tool_name
-        
-        if "." in tool_name:
-            namespace, base_name = tool_name.split(".", 1)
-        else:
-            base_name = tool_name
-            namespace = await self.get_server_for_tool(tool_name)
-        
-        # Create a CHUK ToolCall with optional timeout override
-        call = ToolCall(
-            tool=base_name,
-            namespace=namespace,
-            arguments=arguments,
-            timeout=timeout or self.tool_timeout  # Use override or default
-        )
-        
+        namespace, base_name = await self._resolve_tool(tool_name)
+        return await self._execute_resolved(tool_name, namespace, base_name, arguments, timeout)
+
+    async def execute_tools(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        timeout: Optional[float] = None,
+    ) -> List[ToolCallResult]:
+        """
+        Execute several tools as one batch.
+
+        Args:
+            calls: ``(tool_name, arguments)`` pairs
+            timeout: Optional timeout override for every call in the batch
+
+        Returns:
+            One ToolCallResult per call, in submission order
+        """
+        results: List[Optional[ToolCallResult]] = [None] * len(calls)
+        async for idx, result in self.stream_execute_tools(calls, timeout):
+            results[idx] = result
+        return results  # type: ignore[return-value]
+
+    async def stream_execute_tools(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[int, ToolCallResult]]:
+        """
+        Execute several tools as one batch, yielding results as they complete.
+
+        Every call of the batch is submitted at once; the :class:`ToolScheduler`
+        decides when each may start, applying the global ``max_concurrency``
+        plus any per-server caps and priorities fairly across servers.
+
+        Args:
+            calls: ``(tool_name, arguments)`` pairs
+            timeout: Optional timeout override for every call in the batch
+            max_concurrency: Optional cap on calls of *this* batch running at
+                once, applied on top of the scheduler's limits
+
+        Yields:
+            ``(index, ToolCallResult)`` tuples in completion order; *index*
+            refers to the position in *calls*. Every call yields exactly once.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        fan_out = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def run(idx: int, tool_name: str, arguments: Dict[str, Any]) -> Tuple[int, ToolCallResult]:
+            namespace, base_name = await self._resolve_tool(tool_name)
+            if fan_out is None:
+                return idx, await self._execute_resolved(tool_name, namespace, base_name, arguments, timeout)
+            async with fan_out:
+                return idx, await self._execute_resolved(tool_name, namespace, base_name, arguments, timeout)
+
+        tasks = [
+            asyncio.create_task(run(idx, tool_name, arguments))
+            for idx, (tool_name, arguments) in enumerate(calls)
+        ]
         try:
-            # Execute with CHUK executor
-            results = await self._executor.execute([call])
-            
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _execute_resolved(
+        self,
+        tool_name: str,
+        namespace: Optional[str],
+        base_name: str,
+        arguments: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> ToolCallResult:
+        """
+        Run one resolved call.
+
+        Order of checks: result cache, then join an identical in-flight call
+        (single-flight), then wait for a scheduler slot and execute.
+        """
+        if namespace == READ_TOOL_NAMESPACE and base_name == READ_TOOL_NAME:
+            return self._read_stored_result(tool_name, arguments)
+
+        lane = self._lane_for(namespace, base_name)
+
+        ttl = self.result_cache.ttl_for(namespace, base_name, lane)
+        coalesce = self.single_flight.applies(namespace, base_name, lane, idempotent=ttl is not None)
+
+        key = None
+        if ttl is not None or coalesce:
+            key = self.result_cache.make_key(namespace, base_name, arguments)
+        if ttl is not None:
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                logger.debug(f"Tool result cache hit for {tool_name}")
+                return replace(cached, tool_name=tool_name, execution_time=0.0)
+
+        async def dispatch() -> ToolCallResult:
+            unavailable = await self._await_server_for(base_name)
+            if unavailable:
+                return ToolCallResult(tool_name, False, error=unavailable)
+
+            call = ToolCall(
+                tool=base_name,
+                namespace=namespace,
+                arguments=arguments,
+                timeout=timeout or self.tool_timeout,  # Use override or default
+            )
+            try:
+                # Execute with CHUK executor once the scheduler admits the call
+                async with self.scheduler.slot(lane):
+                    results = await self._executor.execute([call])
+            except Exception as exc:
+                logger.error(f"Error executing tool {tool_name}: {exc}")
+                return ToolCallResult(tool_name, False, error=str(exc))
+
             if not results:
-                return ToolCallResult(original_name, False, error="No result returned")
-                
-            # Extract result from first call
-            result = results[0]
-            return ToolCallResult(
-                tool_name=original_name,
-                success=not bool(result.error),
-                result=result.result,
-                error=result.error,
-                execution_time=(
-                    (result.end_time - result.start_time).total_seconds() 
-                    if hasattr(result, "end_time") and hasattr(result, "start_time") else None
-                ),
+                return ToolCallResult(tool_name, False, error="No result returned")
+
+            result = self._to_call_result(tool_name, results[0])
+            if ttl is not None:
+                self.result_cache.put(key, namespace, base_name, result, ttl)
+            return result
+
+        if not coalesce:
+            return await dispatch()
+
+        result = await self.single_flight.run(key, dispatch)
+        return result if result.tool_name == tool_name else replace(result, tool_name=tool_name)
+
+    def _read_stored_result(self, tool_name: str, arguments: Dict[str, Any]) -> ToolCallResult:
+        """Built-in ``result.read``: one page of a spilled result."""
+        try:
+            page = self.result_store.read(
+                str(arguments.get("handle", "")),
+                arguments.get("offset", 0) or 0,
+                arguments.get("limit", DEFAULT_READ_LIMIT) or DEFAULT_READ_LIMIT,
             )
-        except Exception as exc:
-            logger.error(f"Error executing tool {original_name}: {exc}")
-            return ToolCallResult(original_name, False, error=str(exc))
+        except FileNotFoundError:
+            return ToolCallResult(tool_name, False, error=f"Unknown or expired result handle: {arguments.get('handle')}")
+        except (TypeError, ValueError, OSError) as exc:
+            return ToolCallResult(tool_name, False, error=str(exc))
+        return ToolCallResult(tool_name, True, result=page, execution_time=0.0)
+
+    def spill_result(self, tool_name: str, content: str) -> str:
+        """
+        Return *content*, or a head/tail preview with a ``result.read`` handle
+        if it is too large to keep in the conversation.
+
+        ``result.read`` pages are never spilled: JSON escaping can push a page
+        past the inline limit, and spilling it again would make it unreadable.
+        """
+        if tool_name in _READ_TOOL_NAMES:
+            return content
+        spilled = self.result_store.spill(tool_name, content)
+        return spilled.preview if spilled else content
+
+    def format_result(self, content: Any, provider: Optional[str] = None) -> str:
+        """Serialize a raw tool result using the table format configured for *provider*."""
+        return self.result_encoder.encode(content, provider)
+
+    def get_cache_stats(self) -> CacheStats:
+        """Hit / miss / size counters of the tool result cache."""
+        return self.result_cache.stats()
+
+    def clear_result_cache(self, tool_name: Optional[str] = None) -> int:
+        """Drop cached tool results (all, or only those of *tool_name*)."""
+        if tool_name is None:
+            return self.result_cache.clear()
+        if "." in tool_name:
+            namespace, name = tool_name.split(".", 1)
+            return self.result_cache.clear(tool=name, namespace=namespace)
+        return self.result_cache.clear(tool=tool_name)
+
+    @staticmethod
+    def _to_call_result(tool_name: str, result: ToolResult) -> ToolCallResult:
+        """Convert a CHUK ToolResult into a ToolCallResult."""
+        return ToolCallResult(
+            tool_name=tool_name,
+            success=not bool(result.error),
+            result=result.result,
+            error=result.error,
+            execution_time=(
+                (result.end_time - result.start_time).total_seconds() 
+                if hasattr(result, "end_time") and hasattr(result, "start_time") else None
+            ),
+        )
 
     async def stream_execute_tool(self, tool_name: str, arguments: Dict[str, Any], timeout: Optional[float] = None) -> AsyncIterator[ToolResult]:
         """
@@ -317,14 +869,7 @@ class ToolManager:
         Returns:
             Async iterator of ToolResult objects
         """
-        # Get namespace if needed
-        namespace = None
-        
-        if "." in tool_name:
-            namespace, base_name = tool_name.split(".", 1)
-        else:
-            base_name = tool_name
-            namespace = await self.get_server_for_tool(tool_name)
+        namespace, base_name = await self._resolve_tool(tool_name)
         
         # Create a CHUK ToolCall with optional timeout override
         call = ToolCall(
@@ -335,8 +880,50 @@ class ToolManager:
         )
         
         # Stream execution results
-        async for result in self._executor.stream_execute([call]):
-            yield result
+        async with self.scheduler.slot(self._lane_for(namespace, base_name)):
+            async for result in self._executor.stream_execute([call]):
+                yield result
+
+    async def _execute_scheduled(self, call: ToolCall) -> ToolResult:
+        """Run one prepared CHUK call in its scheduler lane."""
+        try:
+            async with self.scheduler.slot(self._lane_for(call.namespace, call.tool)):
+                results = await self._executor.execute([call])
+        except Exception as exc:
+            logger.error(f"Error executing tool {call.tool}: {exc}")
+            return ToolResult(tool=call.tool, result=None, error=str(exc))
+        if not results:
+            return ToolResult(tool=call.tool, result=None, error="No result returned")
+        return results[0]
+
+    async def _stream_scheduled(self, calls: List[ToolCall]) -> AsyncIterator[Tuple[ToolCall, ToolResult]]:
+        """Stream several prepared calls concurrently, each in its scheduler lane."""
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def run(call: ToolCall) -> None:
+            try:
+                async with self.scheduler.slot(self._lane_for(call.namespace, call.tool)):
+                    async for result in self._executor.stream_execute([call]):
+                        await queue.put((call, result))
+            except Exception as exc:
+                logger.error(f"Error executing tool {call.tool}: {exc}")
+                await queue.put((call, ToolResult(tool=call.tool, result=None, error=str(exc))))
+            finally:
+                await queue.put(None)  # this call is finished
+
+        tasks = [asyncio.create_task(run(call)) for call in calls]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await queue.get()
+                if item is None:
+                    remaining -= 1
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
 
     async def process_tool_calls(
         self,
@@ -374,13 +961,7 @@ class ToolManager:
             args_dict = json.loads(args_str) if isinstance(args_str, str) else args_str
             
             # Get namespace and base name
-            namespace = None
-            base_name = original_name
-            
-            if "." in original_name:
-                namespace, base_name = original_name.split(".", 1)
-            else:
-                namespace = await self.get_server_for_tool(base_name)
+            namespace, base_name = await self._resolve_tool(original_name)
             
             # Create CHUK ToolCall
             call = ToolCall(
@@ -410,13 +991,13 @@ class ToolManager:
                     ],
                 })
         
-        # Execute tool calls
-        results = await self._executor.execute(chuk_calls)
+        # Execute tool calls, each once the scheduler admits it
+        results = await asyncio.gather(*(self._execute_scheduled(call) for call in chuk_calls))
         
         # Process results
-        for result in results:
+        for call, result in zip(chuk_calls, results):
             # Get original info from mapping
-            call_info = call_mapping.get(id(result.tool_call), {"id": f"call_{uuid.uuid4().hex[:8]}", "name": result.tool})
+            call_info = call_mapping[id(call)]
             call_id = call_info["id"]
             original_name = call_info["name"]
             
@@ -425,7 +1006,7 @@ class ToolManager:
                 if result.error:
                     content = f"Error: {result.error}"
                 else:
-                    content = self.format_tool_response(result.result)
+                    content = self.spill_result(original_name, self.format_result(result.result))
                     
                 conversation_history.append({
                     "role": "tool",
@@ -475,13 +1056,7 @@ class ToolManager:
             args_dict = json.loads(args_str) if isinstance(args_str, str) else args_str
             
             # Get namespace and base name
-            namespace = None
-            base_name = original_name
-            
-            if "." in original_name:
-                namespace, base_name = original_name.split(".", 1)
-            else:
-                namespace = await self.get_server_for_tool(base_name)
+            namespace, base_name = await self._resolve_tool(original_name)
             
             # Create CHUK ToolCall
             call = ToolCall(
@@ -514,10 +1089,10 @@ class ToolManager:
         # Collect final responses for conversation history
         final_responses = {}
         
-        # Stream execution
-        async for result in self._executor.stream_execute(chuk_calls):
+        # Stream execution: each call streams once the scheduler admits it
+        async for call, result in self._stream_scheduled(chuk_calls):
             # Get original info from mapping
-            call_info = call_mapping.get(id(result.tool_call), {"id": f"call_{uuid.uuid4().hex[:8]}", "name": result.tool})
+            call_info = call_mapping[id(call)]
             call_id = call_info["id"]
             original_name = call_info["name"]
             
@@ -527,7 +1102,7 @@ class ToolManager:
                 if result.error:
                     content = f"Error: {result.error}"
                 else:
-                    content = self.format_tool_response(result.result)
+                    content = self.spill_result(original_name, self.format_result(result.result))
                     
                 final_responses[call_id] = {
                     "role": "tool",
@@ -552,40 +1127,58 @@ class ToolManager:
         return server_name.split("_", 1)[0] if "_" in server_name else server_name
 
     async def get_server_info(self) -> List[ServerInfo]:
-        """Get information about all connected servers."""
+        """Get information about all configured servers, including ones still starting."""
         if not self.stream_manager:
             return []
             
         infos: List[ServerInfo] = []
+        seen = set()
         for raw in self.stream_manager.get_server_info():
+            name = raw.get("name", "Unknown")
+            startup = self.server_startup.get(name)
+            seen.add(name)
             infos.append(
                 ServerInfo(
                     id=raw.get("id", 0),
-                    name=raw.get("name", "Unknown"),
+                    name=name,
                     status=raw.get("status", "Unknown"),
                     tool_count=raw.get("tools", 0),
-                    namespace=self._extract_namespace(raw.get("name", "")),
+                    namespace=self._extract_namespace(name),
+                    startup_time=startup.startup_time if startup else None,
                 )
             )
-        return infos
+        for startup in self.server_startup.values():
+            if startup.name not in seen:
+                infos.append(
+                    ServerInfo(
+                        id=startup.id,
+                        name=startup.name,
+                        status=startup.status,
+                        tool_count=0,
+                        namespace=self._extract_namespace(startup.name),
+                        startup_time=startup.startup_time,
+                    )
+                )
+        return sorted(infos, key=lambda info: info.id)
+
+    def _lane_for(self, namespace: Optional[str], base_name: str) -> str:
+        """Scheduling lane for a tool: its owning server, else its namespace."""
+        server = None
+        if self.stream_manager and hasattr(self.stream_manager, "get_server_for_tool"):
+            try:
+                server = self.stream_manager.get_server_for_tool(base_name)
+            except Exception:
+                server = None
+        return server or namespace or "default"
+
+    def get_scheduler_stats(self) -> Dict[str, LaneStats]:
+        """Queue depth, concurrency and wait-time statistics per server."""
+        return self.scheduler.get_stats()
 
     async def get_server_for_tool(self, tool_name: str) -> Optional[str]:
         """Get the server name for a tool."""
-        if "." in tool_name:
-            return tool_name.split(".", 1)[0]
-            
-        # Look up via registry
-        if self._registry:
-            registry_items = await self._registry.list_tools()
-            for ns, name in registry_items:
-                if name == tool_name and ns != "default":
-                    return ns
-                
-        # Fallback to stream-manager map
-        if self.stream_manager:
-            return self.stream_manager.get_server_for_tool(tool_name)
-            
-        return None
+        namespace, _ = await self._resolve_tool(tool_name)
+        return namespace
 
     # ------------------------------------------------------------------ #
     # LLM helpers                                                        #
@@ -613,54 +1206,71 @@ class ToolManager:
         Get tools in a format compatible with the specified LLM provider.
         
         For OpenAI, ensure tool names follow the required pattern: ^[a-zA-Z0-9_-]+$
+
+        Results are memoised per ``(provider, catalogue_version)``, so switching
+        back and forth between providers does not rebuild anything.  Callers
+        get their own copy and may modify it freely.
         """
+        llm_tools, name_mapping = await self._get_adapted_entry(provider)
+        return copy.deepcopy(llm_tools), dict(name_mapping)
+
+    async def _get_adapted_entry(
+        self, provider: str
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+        """Return the cached ``(llm_tools, name_mapping)`` for *provider*."""
         unique_tools = await self.get_unique_tools()
-        adapter_needed = provider.lower() == "openai"
+        key = (provider.lower(), self._catalogue_version)
 
+        cached = self._adapted_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Entries for older catalogue versions can never be hit again
+        for stale in [k for k in self._adapted_cache if k[1] != self._catalogue_version]:
+            del self._adapted_cache[stale]
+
+        adapter_needed = key[0] == "openai"
         llm_tools: List[Dict[str, Any]] = []
         name_mapping: Dict[str, str] = {}
 
-        print(f"[DEBUG] Adapting {len(unique_tools)} tools for provider: {provider}, adapter_needed: {adapter_needed}")
-
         for tool in unique_tools:
             original = f"{tool.namespace}.{tool.name}"
-            
+
             if adapter_needed:
-                # Import regex for sanitization
-                import re
-                
                 # For OpenAI, replace dots with underscores and sanitize other chars
-                # First combine namespace and name with underscore (e.g., stdio_list_tables)
-                combined = f"{tool.namespace}_{tool.name}"
-                
-                # Then sanitize to ensure it matches OpenAI's pattern
-                sanitized = re.sub(r'[^a-zA-Z0-9_-]', '_', combined)
-                
-                name_mapping[sanitized] = original
-                description = f"{tool.description or ''}"
-                tool_name = sanitized
-                
-                # Debug logging
-                print(f"[DEBUG] Tool adapted: {original} -> {sanitized}")
+                # (e.g. stdio.list_tables -> stdio_list_tables)
+                tool_name = ToolNameAdapter.to_openai_compatible(tool.namespace, tool.name)
+                name_mapping[tool_name] = original
             else:
                 tool_name = original
-                description = tool.description or ""
-                print(f"[DEBUG] Tool not sanitized: {original}")
 
             llm_tools.append({
                 "type": "function", 
                 "function": {
                     "name": tool_name,
-                    "description": description,
+                    "description": tool.description or "",
                     "parameters": tool.parameters or {}
                 }
             })
 
-        # Print full tools list for debugging
-        print(f"[DEBUG] Adapted tools: {[t['function']['name'] for t in llm_tools]}")
-        print(f"[DEBUG] Name mapping: {name_mapping}")
+        if self.result_store.enabled:
+            # Built-in pager for results that were spilled to disk
+            original = f"{READ_TOOL_NAMESPACE}.{READ_TOOL_NAME}"
+            if adapter_needed:
+                tool_name = ToolNameAdapter.to_openai_compatible(READ_TOOL_NAMESPACE, READ_TOOL_NAME)
+                name_mapping[tool_name] = original
+            else:
+                tool_name = original
+            llm_tools.append({"type": "function", "function": {"name": tool_name, **READ_TOOL_DEFINITION}})
+
+        entry = (llm_tools, name_mapping)
+        self._adapted_cache[key] = entry
 
-        return llm_tools, name_mapping
+        logger.debug(
+            f"Adapted {len(llm_tools)} tools for provider {provider} "
+            f"(adapter_needed={adapter_needed}, catalogue v{self._catalogue_version})"
+        )
+        return entry
 
     # ------------------------------------------------------------------ #
     # Formatting helpers                                                 #
@@ -669,26 +1279,11 @@ class ToolManager:
     def format_tool_response(response_content: Union[List[Dict[str, Any]], Any]) -> str:
         """
         Format the response content from a tool in a way that's suitable for LLM consumption.
+
+        Record lists are returned as pretty-printed JSON; use :meth:`format_result`
+        for the configured compact table format.
         """
-        # Handle list of dictionaries (likely structured data like SQL results)
-        if isinstance(response_content, list) and response_content and isinstance(response_content[0], dict):
-            # Treat as text records only if every item has type == "text"
-            if all(isinstance(item, dict) and item.get("type") == "text" for item in response_content):
-                return "\n".join(item.get("text", "") for item in response_content)
-            # This could be data records (like SQL results)
-            try:
-                return json.dumps(response_content, indent=2)
-            except Exception:
-                return str(response_content)
-        elif isinstance(response_content, dict):
-            # Single dictionary - return as JSON
-            try:
-                return json.dumps(response_content, indent=2)
-            except Exception:
-                return str(response_content)
-        else:
-            # Default case - convert to string
-            return str(response_content)
+        return format_tool_response(response_content)
 
     # ------------------------------------------------------------------ #
     # Legacy methods (for backward compatibility with imports)           #
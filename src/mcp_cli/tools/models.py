@@ -29,6 +29,18 @@ class ServerInfo:
     status: str
     tool_count: int
     namespace: str
+    startup_time: Optional[float] = None  # seconds until ready (or failed)
+
+
+@dataclass
+class ServerStartup:
+    """Startup progress of one configured server."""
+    id: int
+    name: str
+    status: str = "starting"                # starting | ready | failed
+    startup_time: Optional[float] = None    # seconds until ready / failed
+    tool_count: int = 0
+    error: Optional[str] = None
 
 
 @dataclass
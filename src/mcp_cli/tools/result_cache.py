@@ -0,0 +1,251 @@
+# mcp_cli/tools/result_cache.py
+"""
+Content-addressed cache for tool results.
+
+Results are keyed by ``sha256(canonical-JSON([namespace, tool, arguments]))``,
+so argument order and whitespace never cause spurious misses.
+
+Caching is strictly **opt-in per tool**: only tools matched by the ``allow``
+table are cached, each with its own TTL; ``deny`` always wins.  Entries are
+evicted least-recently-used once the byte budget is exceeded.
+
+Configured from the optional top-level ``toolCache`` block of
+``server_config.json``::
+
+    "toolCache": {
+      "maxBytes": 16777216,
+      "allow": {"list_tables": 600, "sqlite.describe_*": 300},
+      "deny": ["*write*"]
+    }
+
+Patterns use shell-style wildcards and are matched against the bare tool
+name, ``namespace.tool`` and ``server.tool``.
+"""
+from __future__ import annotations
+
+import copy
+import fnmatch
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from mcp_cli.tools.models import ToolCallResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+    max_bytes: int = DEFAULT_MAX_BYTES
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cacheable lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class _Entry:
+    namespace: str
+    tool: str
+    result: ToolCallResult
+    size: int
+    expires_at: float
+
+
+class ToolResultCache:
+    """LRU, byte-budgeted, TTL-aware cache of successful tool results."""
+
+    def __init__(
+        self,
+        allow: Optional[Dict[str, float]] = None,
+        deny: Optional[Iterable[str]] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        enabled: bool = True,
+    ):
+        """
+        Args:
+            allow: Tool pattern -> TTL in seconds (tools not listed are never cached)
+            deny: Tool patterns that are never cached
+            max_bytes: Approximate memory budget for cached results
+            enabled: Master switch
+        """
+        self.allow: Dict[str, float] = dict(allow or {})
+        self.deny: List[str] = list(deny or [])
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._ttl_cache: Dict[Tuple[str, str, str], Optional[float]] = {}
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "ToolResultCache":
+        """Build a cache from the ``toolCache`` configuration block."""
+        config = config or {}
+        allow: Dict[str, float] = {}
+        for pattern, ttl in (config.get("allow") or {}).items():
+            try:
+                allow[pattern] = float(ttl)
+            except (TypeError, ValueError):
+                logger.warning(f"Ignoring invalid cache TTL for '{pattern}': {ttl}")
+        return cls(
+            allow=allow,
+            deny=config.get("deny") or [],
+            max_bytes=int(config.get("maxBytes", DEFAULT_MAX_BYTES)),
+            enabled=bool(config.get("enabled", True)),
+        )
+
+    # ------------------------------------------------------------------ #
+    # Policy                                                             #
+    # ------------------------------------------------------------------ #
+    def ttl_for(self, namespace: Optional[str], tool: str, server: Optional[str] = None) -> Optional[float]:
+        """Return the TTL for *tool*, or ``None`` if it must not be cached."""
+        if not self.enabled or not self.allow:
+            return None
+
+        key = (namespace or "", tool, server or "")
+        if key in self._ttl_cache:
+            return self._ttl_cache[key]
+
+        names = [tool]
+        if namespace:
+            names.append(f"{namespace}.{tool}")
+        if server and server != namespace:
+            names.append(f"{server}.{tool}")
+
+        ttl: Optional[float] = None
+        if not any(fnmatch.fnmatchcase(n, p) for n in names for p in self.deny):
+            for pattern, pattern_ttl in self.allow.items():
+                if any(fnmatch.fnmatchcase(n, pattern) for n in names):
+                    ttl = pattern_ttl if pattern_ttl > 0 else None
+                    break
+
+        self._ttl_cache[key] = ttl
+        return ttl
+
+    @staticmethod
+    def make_key(namespace: Optional[str], tool: str, arguments: Any) -> str:
+        """Content address for a call."""
+        canonical = json.dumps(
+            [namespace or "", tool, arguments],
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    # ------------------------------------------------------------------ #
+    # Access                                                             #
+    # ------------------------------------------------------------------ #
+    def get(self, key: str) -> Optional[ToolCallResult]:
+        """Return a copy of a cached result, refreshing its LRU position."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        # callers may modify the payload; the cached one must stay intact
+        return replace(entry.result, result=copy.deepcopy(entry.result.result))
+
+    def put(self, key: str, namespace: Optional[str], tool: str, result: ToolCallResult, ttl: float) -> None:
+        """Store a copy of a successful result for *ttl* seconds."""
+        if not result.success:
+            return
+
+        size = self._estimate_size(result.result)
+        if size > self.max_bytes:
+            logger.debug(f"Result of {tool} too large to cache ({size} bytes)")
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        stored = replace(result, result=copy.deepcopy(result.result))
+        self._entries[key] = _Entry(namespace or "", tool, stored, size, time.monotonic() + ttl)
+        self._bytes += size
+
+        while self._bytes > self.max_bytes and self._entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._evictions += 1
+
+    def clear(self, tool: Optional[str] = None, namespace: Optional[str] = None) -> int:
+        """
+        Drop cached entries, optionally only those for *tool* and/or *namespace*.
+
+        Returns:
+            Number of entries removed
+        """
+        doomed = [
+            k for k, e in self._entries.items()
+            if (tool is None or e.tool == tool) and (namespace is None or e.namespace == namespace)
+        ]
+        for key in doomed:
+            self._remove(key)
+        return len(doomed)
+
+    def reset_stats(self) -> None:
+        """Zero the hit / miss / eviction counters."""
+        self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters."""
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            bytes=self._bytes,
+            max_bytes=self.max_bytes,
+        )
+
+    def entries_by_tool(self) -> Dict[str, Tuple[int, int]]:
+        """``namespace.tool`` -> (entry count, bytes) for display."""
+        summary: Dict[str, Tuple[int, int]] = {}
+        for entry in self._entries.values():
+            name = f"{entry.namespace}.{entry.tool}" if entry.namespace else entry.tool
+            count, size = summary.get(name, (0, 0))
+            summary[name] = (count + 1, size + entry.size)
+        return summary
+
+    # ------------------------------------------------------------------ #
+    # Internals                                                          #
+    # ------------------------------------------------------------------ #
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    @staticmethod
+    def _estimate_size(value: Any) -> int:
+        if isinstance(value, (str, bytes)):
+            return len(value)
+        try:
+            return len(json.dumps(value, separators=(",", ":"), default=str))
+        except (TypeError, ValueError):
+            return len(str(value))
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,227 @@
+# mcp_cli/tools/result_store.py
+"""
+Spill-to-disk store for oversized tool results.
+
+A result whose text exceeds ``max_inline_bytes`` is written once to
+``~/.mcp-cli/results/<handle>.txt``.  Only a head/tail preview and the
+handle go into the conversation, so the model does not receive (and
+re-receive every turn) megabytes of rows.  The rest can be paged through
+the built-in ``result.read`` tool, which slices the file via ``mmap``
+without loading it.
+
+Configured from the optional top-level ``toolResults`` block of
+``server_config.json``::
+
+    "toolResults": {
+      "maxInlineBytes": 65536,
+      "previewBytes": 4096
+    }
+
+``maxInlineBytes: 0`` keeps every result inline.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import mmap
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_INLINE_BYTES = 64 * 1024
+DEFAULT_PREVIEW_BYTES = 4 * 1024
+DEFAULT_READ_LIMIT = 16 * 1024
+MAX_AGE_SECONDS = 7 * 24 * 3600
+
+# Built-in tool that pages through spilled results
+READ_TOOL_NAMESPACE = "result"
+READ_TOOL_NAME = "read"
+READ_TOOL_DEFINITION = {
+    "description": (
+        "Read part of a large tool result that was stored out of the conversation. "
+        "Use the handle from the truncated result and page with offset/limit (bytes)."
+    ),
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "handle": {"type": "string", "description": "Handle of the stored result"},
+            "offset": {"type": "integer", "description": "Byte offset to start at", "default": 0},
+            "limit": {
+                "type": "integer",
+                "description": f"Maximum bytes to return (default {DEFAULT_READ_LIMIT})",
+                "default": DEFAULT_READ_LIMIT,
+            },
+        },
+        "required": ["handle"],
+    },
+}
+
+
+@dataclass
+class SpilledResult:
+    """A tool result stored on disk."""
+    handle: str
+    path: Path
+    size: int        # bytes (UTF-8)
+    preview: str     # head/tail preview with instructions for the model
+
+
+def _utf8_boundary(buf: Any, pos: int) -> int:
+    """Move *pos* back to the start of the UTF-8 character it falls in."""
+    while 0 < pos < len(buf) and (buf[pos] & 0xC0) == 0x80:
+        pos -= 1
+    return pos
+
+
+class ResultStore:
+    """Writes oversized tool results to disk and serves slices of them."""
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        max_inline_bytes: int = DEFAULT_MAX_INLINE_BYTES,
+        preview_bytes: int = DEFAULT_PREVIEW_BYTES,
+    ):
+        """
+        Args:
+            root: Directory for stored results (default ``~/.mcp-cli/results``)
+            max_inline_bytes: Results larger than this are spilled; ``0`` disables
+            preview_bytes: Size of the head + tail kept inline
+        """
+        self.root = Path(root) if root else Path.home() / ".mcp-cli" / "results"
+        self.max_inline_bytes = max_inline_bytes
+        self.preview_bytes = min(preview_bytes, max_inline_bytes // 2) if max_inline_bytes else preview_bytes
+        self.spilled = 0
+        self._pruned = False
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "ResultStore":
+        """Build from the ``toolResults`` configuration block."""
+        config = config or {}
+        kwargs: Dict[str, Any] = {}
+        try:
+            if "maxInlineBytes" in config:
+                kwargs["max_inline_bytes"] = int(config["maxInlineBytes"])
+            if "previewBytes" in config:
+                kwargs["preview_bytes"] = int(config["previewBytes"])
+        except (TypeError, ValueError):
+            logger.warning("Ignoring invalid 'toolResults' limits in configuration")
+            kwargs = {}
+        if config.get("dir"):
+            kwargs["root"] = Path(os.path.expanduser(str(config["dir"])))
+        return cls(**kwargs)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_inline_bytes > 0
+
+    # ------------------------------------------------------------------ #
+    # Writing                                                            #
+    # ------------------------------------------------------------------ #
+    def spill(self, tool_name: str, text: str) -> Optional[SpilledResult]:
+        """
+        Store *text* if it is too large to keep inline.
+
+        Returns:
+            The stored result, or None if *text* stays inline (small enough,
+            spilling disabled, or the file could not be written)
+        """
+        if not self.enabled or len(text) <= self.max_inline_bytes // 4:
+            return None  # cheap exit: cannot exceed the limit even at 4 bytes/char
+        data = text.encode("utf-8")
+        if len(data) <= self.max_inline_bytes:
+            return None
+
+        handle = f"r-{hashlib.sha256(data).hexdigest()[:16]}"
+        path = self.root / f"{handle}.txt"
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._prune()
+            if not path.exists():
+                tmp = path.with_suffix(".tmp")
+                tmp.write_bytes(data)
+                os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not store large result of {tool_name}: {e}")
+            return None
+
+        self.spilled += 1
+        logger.debug(f"Stored {len(data):,}-byte result of {tool_name} as {handle}")
+        return SpilledResult(handle, path, len(data), self._preview(handle, data))
+
+    def _preview(self, handle: str, data: bytes) -> str:
+        half = self.preview_bytes // 2
+        head_end = _utf8_boundary(data, half)
+        tail_start = _utf8_boundary(data, len(data) - half)
+        head = data[:head_end].decode("utf-8", errors="replace")
+        tail = data[tail_start:].decode("utf-8", errors="replace")
+        omitted = tail_start - head_end
+        return (
+            f"{head}\n"
+            f"… [{omitted:,} of {len(data):,} bytes omitted. The full result is stored as "
+            f"handle '{handle}'; call {READ_TOOL_NAMESPACE}.{READ_TOOL_NAME} with "
+            f"handle='{handle}', offset={head_end}, limit={DEFAULT_READ_LIMIT} to read more.] …\n"
+            f"{tail}"
+        )
+
+    def _prune(self) -> None:
+        """Delete stored results older than a week (once per process)."""
+        if self._pruned:
+            return
+        self._pruned = True
+        cutoff = time.time() - MAX_AGE_SECONDS
+        for path in self.root.glob("r-*.txt"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                continue
+
+    # ------------------------------------------------------------------ #
+    # Reading                                                            #
+    # ------------------------------------------------------------------ #
+    def read(self, handle: str, offset: int = 0, limit: int = DEFAULT_READ_LIMIT) -> Dict[str, Any]:
+        """
+        Return ``limit`` bytes of a stored result starting at ``offset``.
+
+        Slices are aligned to UTF-8 character boundaries, so ``next_offset``
+        should be used for the following page.
+
+        Raises:
+            ValueError: For malformed handles or arguments
+            FileNotFoundError: If the handle is unknown (or expired)
+        """
+        if not handle.startswith("r-") or not handle[2:].isalnum():
+            raise ValueError(f"Invalid result handle: {handle!r}")
+        offset, limit = int(offset), int(limit)
+        if offset < 0 or limit <= 0:
+            raise ValueError("offset must be >= 0 and limit > 0")
+        # Pages must themselves stay small enough to be kept inline
+        if self.enabled:
+            limit = min(limit, self.max_inline_bytes // 2)
+
+        path = self.root / f"{handle}.txt"
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0 or offset >= size:
+                content, end = "", size
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    start = _utf8_boundary(mm, offset)
+                    end = _utf8_boundary(mm, min(size, start + limit))
+                    if end <= start:
+                        end = min(size, start + limit)
+                    content = mm[start:end].decode("utf-8", errors="replace")
+                    offset = start
+
+        return {
+            "handle": handle,
+            "offset": offset,
+            "next_offset": end if end < size else None,
+            "total_bytes": size,
+            "content": content,
+        }
@@ -0,0 +1,242 @@
+# mcp_cli/tools/scheduler.py
+"""
+Fair, per-server scheduling of tool calls.
+
+Every tool call runs in a *lane* (normally the MCP server that owns the tool).
+A call needs a free slot in its lane **and** a free global slot before it may
+start:
+
+* per-lane caps stop one slow server from occupying every global slot;
+* when a slot frees up, waiting lanes are served round-robin, so a burst
+  against one server cannot starve the others;
+* within the round-robin, higher priorities are served first.
+
+Lane caps and priorities normally come from ``server_config.json``::
+
+    "sqlite": {"command": "...", "maxConcurrency": 1, "priority": -1}
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Tool calls of one LLM turn that run at once, unless configured otherwise
+DEFAULT_TURN_CONCURRENCY = 4
+
+
+@dataclass
+class LaneStats:
+    """Queueing statistics for one lane."""
+    lane: str
+    limit: int
+    active: int = 0
+    queued: int = 0
+    completed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def avg_wait(self) -> float:
+        """Average time a call waited for a slot, in seconds."""
+        started = self.completed + self.active
+        return self.total_wait / started if started else 0.0
+
+
+@dataclass
+class _Lane:
+    limit: int
+    priority: int = 0
+    active: int = 0
+    # heap of (-priority, seq, enqueued_at, future)
+    waiters: List[Tuple[int, int, float, asyncio.Future]] = field(default_factory=list)
+    stats: Optional[LaneStats] = None
+
+
+class ToolScheduler:
+    """Admission control for tool calls with per-lane caps and fair queueing."""
+
+    def __init__(
+        self,
+        global_limit: int = 4,
+        default_lane_limit: Optional[int] = None,
+        lane_limits: Optional[Dict[str, int]] = None,
+        lane_priorities: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Args:
+            global_limit: Maximum number of calls running across all lanes
+            default_lane_limit: Cap for lanes without an explicit limit
+                (defaults to *global_limit*)
+            lane_limits: Explicit per-lane caps
+            lane_priorities: Default priority for calls in each lane
+        """
+        self.global_limit = max(1, global_limit)
+        self.default_lane_limit = default_lane_limit or self.global_limit
+        self._lane_limits: Dict[str, int] = dict(lane_limits or {})
+        self._lane_priorities: Dict[str, int] = dict(lane_priorities or {})
+
+        self._lanes: Dict[str, _Lane] = {}
+        self._rr: List[str] = []          # lane order for round-robin
+        self._rr_next = 0
+        self._active = 0
+        self._seq = itertools.count()
+
+    # ------------------------------------------------------------------ #
+    # Configuration                                                      #
+    # ------------------------------------------------------------------ #
+    def configure(
+        self,
+        lane_limits: Optional[Dict[str, int]] = None,
+        lane_priorities: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """Replace per-lane caps / priorities; affects lanes immediately."""
+        if lane_limits is not None:
+            self._lane_limits = dict(lane_limits)
+        if lane_priorities is not None:
+            self._lane_priorities = dict(lane_priorities)
+
+        for name, lane in self._lanes.items():
+            lane.limit = self._limit_for(name)
+            lane.priority = self._lane_priorities.get(name, 0)
+            lane.stats.limit = lane.limit
+        self._dispatch()
+
+    def _limit_for(self, lane: str) -> int:
+        return max(1, self._lane_limits.get(lane, self.default_lane_limit))
+
+    def _lane(self, name: str) -> _Lane:
+        lane = self._lanes.get(name)
+        if lane is None:
+            limit = self._limit_for(name)
+            lane = _Lane(
+                limit=limit,
+                priority=self._lane_priorities.get(name, 0),
+                stats=LaneStats(lane=name, limit=limit),
+            )
+            self._lanes[name] = lane
+            self._rr.append(name)
+        return lane
+
+    # ------------------------------------------------------------------ #
+    # Admission                                                          #
+    # ------------------------------------------------------------------ #
+    @asynccontextmanager
+    async def slot(self, lane: str, priority: Optional[int] = None) -> AsyncIterator[None]:
+        """Hold one execution slot in *lane* for the duration of the block."""
+        await self.acquire(lane, priority)
+        try:
+            yield
+        finally:
+            self.release(lane)
+
+    async def acquire(self, lane_name: str, priority: Optional[int] = None) -> None:
+        """Wait until a call in *lane_name* may start."""
+        lane = self._lane(lane_name)
+        prio = lane.priority if priority is None else priority
+
+        if not lane.waiters and self._has_capacity(lane):
+            self._start(lane, 0.0)
+            return
+
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        enqueued = time.monotonic()
+        heapq.heappush(lane.waiters, (-prio, next(self._seq), enqueued, fut))
+        lane.stats.queued += 1
+        self._dispatch()
+
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # slot was granted just as we were cancelled - hand it back
+                self.release(lane_name)
+            else:
+                self._drop_waiter(lane, fut)
+            raise
+
+    def release(self, lane_name: str) -> None:
+        """Return a slot previously obtained with :meth:`acquire`."""
+        lane = self._lanes[lane_name]
+        lane.active -= 1
+        lane.stats.active = lane.active
+        lane.stats.completed += 1
+        self._active -= 1
+        self._dispatch()
+
+    # ------------------------------------------------------------------ #
+    # Internals                                                          #
+    # ------------------------------------------------------------------ #
+    def _has_capacity(self, lane: _Lane) -> bool:
+        return self._active < self.global_limit and lane.active < lane.limit
+
+    def _start(self, lane: _Lane, waited: float) -> None:
+        lane.active += 1
+        self._active += 1
+        stats = lane.stats
+        stats.active = lane.active
+        stats.total_wait += waited
+        stats.max_wait = max(stats.max_wait, waited)
+
+    def _drop_waiter(self, lane: _Lane, fut: asyncio.Future) -> None:
+        for i, item in enumerate(lane.waiters):
+            if item[3] is fut:
+                lane.waiters.pop(i)
+                heapq.heapify(lane.waiters)
+                lane.stats.queued -= 1
+                break
+
+    def _dispatch(self) -> None:
+        """Grant free slots: highest priority first, round-robin among equals."""
+        while self._active < self.global_limit:
+            chosen: Optional[str] = None
+            best: Optional[int] = None
+            count = len(self._rr)
+            for offset in range(count):
+                name = self._rr[(self._rr_next + offset) % count]
+                lane = self._lanes[name]
+                if not lane.waiters or lane.active >= lane.limit:
+                    continue
+                prio = lane.waiters[0][0]
+                if best is None or prio < best:
+                    chosen, best = name, prio
+            if chosen is None:
+                return
+
+            lane = self._lanes[chosen]
+            _, _, enqueued, fut = heapq.heappop(lane.waiters)
+            lane.stats.queued -= 1
+            self._rr_next = (self._rr.index(chosen) + 1) % count
+            if fut.done():
+                continue
+            self._start(lane, time.monotonic() - enqueued)
+            fut.set_result(None)
+
+    # ------------------------------------------------------------------ #
+    # Introspection                                                      #
+    # ------------------------------------------------------------------ #
+    @property
+    def active(self) -> int:
+        """Number of calls currently running across all lanes."""
+        return self._active
+
+    def queue_depth(self, lane: Optional[str] = None) -> int:
+        """Number of calls waiting for a slot (in *lane*, or in total)."""
+        if lane is not None:
+            return len(self._lanes[lane].waiters) if lane in self._lanes else 0
+        return sum(len(l.waiters) for l in self._lanes.values())
+
+    def get_stats(self) -> Dict[str, LaneStats]:
+        """Per-lane statistics snapshot."""
+        return {name: replace(lane.stats) for name, lane in self._lanes.items()}
+
+    def __repr__(self) -> str:
+        return (f"ToolScheduler(active={self._active}/{self.global_limit}, "
+                f"queued={self.queue_depth()}, lanes={len(self._lanes)})")
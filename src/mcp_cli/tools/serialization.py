@@ -0,0 +1,152 @@
+# mcp_cli/tools/serialization.py
+"""
+Serialization of tool results for the conversation.
+
+Every place that turns a raw tool result into message text goes through
+:func:`format_tool_response`, so chat, ``cmd`` and the legacy handler agree
+on one format.
+
+Lists of uniform records (typically SQL rows) are the expensive case: as
+pretty-printed JSON every column name is repeated on every row, which
+roughly doubles the token count.  They are encoded in a tabular format
+instead:
+
+* ``columnar`` - compact JSON ``{"columns": [...], "rows": [[...], ...]}``
+* ``csv`` / ``tsv`` - a header line followed by one line per row
+* ``json`` - the previous pretty-printed JSON
+
+Everything else (MCP text content, single objects, scalars) is formatted
+as before.  The table format is configured in the ``toolResults`` block of
+``server_config.json`` and can differ per provider::
+
+    "toolResults": {
+      "tableFormat": "columnar",
+      "tableFormatByProvider": {"ollama": "csv"}
+    }
+"""
+from __future__ import annotations
+
+import csv
+import io
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TABLE_FORMATS = ("columnar", "csv", "tsv", "json")
+DEFAULT_TABLE_FORMAT = "columnar"
+
+_COMPACT = (",", ":")
+
+
+def _uniform_columns(rows: List[Any]) -> Optional[List[str]]:
+    """Column names if *rows* are dicts sharing one key set, else None."""
+    first = rows[0]
+    if type(first) is not dict or not first:
+        return None
+    keys = first.keys()
+    for row in rows:
+        if type(row) is not dict or row.keys() != keys:
+            return None
+    return list(keys)
+
+
+def _cell(value: Any) -> str:
+    """One delimited-text cell: strings verbatim, everything else as JSON."""
+    if isinstance(value, str):
+        return value
+    if value is None:
+        return ""
+    return json.dumps(value, separators=_COMPACT, ensure_ascii=False, default=str)
+
+
+def encode_table(rows: List[Dict[str, Any]], columns: List[str], table_format: str) -> str:
+    """Encode uniform *rows* (all with keys *columns*) in *table_format*."""
+    if table_format == "columnar":
+        return json.dumps(
+            {"columns": columns, "rows": [[row[c] for c in columns] for row in rows]},
+            separators=_COMPACT,
+            ensure_ascii=False,
+            default=str,
+        )
+    if table_format in ("csv", "tsv"):
+        buf = io.StringIO()
+        writer = csv.writer(buf, delimiter="\t" if table_format == "tsv" else ",", lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerows([_cell(row[c]) for c in columns] for row in rows)
+        return buf.getvalue().rstrip("\n")
+    return json.dumps(rows, indent=2)
+
+
+def format_tool_response(content: Any, table_format: str = "json") -> str:
+    """
+    Format the response content from a tool in a way that's suitable for LLM consumption.
+
+    Args:
+        content: Raw tool result
+        table_format: Encoding for lists of uniform records (see ``TABLE_FORMATS``)
+    """
+    if isinstance(content, str):
+        return content
+
+    # Handle list of dictionaries (likely structured data like SQL results)
+    if isinstance(content, list) and content and isinstance(content[0], dict):
+        # Treat as text records only if every item has type == "text"
+        if all(isinstance(item, dict) and item.get("type") == "text" for item in content):
+            return "\n".join(item.get("text", "") for item in content)
+        try:
+            if table_format != "json":
+                columns = _uniform_columns(content)
+                if columns is not None:
+                    return encode_table(content, columns, table_format)
+            return json.dumps(content, indent=2)
+        except (TypeError, ValueError):
+            return str(content)
+
+    if isinstance(content, (dict, list)):
+        try:
+            return json.dumps(content, indent=2)
+        except (TypeError, ValueError):
+            return str(content)
+
+    # Default case - convert to string
+    return str(content)
+
+
+@dataclass
+class ResultEncoder:
+    """Per-provider choice of table format for tool results."""
+    table_format: str = DEFAULT_TABLE_FORMAT
+    by_provider: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "ResultEncoder":
+        """Build from the ``toolResults`` configuration block."""
+        config = config or {}
+        encoder = cls()
+        default = config.get("tableFormat")
+        if default is not None:
+            if default in TABLE_FORMATS:
+                encoder.table_format = default
+            else:
+                logger.warning(f"Ignoring unknown toolResults.tableFormat: {default!r}")
+        overrides = config.get("tableFormatByProvider") or {}
+        if not isinstance(overrides, dict):
+            logger.warning("Ignoring invalid 'toolResults.tableFormatByProvider' in configuration")
+            overrides = {}
+        for provider, fmt in overrides.items():
+            if fmt in TABLE_FORMATS:
+                encoder.by_provider[str(provider).lower()] = fmt
+            else:
+                logger.warning(f"Ignoring unknown table format {fmt!r} for provider {provider}")
+        return encoder
+
+    def format_for(self, provider: Optional[str] = None) -> str:
+        if provider:
+            return self.by_provider.get(provider.lower(), self.table_format)
+        return self.table_format
+
+    def encode(self, content: Any, provider: Optional[str] = None) -> str:
+        return format_tool_response(content, self.format_for(provider))
@@ -0,0 +1,178 @@
+# mcp_cli/tools/server_streams.py
+"""
+One ``StreamManager`` per MCP server, behind the ``StreamManager`` surface.
+
+Servers are launched concurrently and each may finish (or fail) on its own
+schedule, so every server gets its own ``StreamManager``.  ``ServerStreams``
+presents them as a single manager to ``register_mcp_tools`` and the rest of
+the CLI: it owns tool routing (the first server to offer a tool name keeps
+it) and forwards calls, prompts and resources to the owning server.
+
+Tools may also be *offered* before their server is connected (the warm-start
+snapshot); they route like live tools until the server is added, which
+replaces them, or withdrawn.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Set
+
+from chuk_tool_processor.mcp.stream_manager import StreamManager
+from chuk_tool_processor.mcp.transport.models import MCPToolDefinition
+
+logger = logging.getLogger(__name__)
+
+
+class ServerStreams:
+    """Routes tool calls across per-server stream managers."""
+
+    def __init__(self, server_names: Optional[Dict[int, str]] = None) -> None:
+        self.server_names: Dict[int, str] = dict(server_names or {})
+        self.tool_to_server_map: Dict[str, str] = {}
+        self.tool_to_servers: Dict[str, List[str]] = {}
+        self._managers: Dict[str, StreamManager] = {}
+        self._ids: Dict[str, int] = {}
+        self._tools: Dict[str, List[MCPToolDefinition]] = {}
+        self._offered: Set[str] = set()
+
+    # ------------------------------------------------------------------ #
+    # Membership                                                         #
+    # ------------------------------------------------------------------ #
+    def offer(self, name: str, tools: List[MCPToolDefinition]) -> None:
+        """Route *tools* to *name* before its server is connected."""
+        self._offered.add(name)
+        self._set_tools(name, tools)
+
+    def withdraw(self, name: str) -> List[str]:
+        """
+        Drop the offered (not yet live) tools of *name*.
+
+        Returns:
+            Names of the tools no server provides any more
+        """
+        if name not in self._offered:
+            return []
+        self._offered.discard(name)
+        return self._clear_tools(name)
+
+    def add(self, idx: int, name: str, manager: StreamManager) -> List[str]:
+        """
+        Adopt the connected server *name*; its live tools replace any offer.
+
+        Returns:
+            Names of offered tools that no server provides any more
+        """
+        self._offered.discard(name)
+        orphaned = self._clear_tools(name)
+        self._managers[name] = manager
+        self._ids[name] = idx
+        self._set_tools(name, list(manager.all_tools))
+        return [tool for tool in orphaned if tool not in self.tool_to_servers]
+
+    def _set_tools(self, name: str, tools: List[MCPToolDefinition]) -> None:
+        self._tools[name] = tools
+        for tool in tools:
+            providers = self.tool_to_servers.setdefault(tool.name, [])
+            if name not in providers:
+                providers.append(name)
+            self.tool_to_server_map.setdefault(tool.name, name)
+
+    def _clear_tools(self, name: str) -> List[str]:
+        orphaned = []
+        for tool in self._tools.pop(name, []):
+            providers = self.tool_to_servers.get(tool.name, [])
+            if name in providers:
+                providers.remove(name)
+            if self.tool_to_server_map.get(tool.name) == name:
+                if providers:
+                    self.tool_to_server_map[tool.name] = providers[0]
+                else:
+                    del self.tool_to_server_map[tool.name]
+            if not providers:
+                self.tool_to_servers.pop(tool.name, None)
+                orphaned.append(tool.name)
+        return orphaned
+
+    # ------------------------------------------------------------------ #
+    # StreamManager surface                                              #
+    # ------------------------------------------------------------------ #
+    @property
+    def all_tools(self) -> List[MCPToolDefinition]:
+        return [tool for tools in self._tools.values() for tool in tools]
+
+    @property
+    def transports(self) -> Dict[str, Any]:
+        merged: Dict[str, Any] = {}
+        for manager in self._managers.values():
+            merged.update(manager.transports)
+        return merged
+
+    @property
+    def server_info(self) -> List[Any]:
+        infos = [
+            info.model_copy(update={"id": self._ids[name]})
+            for name, manager in self._managers.items()
+            for info in manager.server_info
+        ]
+        return sorted(infos, key=lambda info: info.id)
+
+    def get_all_tools(self) -> List[Dict[str, Any]]:
+        return [t.model_dump() for t in self.all_tools]
+
+    def get_server_for_tool(self, tool_name: str) -> Optional[str]:
+        return self.tool_to_server_map.get(tool_name)
+
+    def get_servers_for_tool(self, tool_name: str) -> List[str]:
+        return list(self.tool_to_servers.get(tool_name, []))
+
+    def get_server_info(self) -> List[Dict[str, Any]]:
+        return [info.model_dump() for info in self.server_info]
+
+    async def call_tool(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        server_name: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        server_name = server_name or self.get_server_for_tool(tool_name)
+        manager = self._managers.get(server_name) if server_name else None
+        if manager is None:
+            return {"isError": True, "error": f"No server found for tool: {tool_name}"}
+        return await manager.call_tool(
+            tool_name, arguments, server_name=server_name, timeout=timeout
+        )
+
+    async def ping_servers(self) -> List[Any]:
+        return await self._gather("ping_servers")
+
+    async def list_prompts(self) -> List[Dict[str, Any]]:
+        return await self._gather("list_prompts")
+
+    async def list_resources(self) -> List[Dict[str, Any]]:
+        return await self._gather("list_resources")
+
+    async def _gather(self, method: str) -> List[Any]:
+        results = await asyncio.gather(
+            *(getattr(m, method)() for m in self._managers.values()),
+            return_exceptions=True,
+        )
+        out: List[Any] = []
+        for name, result in zip(self._managers, results):
+            if isinstance(result, Exception):
+                logger.debug(f"{method} failed for {name}: {result}")
+                continue
+            out.extend(result)
+        return out
+
+    async def close(self) -> None:
+        # one at a time, in this task: stdio transports must be closed by
+        # the task that owns their cancel scopes
+        managers = list(self._managers.items())
+        self._managers.clear()
+        for name, manager in managers:
+            try:
+                await manager.close()
+            except Exception as exc:
+                logger.warning(f"Error closing server '{name}': {exc}")
@@ -0,0 +1,126 @@
+# mcp_cli/tools/single_flight.py
+"""
+Single-flight de-duplication of identical concurrent tool calls.
+
+While a call with a given key is running, later callers with the same key
+await the result of the running call instead of dispatching their own.
+The shared call is only cancelled once *every* caller waiting on it has
+been cancelled.
+
+Coalescing is opt-in per tool so non-idempotent tools always run once per
+request.  Configured from the optional top-level ``singleFlight`` block of
+``server_config.json``::
+
+    "singleFlight": {
+      "allow": ["list_*", "sqlite.describe_table"],
+      "deny": ["*write*"]
+    }
+
+Patterns use shell-style wildcards and are matched against the bare tool
+name, ``namespace.tool`` and ``server.tool``.
+"""
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Flight:
+    task: asyncio.Task
+    waiters: int = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key onto one execution."""
+
+    def __init__(self, allow: Optional[Iterable[str]] = None, deny: Optional[Iterable[str]] = None):
+        """
+        Args:
+            allow: Tool patterns whose identical in-flight calls are coalesced
+            deny: Tool patterns that are never coalesced (wins over *allow*)
+        """
+        self.allow: List[str] = list(allow or [])
+        self.deny: List[str] = list(deny or [])
+
+        self._inflight: Dict[str, _Flight] = {}
+        self._policy_cache: Dict[Tuple[str, str, str], Tuple[bool, bool]] = {}
+        self.coalesced = 0
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "SingleFlight":
+        """Build from the ``singleFlight`` configuration block."""
+        config = config or {}
+        return cls(allow=config.get("allow") or [], deny=config.get("deny") or [])
+
+    # ------------------------------------------------------------------ #
+    # Policy                                                             #
+    # ------------------------------------------------------------------ #
+    def _match(self, namespace: Optional[str], tool: str, server: Optional[str]) -> Tuple[bool, bool]:
+        key = (namespace or "", tool, server or "")
+        cached = self._policy_cache.get(key)
+        if cached is None:
+            names = [tool]
+            if namespace:
+                names.append(f"{namespace}.{tool}")
+            if server and server != namespace:
+                names.append(f"{server}.{tool}")
+            allowed = any(fnmatch.fnmatchcase(n, p) for n in names for p in self.allow)
+            denied = any(fnmatch.fnmatchcase(n, p) for n in names for p in self.deny)
+            cached = self._policy_cache[key] = (allowed, denied)
+        return cached
+
+    def applies(
+        self,
+        namespace: Optional[str],
+        tool: str,
+        server: Optional[str] = None,
+        idempotent: bool = False,
+    ) -> bool:
+        """
+        Whether calls to *tool* may be coalesced.
+
+        Args:
+            idempotent: Caller already knows the tool is safe to share
+                (e.g. it is result-cacheable); ``deny`` still wins.
+        """
+        allowed, denied = self._match(namespace, tool, server)
+        return not denied and (allowed or idempotent)
+
+    # ------------------------------------------------------------------ #
+    # Execution                                                          #
+    # ------------------------------------------------------------------ #
+    async def run(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the result of ``factory()``, sharing it with concurrent callers of *key*."""
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = _Flight(task=asyncio.ensure_future(factory()))
+            self._inflight[key] = flight
+            flight.task.add_done_callback(lambda _t, k=key, f=flight: self._finish(k, f))
+        else:
+            self.coalesced += 1
+            logger.debug(f"Joining in-flight call {key[:12]}")
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done() and flight.waiters == 1:
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _finish(self, key: str, flight: _Flight) -> None:
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running through this layer."""
+        return len(self._inflight)
@@ -8,13 +8,20 @@ is available and working before committing to configuration changes.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
 import re
-from typing import Dict, Any, Optional, Tuple
+import time
+from typing import AsyncIterator, Dict, Any, Iterable, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
 from mcp_cli.model_manager import ModelManager  # ← CHANGED
 
+# Defaults for fan-out probing (diagnostics)
+DEFAULT_PROBE_CONCURRENCY = 4
+DEFAULT_PROBE_TIMEOUT = 15.0
+
 
 @dataclass
 class ProbeResult:
@@ -23,6 +30,9 @@ class ProbeResult:
     error_message: Optional[str] = None
     client: Optional[Any] = None
     response: Optional[Dict[str, Any]] = None
+    provider: Optional[str] = None
+    model: Optional[str] = None
+    latency: Optional[float] = None  # seconds, measured around the completion
 
 
 class LLMProbe:
@@ -72,7 +82,8 @@ class LLMProbe:
         self, 
         provider: str, 
         model: str,
-        test_message: str = "ping"
+        test_message: str = "ping",
+        timeout: Optional[float] = None,
     ) -> ProbeResult:
         """
         Test if a provider/model combination is available and working.
@@ -81,40 +92,99 @@ class LLMProbe:
             provider: Provider name (e.g., 'openai', 'anthropic')
             model: Model name (e.g., 'gpt-4', 'claude-3-sonnet')
             test_message: Message to send for testing (default: "ping")
+            timeout: Optional limit in seconds for the test completion
             
         Returns:
-            ProbeResult with success status, error message, and client if successful
+            ProbeResult with success status, error message, latency and client if successful
         """
+        started = time.perf_counter()
         try:
             # Create client using ModelManager's client creation method
             client = self.model_manager.get_client_for_provider(provider, model)
             
             # Test with a simple completion
-            response = await client.create_completion(
+            completion = client.create_completion(
                 [{"role": "user", "content": test_message}]
             )
+            response = await asyncio.wait_for(completion, timeout) if timeout else await completion
+            latency = time.perf_counter() - started
             
             # Validate the response
             if self._is_valid_response(response):
                 return ProbeResult(
                     success=True,
                     client=client,
-                    response=response
+                    response=response,
+                    provider=provider,
+                    model=model,
+                    latency=latency,
                 )
             else:
                 error_msg = self._extract_error_message(response)
                 return ProbeResult(
                     success=False,
                     error_message=error_msg,
-                    response=response
+                    response=response,
+                    provider=provider,
+                    model=model,
+                    latency=latency,
                 )
-                
+        
+        except asyncio.TimeoutError:
+            return ProbeResult(
+                success=False,
+                error_message=f"Timed out after {timeout:g}s",
+                provider=provider,
+                model=model,
+                latency=time.perf_counter() - started,
+            )
         except Exception as exc:
             return ProbeResult(
                 success=False,
-                error_message=str(exc)
+                error_message=str(exc),
+                provider=provider,
+                model=model,
             )
     
+    async def probe_many(
+        self,
+        targets: Iterable[Tuple[str, str]],
+        *,
+        concurrency: int = DEFAULT_PROBE_CONCURRENCY,
+        timeout: Optional[float] = DEFAULT_PROBE_TIMEOUT,
+        test_message: str = "ping",
+    ) -> AsyncIterator[ProbeResult]:
+        """
+        Probe many provider/model pairs concurrently.
+        
+        At most *concurrency* probes run at once and each is limited to
+        *timeout* seconds, so a full diagnostic takes roughly the slowest
+        probe rather than the sum of all of them.
+        
+        Args:
+            targets: ``(provider, model)`` pairs
+            concurrency: Maximum number of probes in flight
+            timeout: Per-probe limit in seconds (None for no limit)
+            test_message: Message to send for testing
+            
+        Yields:
+            ProbeResult objects in completion order
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def run(provider: str, model: str) -> ProbeResult:
+            async with semaphore:
+                return await self.test_provider_model(provider, model, test_message, timeout=timeout)
+        
+        tasks = [asyncio.create_task(run(provider, model)) for provider, model in targets]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
     async def test_model(self, model: str, test_message: str = "ping") -> ProbeResult:
         """
         Test if a model is available with the current active provider.
@@ -142,7 +212,8 @@ class LLMProbe:
         """
         try:
             # Validate provider exists in configuration
-            self.model_manager.get_provider_config(provider)  # ← CHANGED
+            if not self.model_manager.validate_provider(provider):
+                raise ValueError(f"Unknown provider: {provider}")
             model = self.model_manager.get_default_model(provider)  # ← CHANGED
             return await self.test_provider_model(provider, model, test_message)
         except ValueError as e:
@@ -206,6 +277,27 @@ class LLMProbe:
         return response_text
 
 
+def latency_percentiles(
+    latencies: Sequence[float],
+    percentiles: Sequence[int] = (50, 90, 99),
+) -> Dict[str, float]:
+    """
+    Nearest-rank percentiles of *latencies* (seconds).
+    
+    Returns:
+        ``{"p50": ..., "p90": ..., "p99": ..., "max": ...}`` or ``{}`` if empty
+    """
+    ordered: List[float] = sorted(latencies)
+    if not ordered:
+        return {}
+    stats = {
+        f"p{p}": ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+        for p in percentiles
+    }
+    stats["max"] = ordered[-1]
+    return stats
+
+
 # Convenience functions for common use cases
 async def test_model_availability(
     model: str, 
@@ -107,7 +107,9 @@ def dummy_tool_manager():
 
 
 @pytest.fixture()
-def chat_context(dummy_tool_manager, monkeypatch):
+def chat_context(dummy_tool_manager, monkeypatch, tmp_path):
+    # Keep the provider catalogue snapshot out of the real home directory
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
     # Use deterministic system prompt
     monkeypatch.setattr(
         "mcp_cli.chat.chat_context.generate_system_prompt", lambda tools: "SYS_PROMPT"
@@ -162,3 +164,89 @@ async def test_to_dict_and_update_roundtrip(chat_context):
     assert chat_context.exit_requested is True
     assert chat_context.get_conversation_length() == original_len + 1
     assert chat_context.conversation_history[-1]["content"] == "Hi"
+
+
+@pytest.mark.asyncio
+async def test_add_tool_exchange_sanitizes_names(chat_context):
+    await chat_context.initialize()
+
+    chat_context.add_tool_exchange("call_1", "srv1.tool1", "{}", "ok")
+
+    call, result = chat_context.conversation_history[-2:]
+    assert call["tool_calls"][0]["function"]["name"] == "srv1_tool1"
+    assert result["name"] == "srv1_tool1"
+    assert result["tool_call_id"] == "call_1"
+
+
+@pytest.mark.asyncio
+async def test_sanitize_history_only_scans_new_messages(chat_context, monkeypatch):
+    import mcp_cli.chat.chat_context as cc
+
+    await chat_context.initialize()
+    chat_context.add_user_message("hi")
+    chat_context.sanitize_history()
+
+    seen = []
+    real = cc.sanitize_message
+    monkeypatch.setattr(cc, "sanitize_message", lambda m: seen.append(m) or real(m))
+
+    # appended through the API: already clean, nothing to rescan
+    chat_context.add_assistant_message("hello")
+    seen.clear()
+    assert chat_context.sanitize_history() == 0
+    assert seen == []
+
+    # appended directly: picked up on the next pass, exactly once
+    chat_context.conversation_history.append({"role": "tool", "name": "a.b", "content": "x"})
+    assert chat_context.sanitize_history() == 1
+    assert chat_context.conversation_history[-1]["name"] == "a_b"
+    seen.clear()
+    assert chat_context.sanitize_history() == 0
+    assert seen == []
+
+    # a replaced history is scanned from the start
+    chat_context.conversation_history = [{"role": "tool", "name": "c.d", "content": "x"}]
+    assert chat_context.sanitize_history() == 1
+
+
+@pytest.mark.asyncio
+async def test_session_is_persisted_and_resumed(chat_context, dummy_tool_manager, monkeypatch, tmp_path):
+    from mcp_cli.chat.session_store import SessionStore
+
+    await chat_context.initialize()
+    store = SessionStore.create(root=tmp_path)
+    chat_context.attach_session(store)
+    chat_context.add_user_message("hello")
+    chat_context.add_tool_exchange("call_1", "srv1.tool1", "{}", "ok")
+    chat_context.add_assistant_message("done")
+    store.close()
+
+    resumed = ChatContext.create(tool_manager=dummy_tool_manager)
+    await resumed.initialize()
+    restored = resumed.attach_session(SessionStore.open(store.session_id, root=tmp_path), resume=True)
+
+    assert restored == 5
+    assert resumed.conversation_history == chat_context.conversation_history
+    assert resumed.conversation_history[0]["content"] == "SYS_PROMPT"
+
+
+@pytest.mark.asyncio
+async def test_tools_and_prompt_refresh_only_on_catalogue_change(chat_context, dummy_tool_manager, monkeypatch):
+    dummy_tool_manager.catalogue_version = 1
+    prompts = iter(["SYS_1", "SYS_2"])
+    monkeypatch.setattr(
+        "mcp_cli.chat.chat_context.generate_system_prompt", lambda tools: next(prompts)
+    )
+    await chat_context.initialize()
+    chat_context.add_user_message("hi")
+
+    assert await chat_context.refresh_tools_if_changed() is False
+    assert chat_context.conversation_history[0]["content"] == "SYS_1"
+
+    # a late server brought a new tool
+    dummy_tool_manager._tools.append(ToolInfo(name="tool3", namespace="srv3", parameters={}))
+    dummy_tool_manager.catalogue_version = 2
+    assert await chat_context.refresh_tools_if_changed() is True
+    assert chat_context.get_tool_count() == 3
+    assert chat_context.conversation_history[0] == {"role": "system", "content": "SYS_2"}
+    assert chat_context.conversation_history[1]["content"] == "hi"
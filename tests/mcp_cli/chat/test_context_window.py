@@ -0,0 +1,113 @@
+# tests/mcp_cli/chat/test_context_window.py
+import pytest
+
+from mcp_cli.chat.context_window import ContextWindow, estimate_tokens
+
+
+def _tool_exchange(i, size):
+    call_id = f"call_{i}"
+    return [
+        {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [
+                {"id": call_id, "type": "function",
+                 "function": {"name": "query", "arguments": "{}"}}
+            ],
+        },
+        {"role": "tool", "name": "query", "content": "x" * size, "tool_call_id": call_id},
+    ]
+
+
+def _history(turns, tool_size=4000):
+    history = [{"role": "system", "content": "You are helpful."}]
+    for i in range(turns):
+        history.append({"role": "user", "content": f"question {i}"})
+        history.extend(_tool_exchange(i, tool_size))
+        history.append({"role": "assistant", "content": f"answer {i}"})
+    return history
+
+
+def test_under_budget_sends_everything():
+    history = _history(2, tool_size=10)
+    window = ContextWindow(max_tokens=10_000)
+    assert window.build(history) == history
+    assert window.stats.elided == window.stats.evicted == 0
+
+
+def test_disabled_window_sends_everything():
+    history = _history(10)
+    assert ContextWindow(max_tokens=0).build(history) == history
+
+
+def test_old_tool_outputs_are_elided_first():
+    history = _history(4)
+    total = sum(estimate_tokens(m) for m in history)
+    window = ContextWindow(max_tokens=total - 1500, keep_turns=2)
+
+    sent = window.build(history)
+
+    assert len(sent) == len(history)
+    assert sent[0] is history[0]
+    assert "elided" in sent[3]["content"]
+    # recent turns untouched, history untouched
+    assert sent[-2]["content"] == "x" * 4000
+    assert history[3]["content"] == "x" * 4000
+    assert window.stats.window_tokens <= window.max_tokens
+
+
+def test_old_exchanges_are_evicted_and_tool_pairs_stay_together():
+    history = _history(20)
+    window = ContextWindow(max_tokens=2500, keep_turns=2)
+
+    sent = window.build(history)
+
+    assert sent[0]["role"] == "system"
+    assert "omitted" in sent[0]["content"]
+    assert window.stats.evicted > 0
+    assert window.stats.window_tokens <= window.max_tokens
+    # last two user turns are present verbatim
+    assert sent[-4:] == history[-4:]
+    assert {"role": "user", "content": "question 18"} in sent
+    # every tool result still follows its call
+    call_ids = set()
+    for msg in sent:
+        for tc in msg.get("tool_calls") or []:
+            call_ids.add(tc["id"])
+        if msg["role"] == "tool":
+            assert msg["tool_call_id"] in call_ids
+
+
+def test_estimates_are_incremental(monkeypatch):
+    import mcp_cli.chat.context_window as cw
+
+    history = _history(5)
+    window = ContextWindow(max_tokens=100_000)
+    window.build(history)
+
+    calls = []
+    real = cw.estimate_tokens
+    monkeypatch.setattr(cw, "estimate_tokens", lambda m: calls.append(m) or real(m))
+
+    history.append({"role": "user", "content": "one more"})
+    window.build(history)
+    assert len(calls) == 1
+
+    # a replaced history is re-estimated from scratch
+    history[:] = history[:1]
+    window.build(history)
+    assert window.stats.history_messages == 1
+
+
+@pytest.mark.asyncio
+async def test_context_command_sets_budget():
+    from mcp_cli.chat.commands.context import context_command
+
+    window = ContextWindow(max_tokens=1000)
+    ctx = {"context_window": window, "conversation_history": _history(1)}
+
+    assert await context_command(["/context", "32000"], ctx)
+    assert window.max_tokens == 32000
+    assert await context_command(["/context", "off"], ctx)
+    assert not window.enabled
+    assert await context_command(["/context"], ctx)
@@ -0,0 +1,119 @@
+# tests/mcp_cli/chat/test_session_store.py
+import json
+import os
+import time
+
+import pytest
+
+from mcp_cli.chat.session_store import SessionStore, list_sessions, prune_sessions
+
+
+def _user(i):
+    return {"role": "user", "content": f"message {i}"}
+
+
+def test_sync_appends_only_new_messages(tmp_path):
+    store = SessionStore.create(root=tmp_path, provider="openai", model="gpt-4o")
+    history = [{"role": "system", "content": "sys"}]
+
+    assert store.sync(history) == 1
+    history.append(_user(1))
+    history.append(_user(2))
+    assert store.sync(history) == 2
+    assert store.sync(history) == 0
+    store.close()
+
+    lines = store.log_path.read_text().splitlines()
+    assert [json.loads(l)["op"] for l in lines] == ["meta", "add", "add", "add"]
+    assert SessionStore.open(store.session_id, root=tmp_path).load() == history
+
+
+def test_replaced_history_is_written_as_reset(tmp_path):
+    store = SessionStore.create(root=tmp_path)
+    history = [{"role": "system", "content": "sys"}, _user(1), _user(2)]
+    store.sync(history)
+
+    # /clear keeps the list object but shortens it
+    del history[1:]
+    store.sync(history)
+    history.append(_user(3))
+    store.sync(history)
+    store.close()
+
+    assert SessionStore.open(store.session_id, root=tmp_path).load() == [
+        {"role": "system", "content": "sys"}, _user(3)
+    ]
+
+
+def test_resume_reads_snapshot_then_log_tail(tmp_path):
+    store = SessionStore.create(root=tmp_path)
+    store.snapshot_every = 10
+    history = []
+    for i in range(25):
+        history.append(_user(i))
+        store.sync(history)
+    store.close()
+
+    assert store.snapshot_path.exists()
+    reopened = SessionStore.open(store.session_id, root=tmp_path)
+    assert reopened.load() == history
+    assert reopened._since_snapshot == 5
+
+    # a corrupt snapshot falls back to the full log
+    store.snapshot_path.write_text('{"version": 1, "offset": 0, "messages": 99}\n')
+    assert SessionStore.open(store.session_id, root=tmp_path).load() == history
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    store = SessionStore.create(root=tmp_path)
+    store.sync([_user(1)])
+    store.close()
+    with open(store.log_path, "a") as f:
+        f.write('{"op":"add","m":{"role":"us')
+
+    assert SessionStore.open(store.session_id, root=tmp_path).load() == [_user(1)]
+
+
+def test_open_latest_and_unknown(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        SessionStore.open("latest", root=tmp_path)
+    with pytest.raises(FileNotFoundError):
+        SessionStore.open("nope", root=tmp_path)
+
+    store = SessionStore.create(root=tmp_path)
+    store.close()
+    assert SessionStore.open("latest", root=tmp_path).session_id == store.session_id
+    assert [s for s, _ in list_sessions(tmp_path)] == [store.session_id]
+
+
+def _session(root, session_id, size, age_days):
+    log = root / f"{session_id}.jsonl"
+    log.write_text("x" * size)
+    mtime = time.time() - age_days * 86400
+    os.utime(log, (mtime, mtime))
+
+
+def test_prune_by_age_then_total_size(tmp_path):
+    _session(tmp_path, "new", 600_000, 0)
+    _session(tmp_path, "mid", 600_000, 1)
+    _session(tmp_path, "old", 100, 2)
+    _session(tmp_path, "ancient", 100, 40)
+    (tmp_path / "ancient.snapshot.jsonl").write_text("{}")
+
+    removed = prune_sessions(tmp_path, max_age_days=30, max_total_mb=1)
+
+    # ancient is expired; mid no longer fits, and everything older goes with it
+    assert sorted(removed) == ["ancient", "mid", "old"]
+    assert [s for s, _ in list_sessions(tmp_path)] == ["new"]
+    assert not (tmp_path / "ancient.snapshot.jsonl").exists()
+
+
+def test_create_prunes_with_env_limits(tmp_path, monkeypatch):
+    _session(tmp_path, "stale", 10, 3)
+    monkeypatch.setenv("MCP_CLI_SESSION_MAX_AGE_DAYS", "2")
+    monkeypatch.setenv("MCP_CLI_SESSION_MAX_MB", "0")
+
+    store = SessionStore.create(root=tmp_path)
+    store.close()
+
+    assert [s for s, _ in list_sessions(tmp_path)] == [store.session_id]
@@ -0,0 +1,201 @@
+import pytest
+from rich.console import Console
+
+from mcp_cli.chat.streaming_handler import ResponseAccumulator, StreamingResponseHandler
+
+
+def feed(acc, text, size=3):
+    for i in range(0, len(text), size):
+        acc.append(text[i:i + size])
+
+
+# ----------------------------------------------------------------------------
+# ResponseAccumulator
+# ----------------------------------------------------------------------------
+
+def test_running_counters_match_full_text():
+    text = "The quick  brown fox\njumps over\tthe lazy dog.  "
+    acc = ResponseAccumulator()
+    feed(acc, text)
+    assert acc.text == text
+    assert acc.chars == len(text)
+    assert acc.words == len(text.split())
+
+
+def test_blocks_freeze_at_blank_lines():
+    acc = ResponseAccumulator()
+    feed(acc, "# Title\n\nFirst paragraph.\n\nStill typing")
+    assert [b.source for b in acc.blocks] == ["# Title\n\n", "First paragraph.\n\n"]
+    assert acc.tail == "Still typing"
+
+
+def test_code_fence_is_not_split():
+    acc = ResponseAccumulator()
+    feed(acc, "```py\nx = 1\n\ny = 2\n")
+    assert acc.blocks == []
+
+    feed(acc, "```\n\nafter")
+    assert len(acc.blocks) == 1
+    assert acc.blocks[0].source.startswith("```py") and acc.tail == "after"
+
+
+def test_render_matches_full_markdown():
+    from rich.markdown import Markdown
+
+    text = "Intro line.\n\n- a\n- b\n\nlast"
+    acc = ResponseAccumulator()
+    feed(acc, text)
+
+    def render(renderable):
+        console = Console(width=40, record=True, color_system=None)
+        console.print(renderable)
+        return console.export_text()
+
+    assert render(acc.renderable()) == render(Markdown(text))
+
+
+def test_large_fenced_block_is_parsed_a_bounded_number_of_times(monkeypatch):
+    import mcp_cli.chat.streaming_handler as sh
+
+    parses = []
+
+    class CountingMarkdown(sh.Markdown):
+        def __init__(self, source, *args, **kwargs):
+            parses.append(len(source))
+            super().__init__(source, *args, **kwargs)
+
+    monkeypatch.setattr(sh, "Markdown", CountingMarkdown)
+
+    acc = ResponseAccumulator()
+    acc.append("```py\n")
+    body = "".join(f"x_{i} = {i}\n" for i in range(20_000))
+    for i in range(0, len(body), 50):
+        acc.append(body[i:i + 50])
+        acc.renderable(" ▌")
+
+    repaints = len(body) // 50
+    assert len(parses) < 150 < repaints
+    assert sum(parses) < 4 * len(body)
+
+    # closing the fence freezes the block; nothing is left to re-parse
+    acc.append("```\n")
+    assert len(acc.blocks) == 1 and acc.tail == ""
+
+
+# ----------------------------------------------------------------------------
+# StreamingResponseHandler
+# ----------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_process_chunk_accumulates_response():
+    handler = StreamingResponseHandler(Console(record=True))
+    tool_calls = []
+    for piece in ["Hello", " wor", "ld"]:
+        await handler._process_chunk({"response": piece}, tool_calls)
+    assert handler.current_response == "Hello world"
+    assert handler.chunk_count == 3
+    assert tool_calls == []
+
+
+class BurstClient:
+    """Yields every chunk back-to-back, like a fast local model."""
+
+    def __init__(self, n):
+        self.n = n
+
+    async def create_completion(self, messages, tools=None, stream=False, **kwargs):
+        for i in range(self.n):
+            yield {"response": f"w{i} "}
+
+
+@pytest.mark.asyncio
+async def test_stream_is_not_throttled_and_repaints_are_coalesced(monkeypatch):
+    import io
+
+    handler = StreamingResponseHandler(Console(file=io.StringIO()), refresh_per_second=20)
+    paints = 0
+    original = handler._create_display_content
+
+    def counting():
+        nonlocal paints
+        paints += 1
+        return original()
+
+    monkeypatch.setattr(handler, "_create_display_content", counting)
+
+    result = await handler.stream_response(BurstClient(2000), messages=[])
+
+    assert result["chunks_received"] == 2000
+    assert result["response"].split()[-1] == "w1999"
+    # the old fixed 10ms sleep alone would have taken 20s
+    assert result["elapsed_time"] < 5
+    assert paints < 2000 / 10
+
+
+# ----------------------------------------------------------------------------
+# Streamed tool calls
+# ----------------------------------------------------------------------------
+
+def test_json_scanner_tracks_strings_and_escapes():
+    from mcp_cli.chat.streaming_handler import JSONArgumentScanner
+
+    doc = '{"sql": "SELECT \'}\' AS x, \\"{\\" AS y", "n": [1, {"a": 2}]}'
+    scanner = JSONArgumentScanner()
+    for ch in doc[:-1]:
+        scanner.feed(ch)
+        assert not scanner.complete
+    scanner.feed(doc[-1])
+    assert scanner.complete
+
+
+def delta(index, id=None, name=None, args=None):
+    fn = {}
+    if name is not None:
+        fn["name"] = name
+    if args is not None:
+        fn["arguments"] = args
+    item = {"index": index, "function": fn}
+    if id is not None:
+        item["id"] = id
+    return {"tool_calls": [item]}
+
+
+@pytest.mark.asyncio
+async def test_interleaved_tool_call_deltas(monkeypatch):
+    import json as _json
+    import mcp_cli.chat.streaming_handler as sh
+
+    parses = []
+    real_loads = _json.loads
+    monkeypatch.setattr(sh.json, "loads", lambda s, *a, **k: parses.append(s) or real_loads(s, *a, **k))
+
+    handler = StreamingResponseHandler(Console(record=True))
+    tool_calls = []
+    chunks = [
+        delta(0, id="a", name="read_query", args=""),
+        delta(1, id="b", name="list_tables", args=""),
+        delta(0, args='{"query": "SELECT '),
+        delta(0, args='\\"}\\" FROM t"'),
+        delta(1, args="{}"),
+        delta(0, args="}"),
+    ]
+    for chunk in chunks:
+        await handler._process_chunk(chunk, tool_calls)
+    handler._flush_tool_calls(tool_calls)
+
+    # each call's arguments were parsed exactly once
+    assert len(parses) == 2
+    assert [tc["function"]["name"] for tc in tool_calls] == ["read_query", "list_tables"]
+    assert real_loads(tool_calls[0]["function"]["arguments"]) == {"query": 'SELECT "}" FROM t'}
+    assert [tc["id"] for tc in tool_calls] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_tool_call_without_arguments_flushed_at_end():
+    handler = StreamingResponseHandler(Console(record=True))
+    tool_calls = []
+    await handler._process_chunk(delta(0, id="x", name="list_tables"), tool_calls)
+    assert tool_calls == []
+
+    handler._flush_tool_calls(tool_calls)
+    assert tool_calls[0]["function"] == {"name": "list_tables", "arguments": ""}
@@ -178,4 +178,78 @@ async def test_process_tool_calls_exception_in_call():
     ]
     assert len(error_entries) >= 1
     # Just check that it contains the exception message anywhere
-    assert any("Simulated call_tool exception" in e["content"] for e in error_entries)
\ No newline at end of file
+    assert any("Simulated call_tool exception" in e["content"] for e in error_entries)
+
+# ---------------------------
+# Batched ToolManager path
+# ---------------------------
+
+class DummyBatchToolManager:
+    """ToolManager stand-in that completes a batch in reverse order."""
+    def __init__(self):
+        self.batches = []
+
+    async def stream_execute_tools(self, calls):
+        from mcp_cli.tools.models import ToolCallResult
+        self.batches.append(list(calls))
+        for idx in reversed(range(len(calls))):
+            await asyncio.sleep(0)
+            name, args = calls[idx]
+            yield idx, ToolCallResult(tool_name=name, success=True, result={"n": args["n"]})
+
+
+class DummyToolManagerContext(DummyContext):
+    def __init__(self, tool_manager):
+        super().__init__()
+        self.tool_manager = tool_manager
+
+
+@pytest.mark.asyncio
+async def test_process_tool_calls_single_batch_in_order(monkeypatch):
+    monkeypatch.setattr("mcp_cli.chat.tool_processor.display_tool_call_result", lambda r: None)
+    tm = DummyBatchToolManager()
+    context = DummyToolManagerContext(tm)
+    processor = ToolProcessor(context, DummyUIManager())
+
+    tool_calls = [
+        {"function": {"name": f"srv_tool{i}", "arguments": json.dumps({"n": i})}, "id": f"c{i}"}
+        for i in range(5)
+    ]
+    await processor.process_tool_calls(tool_calls, {f"srv_tool{i}": f"srv.tool{i}" for i in range(5)})
+
+    # every call was submitted in one batch, using mapped MCP names
+    assert len(tm.batches) == 1
+    assert [name for name, _ in tm.batches[0]] == [f"srv.tool{i}" for i in range(5)]
+
+    # history keeps the LLM's order despite reverse completion
+    tool_msgs = [m for m in context.conversation_history if m["role"] == "tool"]
+    assert [m["tool_call_id"] for m in tool_msgs] == [f"c{i}" for i in range(5)]
+    assert json.loads(tool_msgs[3]["content"]) == {"n": 3}
+
+
+@pytest.mark.asyncio
+async def test_preparation_failure_keeps_its_place(monkeypatch):
+    monkeypatch.setattr("mcp_cli.chat.tool_processor.display_tool_call_result", lambda r: None)
+    tm = DummyBatchToolManager()
+    context = DummyToolManagerContext(tm)
+    processor = ToolProcessor(context, DummyUIManager())
+
+    prepare = processor._prepare_call
+
+    def flaky_prepare(idx, call, mapping):
+        if idx == 1:
+            raise RuntimeError("cannot prepare")
+        return prepare(idx, call, mapping)
+
+    monkeypatch.setattr(processor, "_prepare_call", flaky_prepare)
+    tool_calls = [
+        {"function": {"name": f"srv_tool{i}", "arguments": json.dumps({"n": i})}, "id": f"c{i}"}
+        for i in range(3)
+    ]
+    await processor.process_tool_calls(tool_calls)
+
+    assert [name for name, _ in tm.batches[0]] == ["srv.tool0", "srv.tool2"]
+    tool_msgs = [m for m in context.conversation_history if m["role"] == "tool"]
+    assert [m["tool_call_id"] for m in tool_msgs] == ["c0", "c1", "c2"]
+    assert "cannot prepare" in tool_msgs[1]["content"]
+    assert json.loads(tool_msgs[2]["content"]) == {"n": 2}
@@ -142,4 +142,256 @@ async def test_missing_prompt_and_input():
             tool_manager=tm,
             prompt=None,
             input_file=None
-        )
\ No newline at end of file
+        )
+
+class SlowClient:
+    """Fake LLM client: answers after a per-prompt delay, tracks concurrency."""
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def create_completion(self, messages, tools=None):
+        import asyncio
+        prompt = messages[-1]["content"]
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.05 if prompt == "slow" else 0.01)
+            if prompt == "boom":
+                raise RuntimeError("provider error")
+            return {"response": prompt.upper(), "tool_calls": []}
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def batch_cmd(monkeypatch):
+    monkeypatch.setattr("mcp_cli.chat.system_prompt.generate_system_prompt", lambda tools: "System prompt")
+    return CmdCommand()
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_concurrently_in_completion_order(batch_cmd, tmp_path):
+    batch = tmp_path / "prompts.jsonl"
+    batch.write_text(
+        '{"id": "a", "prompt": "slow"}\n'
+        '{"id": "b", "prompt": "fast"}\n'
+        "\n"
+        '"bare"\n'
+        "{not json\n"
+        '{"id": "e", "prompt": "boom"}\n'
+    )
+    out = tmp_path / "results.jsonl"
+    client = SlowClient()
+
+    counts = await batch_cmd._run_batch(
+        DummyToolManager(), client, batch=str(batch), output=str(out), concurrency=3
+    )
+
+    results = [json.loads(line) for line in out.read_text().splitlines()]
+    assert counts == {"completed": 3, "failed": 2, "skipped": 0}
+    assert client.peak == 3
+    by_id = {r["id"]: r for r in results}
+    assert by_id["a"]["response"] == "SLOW" and by_id[4]["response"] == "BARE"
+    assert "invalid JSON" in by_id[5]["error"] and by_id["e"]["error"] == "provider error"
+    # written as they finish: the slow record comes last
+    assert results[-1]["id"] == "a"
+
+
+@pytest.mark.asyncio
+async def test_batch_resume_skips_answered_ids(batch_cmd, tmp_path):
+    batch = tmp_path / "prompts.jsonl"
+    batch.write_text('{"id": 1, "prompt": "x"}\n{"id": 2, "input": "y"}\n{"id": 3, "prompt": "z"}\n')
+    out = tmp_path / "results.jsonl"
+    # id 1 answered, id 2 failed, id 3 interrupted mid-write
+    out.write_text('{"id": 1, "response": "X"}\n{"id": 2, "error": "timeout"}\n{"id": 3, "resp')
+    client = SlowClient()
+
+    counts = await batch_cmd._run_batch(
+        DummyToolManager(), client, batch=str(batch), output=str(out), prompt="Q: {{input}}"
+    )
+
+    assert counts == {"completed": 2, "failed": 0, "skipped": 1}
+    lines = out.read_text().splitlines()
+    assert lines[2] == '{"id": 3, "resp'
+    assert {json.loads(l)["id"]: json.loads(l)["response"] for l in lines[3:]} == {2: "Q: Y", 3: "Q: Z"}
+
+
+@pytest.mark.asyncio
+async def test_batch_resume_does_not_repeat_parse_errors(batch_cmd, tmp_path):
+    batch = tmp_path / "prompts.jsonl"
+    batch.write_text('"a"\n{broken\n')
+    out = tmp_path / "results.jsonl"
+
+    first = await batch_cmd._run_batch(DummyToolManager(), SlowClient(), batch=str(batch), output=str(out))
+    again = await batch_cmd._run_batch(DummyToolManager(), SlowClient(), batch=str(batch), output=str(out))
+
+    assert first == {"completed": 1, "failed": 1, "skipped": 0}
+    assert again == {"completed": 0, "failed": 0, "skipped": 2}
+    assert len(out.read_text().splitlines()) == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_stdin_does_not_block_running_conversations(batch_cmd, monkeypatch, capsys):
+    import os
+    import threading
+
+    read_fd, write_fd = os.pipe()
+    monkeypatch.setattr("sys.stdin", os.fdopen(read_fd, "r"))
+    first_answered = threading.Event()
+    answered_before_second_line = []
+
+    class _Client(SlowClient):
+        async def create_completion(self, messages, tools=None):
+            result = await super().create_completion(messages, tools)
+            first_answered.set()
+            return result
+
+    def _producer():
+        with os.fdopen(write_fd, "w") as fp:
+            fp.write('"one"\n')
+            fp.flush()
+            answered_before_second_line.append(first_answered.wait(5))
+            fp.write('"two"\n')
+
+    producer = threading.Thread(target=_producer)
+    producer.start()
+    counts = await batch_cmd._run_batch(DummyToolManager(), _Client(), batch="-")
+    producer.join()
+
+    assert answered_before_second_line == [True]
+    assert counts["completed"] == 2
+
+
+class ToolCallingClient:
+    """Fake LLM client: asks for several tools in one turn, then answers."""
+    def __init__(self, n):
+        self.n = n
+        self.turns = []
+
+    async def create_completion(self, messages, tools=None):
+        self.turns.append(list(messages))
+        if len(self.turns) == 1:
+            return {"response": None, "tool_calls": [
+                {"id": f"c{i}", "type": "function",
+                 "function": {"name": "echo_tool", "arguments": json.dumps({"i": i})}}
+                for i in range(self.n)
+            ]}
+        return {"response": "done", "tool_calls": []}
+
+
+class PeakExecutor:
+    """Executor stand-in tracking how many calls run at once; later calls finish first."""
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def execute(self, calls):
+        import asyncio
+        from types import SimpleNamespace
+        call = calls[0]
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01 * (6 - call.arguments["i"]))
+        finally:
+            self.active -= 1
+        return [SimpleNamespace(result=call.arguments, error=None)]
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_run_concurrently_in_llm_order(batch_cmd, monkeypatch):
+    from mcp_cli.tools.manager import ToolManager
+
+    tm = ToolManager(config_file="dummy", servers=[])
+    executor = PeakExecutor()
+    monkeypatch.setattr(tm, "_executor", executor)
+
+    async def _resolve(name):
+        return "srv", name
+
+    monkeypatch.setattr(tm, "_resolve_tool", _resolve)
+    client = ToolCallingClient(5)
+    conversation = [{"role": "user", "content": "go"}]
+    tools = [{"type": "function", "function": {"name": "echo_tool", "parameters": {}}}]
+
+    text = await batch_cmd._converse(client, conversation, tools, tm, tool_concurrency=2)
+
+    assert text == "done"
+    assert executor.peak == 2  # fanned out, but bounded by --tool-concurrency
+    tool_msgs = [m for m in client.turns[1] if m["role"] == "tool"]
+    assert [m["tool_call_id"] for m in tool_msgs] == [f"c{i}" for i in range(5)]
+    assert [json.loads(m["content"])["i"] for m in tool_msgs] == list(range(5))
+    assert {m["name"] for m in tool_msgs} == {"echo_tool"}
+
+
+class StreamingClient:
+    """Fake streaming LLM client: a tool call in fragments, then a streamed answer."""
+    def __init__(self):
+        self.turns = 0
+
+    async def create_completion(self, messages, tools=None, stream=False, **kwargs):
+        assert stream
+        self.turns += 1
+        if self.turns == 1:
+            yield {"response": "Checking"}
+            yield {"tool_calls": [{"id": "c0", "index": 0, "function": {"name": "echo_tool", "arguments": '{"i"'}}]}
+            yield {"tool_calls": [{"id": "c0", "index": 0, "function": {"arguments": ": 7}"}}]}
+        else:
+            for piece in ["The ", "answer ", "is 7."]:
+                yield {"response": piece}
+
+
+@pytest.fixture
+def stream_cmd(batch_cmd, monkeypatch):
+    class _TM(DummyToolManager):
+        async def stream_execute_tools(self, calls, max_concurrency=None):
+            for idx, (name, args) in enumerate(calls):
+                yield idx, ToolCallResult(tool_name=name, success=True, result=args)
+
+    monkeypatch.setattr(
+        "mcp_cli.cli.commands.cmd.ModelManager",
+        lambda: Mock(get_client=Mock(return_value=StreamingClient())),
+    )
+    return batch_cmd, _TM()
+
+
+@pytest.mark.asyncio
+async def test_stream_writes_text_as_it_arrives(stream_cmd, tmp_path):
+    cmd, tm = stream_cmd
+    out = tmp_path / "answer.txt"
+
+    result = await cmd.execute(tool_manager=tm, prompt="q", output=str(out), stream=True)
+
+    assert result == "The answer is 7."
+    assert out.read_text() == "Checking\nThe answer is 7.\n"
+
+
+@pytest.mark.asyncio
+async def test_stream_raw_emits_jsonl_events(stream_cmd, capsys):
+    cmd, tm = stream_cmd
+
+    await cmd.execute(tool_manager=tm, prompt="q", raw=True, stream=True)
+
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(e["type"], e["turn"]) for e in events] == [
+        ("text", 0), ("tool_call", 0), ("tool_result", 0),
+        ("text", 1), ("text", 1), ("text", 1), ("done", 1),
+    ]
+    assert events[1] == {"type": "tool_call", "turn": 0, "id": "c0", "name": "echo_tool", "arguments": '{"i": 7}'}
+    assert events[2]["id"] == "c0" and json.loads(events[2]["content"]) == {"i": 7}
+    assert events[-1]["response"] == "The answer is 7."
+
+
+@pytest.mark.parametrize("option", ["--concurrency", "--tool-concurrency"])
+def test_concurrency_options_must_be_positive(option):
+    from typer.testing import CliRunner
+
+    app = typer.Typer()
+    ran = []
+    CmdCommand().register(app, run_command=lambda *a, **k: ran.append(a))
+
+    result = CliRunner().invoke(app, ["cmd", "--prompt", "hi", option, "0"])
+    assert result.exit_code != 0
+    assert "0 is not in the range x>=1" in result.output
+    assert ran == []
@@ -0,0 +1,75 @@
+# tests/mcp_cli/cli/test_startup_time.py
+"""
+Cold-start budget for the mcp-cli entry point, measured with ``-X importtime``.
+
+``--help`` and ``provider list`` must not import the tool / MCP stack or the
+chuk-llm client layer; those are loaded only by the commands that use them.
+"""
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+# Generous budgets (seconds of cumulative import time); the lazy entry point
+# sits well below them, eagerly importing chuk-llm's client alone exceeds them.
+HELP_BUDGET = 1.0
+PROVIDER_BUDGET = 1.5
+# Wall clock for a warm `provider list`, including interpreter start-up and
+# the Ollama check (which runs alongside the catalogue load)
+PROVIDER_WALL_BUDGET = 3.0
+
+HEAVY_MODULES = ("chuk_tool_processor", "chuk_mcp", "prompt_toolkit", "chuk_llm.llm.client")
+
+
+def _importtime(*args, cwd, env=None):
+    """Run python -X importtime and return ({module: cumulative_us}, top-level total seconds)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+        env=env,
+        timeout=120,
+    )
+    modules = {}
+    total = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time:  self_us |  cumulative_us | <indent>module"
+        _, cumulative_us, name = line.split("|")
+        modules[name.strip()] = int(cumulative_us)
+        if not name[1:].startswith(" "):  # top-level import
+            total += int(cumulative_us)
+    return modules, total / 1e6
+
+
+def _heavy(modules):
+    return sorted(m for m in modules if m.startswith(HEAVY_MODULES))
+
+
+@pytest.mark.parametrize("argv", [["--help"]])
+def test_help_import_budget(argv, tmp_path):
+    modules, total = _importtime("-m", "mcp_cli.main", *argv, cwd=tmp_path)
+    assert "typer" in modules  # sanity: importtime output was captured
+    assert _heavy(modules) == []
+    assert total < HELP_BUDGET
+
+
+def test_provider_list_import_budget(tmp_path):
+    # The real command, with its own HOME; the first run fills the provider
+    # catalogue cache, the second is the warm start users see every time.
+    env = dict(os.environ, HOME=str(tmp_path), MCP_CLI_DAEMON="0")
+    _importtime("-m", "mcp_cli.main", "provider", "list", cwd=tmp_path, env=env)
+    assert (tmp_path / ".mcp-cli" / "provider_catalogue.json").exists()
+
+    started = time.perf_counter()
+    modules, total = _importtime("-m", "mcp_cli.main", "provider", "list", cwd=tmp_path, env=env)
+    elapsed = time.perf_counter() - started
+
+    assert "mcp_cli.commands.provider" in modules
+    assert _heavy(modules) == []
+    assert total < PROVIDER_BUDGET
+    assert elapsed < PROVIDER_WALL_BUDGET
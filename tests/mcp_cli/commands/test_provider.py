@@ -337,6 +337,122 @@ class TestProviderListRendering:
         assert "Error" in output or "failed" in output.lower()
 
 
+class TestProviderDiagnostics:
+    """Test the concurrent diagnostic probe rendering."""
+
+    @pytest.mark.asyncio
+    async def test_diagnostic_probes_ready_providers(self, capsys):
+        from mcp_cli.commands.provider import _render_diagnostic_async
+
+        class Client:
+            def __init__(self, provider):
+                self.provider = provider
+
+            async def create_completion(self, messages):
+                if self.provider == "anthropic":
+                    raise RuntimeError("invalid key")
+                return {"response": "pong"}
+
+        mock_manager = Mock()
+        mock_manager.list_providers.return_value = ["openai", "anthropic", "groq"]
+        mock_manager.list_available_providers.return_value = {
+            "openai": {"models": ["gpt-4o-mini"], "default_model": "gpt-4o-mini", "has_api_key": True},
+            "anthropic": {"models": ["claude"], "default_model": "claude", "has_api_key": True},
+            "groq": {"models": ["llama"], "default_model": "llama", "has_api_key": False},
+        }
+        mock_manager.get_client_for_provider.side_effect = lambda p, m: Client(p)
+
+        await _render_diagnostic_async(mock_manager, None, (False, 0), probe=True)
+
+        output = capsys.readouterr().out
+        assert "Provider Diagnostics" in output
+        assert "Failed" in output
+        # one probe per model is not a distribution: no percentiles
+        assert "Probe Latency" not in output
+        # groq has no key, so it is listed but never probed
+        probed = [c.args[0] for c in mock_manager.get_client_for_provider.call_args_list]
+        assert sorted(probed) == ["anthropic", "openai"]
+
+    @pytest.mark.asyncio
+    async def test_diagnostic_single_provider_probes_several_models(self, capsys):
+        from mcp_cli.commands.provider import _render_diagnostic_async
+
+        client = Mock()
+        async def create_completion(messages):
+            return {"response": "pong"}
+        client.create_completion = create_completion
+
+        mock_manager = Mock()
+        mock_manager.validate_provider.return_value = True
+        mock_manager.list_available_providers.return_value = {
+            "openai": {
+                "models": ["gpt-4o", "gpt-4o-mini", "gpt-4.1"],
+                "default_model": "gpt-4o-mini",
+                "has_api_key": True,
+            },
+        }
+        mock_manager.get_client_for_provider.return_value = client
+
+        await _render_diagnostic_async(mock_manager, "openai", (False, 0))
+
+        models = [c.args[1] for c in mock_manager.get_client_for_provider.call_args_list]
+        assert sorted(models) == ["gpt-4.1", "gpt-4o", "gpt-4o-mini"]
+        assert "Probe Latency" not in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_diagnostic_samples_give_latency_percentiles(self, capsys):
+        from mcp_cli.commands.provider import _render_diagnostic_async
+
+        async def create_completion(messages):
+            return {"response": "pong"}
+
+        mock_manager = Mock()
+        mock_manager.list_providers.return_value = ["openai"]
+        mock_manager.list_available_providers.return_value = {
+            "openai": {"models": ["gpt-4o-mini"], "default_model": "gpt-4o-mini", "has_api_key": True},
+        }
+        mock_manager.get_client_for_provider.return_value = Mock(create_completion=create_completion)
+
+        await _render_diagnostic_async(mock_manager, None, (False, 0), samples=3)
+
+        assert mock_manager.get_client_for_provider.call_count == 3
+        output = capsys.readouterr().out
+        assert "Probe Latency" in output and "p50" in output
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("args, probed", [
+        (["diagnostic"], []),
+        (["diagnostic", "--probe"], ["openai"]),
+        (["diagnostic", "openai"], ["openai"]),
+        (["diagnostic", "--samples", "2"], ["openai", "openai"]),
+    ])
+    async def test_diagnostic_only_probes_when_asked(self, args, probed, capsys):
+        async def create_completion(messages):
+            return {"response": "pong"}
+
+        mock_manager = Mock()
+        mock_manager.list_providers.return_value = ["openai", "groq"]
+        mock_manager.validate_provider.return_value = True
+        mock_manager.list_available_providers.return_value = {
+            "openai": {"models": ["gpt-4o-mini"], "default_model": "gpt-4o-mini", "has_api_key": True},
+            "groq": {"models": ["llama"], "default_model": "llama", "has_api_key": False},
+        }
+        mock_manager.get_client_for_provider.return_value = Mock(create_completion=create_completion)
+
+        async def no_ollama():
+            return False, 0
+
+        with patch("mcp_cli.commands.provider._probe_ollama", no_ollama):
+            await provider_action_async(args, context={"model_manager": mock_manager})
+
+        # completions are billed: none are sent unless a probe was requested
+        assert [c.args[0] for c in mock_manager.get_client_for_provider.call_args_list] == probed
+        output = capsys.readouterr().out
+        assert "openai" in output
+        assert ("--probe" in output) == (not probed)
+
+
 class TestProviderSyncWrapper:
     """Test the synchronous wrapper."""
     
@@ -0,0 +1,17 @@
+import json
+
+from mcp_cli.llm.tools_handler import format_tool_response
+
+
+def test_record_lists_stay_pretty_printed_json():
+    rows = [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
+    assert format_tool_response(rows) == json.dumps(rows, indent=2)
+
+
+def test_text_records_skip_untyped_items():
+    records = [
+        {"type": "text", "text": "first"},
+        {"note": "no type"},
+        {"type": "text"},
+    ]
+    assert format_tool_response(records) == "first\nNo content"
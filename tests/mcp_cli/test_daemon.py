@@ -0,0 +1,164 @@
+import asyncio
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+import typer
+
+from mcp_cli import daemon as daemon_mod
+from mcp_cli.daemon import CommandDaemon, _RoutedStream, forward_command
+from mcp_cli.run_command import run_command
+
+
+@pytest.fixture
+def running(tmp_path, monkeypatch):
+    """A daemon on a temp socket with stdout / stderr routed as in `mcp-cli serve`."""
+    monkeypatch.delenv("MCP_CLI_DAEMON", raising=False)
+    monkeypatch.setenv("SOURCE_FILESYSTEMS", '["/work"]')
+    calls = []
+
+    async def _echo(daemon, params):
+        calls.append(params)
+        print(f"hello {params['who']}")
+        print("progress", file=sys.stderr)
+        if params.get("fail") == "usage":
+            raise typer.BadParameter("bad input")
+        if params.get("fail"):
+            raise ValueError("boom")
+        return {"tm": daemon.tool_manager.name}
+
+    monkeypatch.setitem(daemon_mod.HANDLERS, "echo", _echo)
+    monkeypatch.setattr("sys.stdout", _RoutedStream(sys.stdout, "stdout"))
+    monkeypatch.setattr("sys.stderr", _RoutedStream(sys.stderr, "stderr"))
+    config = tmp_path / "server_config.json"
+    config.write_text("{}")
+    d = CommandDaemon(SimpleNamespace(name="warm"), None, str(config), ["sqlite"])
+    return d, str(tmp_path / "d.sock"), str(config), calls
+
+
+@pytest.mark.asyncio
+async def test_forwarded_command_streams_output_and_result(running, capsys):
+    d, path, config, calls = running
+    await d.start(path)
+    try:
+        handled, result = await forward_command("echo", config, ["sqlite"], {"who": "you", "server_names": {0: "x"}}, path)
+    finally:
+        await d.close()
+
+    assert handled and result == {"tm": "warm"}
+    captured = capsys.readouterr()
+    assert "hello you" in captured.out and "progress" not in captured.out
+    assert "progress" in captured.err
+    assert calls == [{"who": "you"}]  # process-local params are not sent
+    assert not os.path.exists(path)
+
+
+@pytest.mark.asyncio
+async def test_mismatched_servers_fall_back(running):
+    d, path, config, calls = running
+    await d.start(path)
+    try:
+        assert await forward_command("echo", config, ["sqlite", "other"], {"who": "x"}, path) == (False, None)
+        assert await forward_command("unknown", config, ["sqlite"], {}, path) == (False, None)
+    finally:
+        await d.close()
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_other_cwd_or_provider_env_falls_back(running, monkeypatch, tmp_path):
+    d, path, config, calls = running
+    await d.start(path)
+    try:
+        monkeypatch.chdir(tmp_path)
+        assert await forward_command("echo", config, ["sqlite"], {"who": "x"}, path) == (False, None)
+        monkeypatch.chdir(d.cwd)
+        monkeypatch.setenv("OPENAI_API_KEY", "someone-else")
+        assert await forward_command("echo", config, ["sqlite"], {"who": "x"}, path) == (False, None)
+    finally:
+        await d.close()
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_unresponsive_daemon_falls_back(tmp_path, monkeypatch):
+    monkeypatch.delenv("MCP_CLI_DAEMON", raising=False)
+    monkeypatch.setenv("MCP_CLI_DAEMON_TIMEOUT", "0.1")
+    path = str(tmp_path / "hung.sock")
+
+    async def _never_answer(reader, writer):
+        await asyncio.sleep(10)
+
+    server = await asyncio.start_unix_server(_never_answer, path=path)
+    try:
+        assert await forward_command("cmd", "c.json", [], {"prompt": "hi"}, path) == (False, None)
+    finally:
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_ping_forwards_caller_server_names(monkeypatch):
+    seen = {}
+
+    async def _ping(tm, server_names=None, targets=()):
+        seen.update(server_names=server_names, targets=list(targets))
+        return True
+
+    monkeypatch.setattr("mcp_cli.commands.ping.ping_action_async", _ping)
+    forwarded = daemon_mod._prepare_params("ping", {"server_names": {0: "db"}, "targets": ["db"]})
+    daemon = CommandDaemon(SimpleNamespace(server_names={0: "sqlite"}), None, "c.json", [])
+
+    assert await daemon_mod._run_ping(daemon, json.loads(json.dumps(forwarded)))
+    assert seen == {"server_names": {0: "db"}, "targets": ["db"]}
+
+
+@pytest.mark.asyncio
+async def test_errors_are_reraised_in_the_client(running):
+    d, path, config, _ = running
+    await d.start(path)
+    try:
+        with pytest.raises(typer.BadParameter):
+            await forward_command("echo", config, ["sqlite"], {"who": "x", "fail": "usage"}, path)
+        with pytest.raises(RuntimeError, match="boom"):
+            await forward_command("echo", config, ["sqlite"], {"who": "x", "fail": True}, path)
+    finally:
+        await d.close()
+
+
+@pytest.mark.asyncio
+async def test_no_daemon_or_stale_socket_runs_in_process(tmp_path, monkeypatch):
+    stale = tmp_path / "stale.sock"
+    stale.write_text("")
+    monkeypatch.setenv("MCP_CLI_SOCKET", str(stale))
+    assert await forward_command("cmd", "c.json", [], {}, str(tmp_path / "none.sock")) == (False, None)
+    assert await forward_command("cmd", "c.json", [], {}, str(stale)) == (False, None)
+
+    # run_command falls through to a normal in-process ToolManager
+    class _TM:
+        def __init__(self, *args):
+            pass
+
+        async def initialize(self, **kwargs):
+            return True
+
+        async def close(self):
+            pass
+
+    monkeypatch.setattr("mcp_cli.tools.manager.ToolManager", _TM)
+
+    async def _command(tool_manager, **params):
+        return isinstance(tool_manager, _TM)
+
+    assert await run_command(_command, config_file="c.json", servers=[], extra_params={"daemon_command": "cmd"})
+
+
+def test_cmd_params_stay_local_with_credentials(monkeypatch):
+    assert daemon_mod._prepare_params("cmd", {"api_key": "secret"}) is None
+
+    monkeypatch.setattr("sys.stdin", SimpleNamespace(read=lambda: "piped"))
+    params = {"input": "-", "output": "out.txt"}
+    forwarded = daemon_mod._prepare_params("cmd", params)
+    assert params["input_text"] == forwarded["input_text"] == "piped"
+    assert forwarded["output"] == os.path.abspath("out.txt")
@@ -17,6 +17,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from mcp_cli.model_manager import ModelManager
 
 
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path, monkeypatch):
+    """Keep preferences and the provider catalogue out of the real home directory."""
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    return tmp_path
+
+
 class TestModelManagerInitialization:
     """Test ModelManager initialization and configuration loading."""
     
@@ -345,6 +352,43 @@ class TestClientCreation:
         assert client == mock_client
         mock_get_client.assert_called_once_with(provider="openai", model="gpt-4o-mini")
     
+    @patch('mcp_cli.model_manager.get_client')
+    def test_get_client_is_cached_until_switch(self, mock_get_client, mock_manager_for_clients):
+        """Repeated get_client calls validate and create the client only once."""
+        manager = mock_manager_for_clients
+        manager._save_user_preferences = Mock()
+        mock_get_client.side_effect = lambda provider, model: Mock(name=f"{provider}/{model}")
+        manager._user_prefs["active_provider"] = "openai"
+        manager._user_prefs["active_model"] = "gpt-4o"
+        
+        first = manager.get_client()
+        for _ in range(5):
+            assert manager.get_client() is first
+        assert mock_get_client.call_count == 1
+        assert manager.validate_provider.call_count == 1
+        
+        # switching invalidates the pinned client
+        manager.set_active_model("gpt-4o-mini")
+        second = manager.get_client()
+        assert second is not first
+        assert mock_get_client.call_count == 2
+        
+        # switching back reuses the (provider, model, api_base) entry
+        manager.set_active_model("gpt-4o")
+        assert manager.get_client() is first
+        assert mock_get_client.call_count == 2
+    
+    @patch('mcp_cli.model_manager.get_client')
+    def test_reconfigure_invalidates_clients(self, mock_get_client, mock_manager_for_clients):
+        """configure_provider / reload_config drop cached clients."""
+        manager = mock_manager_for_clients
+        mock_get_client.side_effect = lambda provider, model: Mock()
+        
+        first = manager.get_client()
+        manager.reload_config()
+        assert manager.get_client() is not first
+        assert mock_get_client.call_count == 2
+    
     def test_get_client_for_provider_invalid(self, mock_manager_for_clients):
         """Test client creation fails for invalid provider."""
         manager = mock_manager_for_clients
@@ -704,4 +748,25 @@ class TestModelManagerIntegration:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
+
+
+class TestProviderCatalogueSnapshot:
+    """The on-disk provider catalogue must follow the provider environment."""
+
+    def test_exported_api_key_changes_status(self, monkeypatch):
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+        def list_available_providers():
+            import os
+            return {"openai": {"has_api_key": bool(os.getenv("OPENAI_API_KEY"))}}
+
+        monkeypatch.setattr("mcp_cli.model_manager.get_config", Mock(), raising=False)
+        monkeypatch.setattr(
+            "mcp_cli.model_manager.list_available_providers", list_available_providers, raising=False
+        )
+
+        assert ModelManager().list_available_providers()["openai"]["has_api_key"] is False
+
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        assert ModelManager().list_available_providers()["openai"]["has_api_key"] is True
@@ -0,0 +1,61 @@
+import json
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from mcp_cli.provider_catalogue import ProviderCatalogue
+
+
+@pytest.fixture
+def snapshot(tmp_path, monkeypatch):
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+    (tmp_path / ".mcp-cli").mkdir()
+    return tmp_path / ".mcp-cli" / "provider_catalogue.json"
+
+
+def test_lookups_are_memoised_and_persisted(snapshot):
+    loader = Mock(return_value=["openai", "ollama"])
+    catalogue = ProviderCatalogue(snapshot)
+    assert catalogue.get("providers", loader) == ["openai", "ollama"]
+    assert catalogue.get("providers", loader) == ["openai", "ollama"]
+    assert loader.call_count == 1
+
+    # a fresh process starts from the snapshot
+    again = ProviderCatalogue(snapshot)
+    assert again.get("providers", Mock(side_effect=AssertionError)) == ["openai", "ollama"]
+
+
+def test_expired_snapshot_is_ignored(snapshot):
+    ProviderCatalogue(snapshot, ttl=60).get("providers", lambda: ["old"])
+    data = json.loads(snapshot.read_text())
+    data["created_at"] = time.time() - 120
+    snapshot.write_text(json.dumps(data))
+
+    assert ProviderCatalogue(snapshot, ttl=60).get("providers", lambda: ["new"]) == ["new"]
+
+
+def test_config_change_invalidates_snapshot(snapshot, tmp_path):
+    ProviderCatalogue(snapshot).get("providers", lambda: ["old"])
+    (tmp_path / ".chuk_llm").mkdir()
+    (tmp_path / ".chuk_llm" / "providers.yaml").write_text("openai: {}\n")
+
+    assert ProviderCatalogue(snapshot).get("providers", lambda: ["new"]) == ["new"]
+
+
+def test_rejected_values_are_not_cached(snapshot):
+    catalogue = ProviderCatalogue(snapshot)
+    loader = Mock(return_value={"error": "boom"})
+    keep = lambda info: "error" not in info
+    catalogue.get("info:x", loader, keep=keep)
+    catalogue.get("info:x", loader, keep=keep)
+    assert loader.call_count == 2
+
+
+def test_invalidate_removes_snapshot(snapshot):
+    catalogue = ProviderCatalogue(snapshot)
+    catalogue.get("providers", lambda: ["a"])
+    assert snapshot.exists()
+    catalogue.invalidate()
+    assert not snapshot.exists()
+    assert catalogue.get("providers", lambda: ["b"]) == ["b"]
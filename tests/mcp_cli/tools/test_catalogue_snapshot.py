@@ -0,0 +1,121 @@
+# tests/mcp_cli/tools/test_catalogue_snapshot.py
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from chuk_tool_processor.mcp.transport.models import MCPToolDefinition
+from chuk_tool_processor.mcp.transport.models import ServerInfo as StreamServerInfo
+
+import mcp_cli.tools.manager as manager_mod
+from mcp_cli.tools.catalogue_snapshot import CatalogueSnapshot, config_hash
+from mcp_cli.tools.manager import ToolManager
+
+SQLITE = {"command": "uvx", "args": ["mcp-server-sqlite"]}
+
+
+def test_snapshot_roundtrip_is_keyed_by_config(tmp_path):
+    snap = CatalogueSnapshot(tmp_path)
+    tools = [{"name": "read_query", "inputSchema": {"type": "object"}}]
+    snap.save("sqlite", config_hash(SQLITE), tools)
+
+    assert snap.load("sqlite", config_hash(SQLITE)) == tools
+    assert snap.load("sqlite", config_hash({**SQLITE, "args": ["other"]})) is None
+    assert snap.load("missing", config_hash(SQLITE)) is None
+
+    (tmp_path / "sqlite.json").write_text("{not json")
+    assert snap.load("sqlite", config_hash(SQLITE)) is None
+
+
+def test_config_hash_ignores_key_order():
+    assert config_hash({"a": 1, "b": [1, 2]}) == config_hash({"b": [1, 2], "a": 1})
+
+
+@pytest.fixture
+def warm_manager(monkeypatch, tmp_path):
+    """ToolManager with a fake ``sqlite`` server whose startup is held until released."""
+    cfg = tmp_path / "server_config.json"
+    cfg.write_text(json.dumps({"mcpServers": {"sqlite": SQLITE}}))
+
+    state = SimpleNamespace(release=asyncio.Event(), live=["read_query"], registered=0)
+
+    async def fake_create(cls, config_file, servers, server_names=None, **kwargs):
+        await state.release.wait()
+        return SimpleNamespace(
+            close=fake_close,
+            transports={"sqlite": object()},
+            all_tools=[MCPToolDefinition(name=n) for n in state.live],
+            server_info=[StreamServerInfo(id=0, name="sqlite", tools=len(state.live), status="Up")],
+        )
+
+    async def fake_close():
+        pass
+
+    async def fake_register(sm, namespace):
+        state.registered += 1
+        return []
+
+    monkeypatch.setattr(manager_mod.StreamManager, "create", classmethod(fake_create))
+    monkeypatch.setattr(manager_mod, "register_mcp_tools", fake_register)
+
+    def make():
+        tm = ToolManager(config_file=str(cfg), servers=["sqlite"])
+        tm.catalogue_snapshot = CatalogueSnapshot(tmp_path / "cache")
+        return tm
+
+    return make, state
+
+
+@pytest.mark.asyncio
+async def test_first_run_writes_snapshot_then_warm_start_skips_waiting(warm_manager, tmp_path):
+    make, state = warm_manager
+
+    # cold start: nothing cached, wait for the live server and save its tools
+    state.release.set()
+    tm = make()
+    assert await tm.initialize(wait_for_all=True)
+    await tm.close()
+    assert CatalogueSnapshot(tmp_path / "cache").load("sqlite", config_hash(SQLITE)) == [
+        MCPToolDefinition(name="read_query").model_dump()
+    ]
+
+    # warm start: tools are offered before the server has connected
+    state.release = asyncio.Event()
+    state.registered = 0
+    tm = make()
+    assert await asyncio.wait_for(tm.initialize(wait_for_all=False), timeout=1)
+    assert tm.server_startup["sqlite"].status == "starting"
+    assert tm.stream_manager.tool_to_server_map == {"read_query": "sqlite"}
+    assert state.registered == 1
+
+    # identical live tool list: nothing is re-registered
+    state.release.set()
+    await tm.wait_for_servers()
+    assert tm.server_startup["sqlite"].status == "ready"
+    assert state.registered == 1
+    assert len(tm.stream_manager.all_tools) == 1
+    await tm.close()
+
+
+@pytest.mark.asyncio
+async def test_changed_server_is_reconciled(warm_manager, tmp_path):
+    make, state = warm_manager
+    CatalogueSnapshot(tmp_path / "cache").save(
+        "sqlite", config_hash(SQLITE), [{"name": "read_query"}, {"name": "old_tool"}]
+    )
+
+    tm = make()
+    await tm.initialize(wait_for_all=False)
+    assert set(tm.stream_manager.tool_to_server_map) == {"read_query", "old_tool"}
+
+    state.live = ["read_query", "write_query"]
+    state.release.set()
+    await tm.wait_for_servers()
+
+    assert set(tm.stream_manager.tool_to_server_map) == {"read_query", "write_query"}
+    assert sorted(t.name for t in tm.stream_manager.all_tools) == ["read_query", "write_query"]
+    assert ("stdio", "old_tool") in tm._retired_tools
+    assert [t["name"] for t in CatalogueSnapshot(tmp_path / "cache").load("sqlite", config_hash(SQLITE))] == [
+        "read_query", "write_query"
+    ]
+    await tm.close()
@@ -0,0 +1,99 @@
+import time
+
+import pytest
+
+from mcp_cli.tools.result_cache import ToolResultCache
+from mcp_cli.tools.models import ToolCallResult
+
+
+def ok(value):
+    return ToolCallResult(tool_name="t", success=True, result=value)
+
+
+# ----------------------------------------------------------------------------
+# Policy
+# ----------------------------------------------------------------------------
+
+def test_ttl_opt_in_and_deny():
+    cache = ToolResultCache(
+        allow={"list_*": 60, "sqlite.describe": 30},
+        deny=["list_secrets"],
+    )
+    assert cache.ttl_for("stdio", "list_tables") == 60
+    assert cache.ttl_for("stdio", "describe", server="sqlite") == 30
+    assert cache.ttl_for("stdio", "describe", server="other") is None
+    assert cache.ttl_for("stdio", "list_secrets") is None
+    assert cache.ttl_for("stdio", "write_query") is None
+
+
+def test_disabled_without_allow_list():
+    assert ToolResultCache().ttl_for("stdio", "anything") is None
+    cache = ToolResultCache.from_config({"enabled": False, "allow": {"*": 10}})
+    assert cache.ttl_for("stdio", "anything") is None
+
+
+def test_key_is_canonical():
+    a = ToolResultCache.make_key("ns", "t", {"a": 1, "b": [1, 2]})
+    b = ToolResultCache.make_key("ns", "t", {"b": [1, 2], "a": 1})
+    assert a == b
+    assert a != ToolResultCache.make_key("other", "t", {"a": 1, "b": [1, 2]})
+
+
+# ----------------------------------------------------------------------------
+# Storage
+# ----------------------------------------------------------------------------
+
+def test_hit_miss_and_expiry(monkeypatch):
+    cache = ToolResultCache(allow={"*": 10})
+    key = cache.make_key("ns", "t", {})
+    assert cache.get(key) is None
+
+    cache.put(key, "ns", "t", ok("value"), ttl=10)
+    assert cache.get(key).result == "value"
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert cache.get(key) is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 2, 0)
+
+
+def test_hits_are_copies():
+    cache = ToolResultCache(allow={"*": 10})
+    rows = [{"id": 1}]
+    cache.put("k", "ns", "t", ok(rows), ttl=10)
+
+    # neither the caller that stored the result nor one that hit it can
+    # change what later hits see
+    rows.append({"id": 2})
+    cache.get("k").result[0]["id"] = 99
+    assert cache.get("k").result == [{"id": 1}]
+
+
+def test_failures_are_not_cached():
+    cache = ToolResultCache(allow={"*": 10})
+    cache.put("k", "ns", "t", ToolCallResult("t", False, error="boom"), ttl=10)
+    assert len(cache) == 0
+
+
+def test_lru_eviction_by_bytes():
+    cache = ToolResultCache(allow={"*": 10}, max_bytes=10)
+    cache.put("a", "ns", "t", ok("aaaa"), ttl=10)
+    cache.put("b", "ns", "t", ok("bbbb"), ttl=10)
+    cache.get("a")                       # "b" is now least recently used
+    cache.put("c", "ns", "t", ok("cccc"), ttl=10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats().evictions == 1
+    assert cache.stats().bytes == 8
+
+
+def test_clear_by_tool():
+    cache = ToolResultCache(allow={"*": 10})
+    cache.put("a", "ns", "t1", ok(1), ttl=10)
+    cache.put("b", "ns", "t2", ok(2), ttl=10)
+    assert cache.clear(tool="t1") == 1
+    assert cache.entries_by_tool() == {"ns.t2": (1, 1)}
+    assert cache.clear() == 1
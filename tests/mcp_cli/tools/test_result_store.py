@@ -0,0 +1,60 @@
+# tests/mcp_cli/tools/test_result_store.py
+import pytest
+
+from mcp_cli.tools.result_store import ResultStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ResultStore(root=tmp_path, max_inline_bytes=1000, preview_bytes=200)
+
+
+def test_small_results_stay_inline(store, tmp_path):
+    assert store.spill("t", "x" * 1000) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_large_result_is_spilled_with_preview(store):
+    text = "".join(f"row {i}\n" for i in range(1000))
+    spilled = store.spill("sqlite.read_query", text)
+
+    assert spilled is not None
+    assert spilled.size == len(text.encode())
+    assert spilled.path.read_text() == text
+    assert spilled.preview.startswith("row 0\n")
+    assert spilled.preview.endswith("row 999\n")
+    assert spilled.handle in spilled.preview
+    assert len(spilled.preview) < 500
+
+    # identical content maps to the same handle
+    assert store.spill("sqlite.read_query", text).handle == spilled.handle
+
+
+def test_read_pages_through_result(store):
+    text = "é" * 3000  # two bytes per character
+    spilled = store.spill("t", text)
+
+    pages, offset = [], 0
+    while offset is not None:
+        page = store.read(spilled.handle, offset, 333)
+        pages.append(page["content"])
+        offset = page["next_offset"]
+        assert page["total_bytes"] == 6000
+
+    assert "".join(pages) == text
+
+
+def test_read_limit_is_capped_and_bad_handles_rejected(store):
+    spilled = store.spill("t", "y" * 5000)
+    assert len(store.read(spilled.handle, 0, 10**9)["content"]) == 500
+
+    with pytest.raises(ValueError):
+        store.read("../../etc/passwd")
+    with pytest.raises(FileNotFoundError):
+        store.read("r-0000000000000000")
+
+
+def test_disabled_store_never_spills(tmp_path):
+    store = ResultStore.from_config({"maxInlineBytes": 0, "dir": str(tmp_path)})
+    assert not store.enabled
+    assert store.spill("t", "z" * 10**6) is None
@@ -0,0 +1,104 @@
+import asyncio
+import json
+
+import pytest
+
+from mcp_cli.config import load_scheduling_config
+from mcp_cli.tools.scheduler import ToolScheduler
+
+
+@pytest.mark.asyncio
+async def test_lane_limit_is_enforced():
+    sched = ToolScheduler(global_limit=4, lane_limits={"slow": 1})
+    running, peak = 0, 0
+
+    async def call():
+        nonlocal running, peak
+        async with sched.slot("slow"):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(call() for _ in range(5)))
+    assert peak == 1
+    stats = sched.get_stats()["slow"]
+    assert stats.completed == 5 and stats.queued == 0 and stats.max_wait > 0
+
+
+@pytest.mark.asyncio
+async def test_slow_lane_does_not_starve_fast_lane():
+    sched = ToolScheduler(global_limit=2, lane_limits={"slow": 1})
+    order = []
+
+    async def call(lane, delay):
+        async with sched.slot(lane):
+            await asyncio.sleep(delay)
+            order.append(lane)
+
+    slow = [asyncio.create_task(call("slow", 0.05)) for _ in range(4)]
+    await asyncio.sleep(0)
+    fast = [asyncio.create_task(call("fast", 0.001)) for _ in range(3)]
+    await asyncio.gather(*fast)
+
+    # all fast calls finished while the slow backlog is still queued
+    assert order.count("slow") <= 1
+    assert sched.queue_depth("slow") >= 2
+    await asyncio.gather(*slow)
+
+
+@pytest.mark.asyncio
+async def test_round_robin_and_priority():
+    sched = ToolScheduler(global_limit=1, lane_priorities={"vip": 5})
+    order = []
+
+    async def call(lane):
+        async with sched.slot(lane):
+            order.append(lane)
+            await asyncio.sleep(0)
+
+    blocker = asyncio.Event()
+
+    async def hold():
+        async with sched.slot("a"):
+            await blocker.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    tasks = [asyncio.create_task(call(l)) for l in ["a", "a", "b", "b", "vip"]]
+    await asyncio.sleep(0)
+    blocker.set()
+    await asyncio.gather(holder, *tasks)
+
+    assert order[0] == "vip"
+    assert order[1:] in (["b", "a", "b", "a"], ["a", "b", "a", "b"])
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+    sched = ToolScheduler(global_limit=1)
+    await sched.acquire("x")
+    waiter = asyncio.create_task(sched.acquire("x"))
+    await asyncio.sleep(0)
+    assert sched.queue_depth("x") == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert sched.queue_depth("x") == 0
+
+    sched.release("x")
+    assert sched.active == 0
+
+
+def test_load_scheduling_config(tmp_path):
+    cfg = tmp_path / "servers.json"
+    cfg.write_text(json.dumps({"mcpServers": {
+        "sqlite": {"command": "x", "maxConcurrency": 1, "priority": -1},
+        "web": {"command": "y"},
+    }}))
+    limits, priorities = load_scheduling_config(str(cfg))
+    assert limits == {"sqlite": 1}
+    assert priorities == {"sqlite": -1}
+
+    assert load_scheduling_config(str(tmp_path / "missing.json")) == ({}, {})
@@ -0,0 +1,58 @@
+# tests/mcp_cli/tools/test_serialization.py
+import csv
+import io
+import json
+
+import pytest
+
+from mcp_cli.tools.serialization import ResultEncoder, format_tool_response
+
+ROWS = [
+    {"id": 1, "name": "Alice", "tags": ["a"], "note": None},
+    {"id": 2, "name": "Bob, Jr.", "tags": [], "note": True},
+]
+
+
+def test_columnar_emits_header_once():
+    out = format_tool_response(ROWS, "columnar")
+    assert json.loads(out) == {
+        "columns": ["id", "name", "tags", "note"],
+        "rows": [[1, "Alice", ["a"], None], [2, "Bob, Jr.", [], True]],
+    }
+    assert out.count('"name"') == 1
+
+    many = [{"id": i, "name": f"user{i}", "active": True} for i in range(100)]
+    assert len(format_tool_response(many, "columnar")) < len(json.dumps(many, indent=2)) / 2
+
+
+@pytest.mark.parametrize("fmt, sep", [("csv", ","), ("tsv", "\t")])
+def test_delimited_formats(fmt, sep):
+    out = format_tool_response(ROWS, fmt)
+    assert out.split("\n")[0] == sep.join(["id", "name", "tags", "note"])
+    assert list(csv.reader(io.StringIO(out), delimiter=sep)) == [
+        ["id", "name", "tags", "note"],
+        ["1", "Alice", '["a"]', ""],
+        ["2", "Bob, Jr.", "[]", "true"],
+    ]
+
+
+def test_non_uniform_and_text_records_keep_previous_format():
+    mixed = [{"x": 1}, {"y": 2}]
+    assert json.loads(format_tool_response(mixed, "columnar")) == mixed
+    text = [{"type": "text", "text": "a"}, {"type": "text", "text": "b"}]
+    assert format_tool_response(text, "csv") == "a\nb"
+    assert format_tool_response({"a": 1}, "columnar") == json.dumps({"a": 1}, indent=2)
+    assert format_tool_response(42, "columnar") == "42"
+
+
+def test_encoder_per_provider_config():
+    encoder = ResultEncoder.from_config(
+        {"tableFormat": "tsv", "tableFormatByProvider": {"Ollama": "csv", "bad": "xml"}}
+    )
+    assert encoder.format_for(None) == "tsv"
+    assert encoder.format_for("openai") == "tsv"
+    assert encoder.format_for("ollama") == "csv"
+    assert encoder.format_for("bad") == "tsv"
+    assert encoder.encode(ROWS, "ollama").startswith("id,name")
+
+    assert ResultEncoder.from_config({"tableFormat": "yaml"}).table_format == "columnar"
@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+import pytest
+from chuk_tool_processor.mcp.transport.models import MCPToolDefinition
+from chuk_tool_processor.mcp.transport.models import ServerInfo as StreamServerInfo
+
+from mcp_cli.tools.server_streams import ServerStreams
+
+
+def _server(name, *tools):
+    calls = []
+
+    async def call_tool(tool_name, arguments, server_name=None, timeout=None):
+        calls.append((tool_name, server_name))
+        return {"server": name}
+
+    return SimpleNamespace(
+        transports={name: object()},
+        all_tools=[MCPToolDefinition(name=t) for t in tools],
+        server_info=[StreamServerInfo(id=0, name=name, tools=len(tools), status="Up")],
+        call_tool=call_tool,
+        calls=calls,
+    )
+
+
+@pytest.mark.asyncio
+async def test_calls_go_to_the_first_server_offering_a_tool():
+    streams = ServerStreams()
+    a, b = _server("a", "shared", "only_a"), _server("b", "shared")
+    streams.add(1, "b", b)
+    streams.add(0, "a", a)
+
+    assert streams.get_servers_for_tool("shared") == ["b", "a"]
+    assert await streams.call_tool("shared", {}) == {"server": "b"}
+    assert await streams.call_tool("shared", {}, server_name="a") == {"server": "a"}
+    assert await streams.call_tool("only_a", {}) == {"server": "a"}
+    assert (await streams.call_tool("missing", {}))["isError"]
+
+    assert [i["name"] for i in streams.get_server_info()] == ["a", "b"]
+    assert set(streams.transports) == {"a", "b"}
+    assert a.calls == [("shared", "a"), ("only_a", "a")]
+
+
+def test_offered_tools_are_replaced_or_withdrawn():
+    streams = ServerStreams()
+    streams.offer("a", [MCPToolDefinition(name="old"), MCPToolDefinition(name="kept")])
+    streams.offer("b", [MCPToolDefinition(name="other")])
+    assert streams.get_server_for_tool("old") == "a"
+
+    # the live tool list replaces the offer
+    assert streams.add(0, "a", _server("a", "kept", "new")) == ["old"]
+    assert sorted(t.name for t in streams.all_tools) == ["kept", "new", "other"]
+
+    # a live server is not withdrawn; an offer is
+    assert streams.withdraw("a") == []
+    assert streams.withdraw("b") == ["other"]
+    assert streams.tool_to_server_map == {"kept": "a", "new": "a"}
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from mcp_cli.tools.single_flight import SingleFlight
+
+
+def test_policy():
+    sf = SingleFlight(allow=["list_*"], deny=["list_secrets"])
+    assert sf.applies("stdio", "list_tables")
+    assert not sf.applies("stdio", "list_secrets")
+    assert not sf.applies("stdio", "write_query")
+    assert sf.applies("stdio", "read_query", idempotent=True)
+    assert not sf.applies("stdio", "list_secrets", idempotent=True)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_execution():
+    sf = SingleFlight()
+    runs = 0
+    gate = asyncio.Event()
+
+    async def work():
+        nonlocal runs
+        runs += 1
+        await gate.wait()
+        return "done"
+
+    callers = [asyncio.create_task(sf.run("k", work)) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert sf.in_flight == 1
+    gate.set()
+
+    assert await asyncio.gather(*callers) == ["done"] * 3
+    assert runs == 1 and sf.coalesced == 2
+    assert sf.in_flight == 0
+
+    # once finished, the next call runs again
+    assert await sf.run("k", work) == "done"
+    assert runs == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_call_survives_partial_cancellation():
+    sf = SingleFlight()
+    gate = asyncio.Event()
+
+    async def work():
+        await gate.wait()
+        return 42
+
+    first = asyncio.create_task(sf.run("k", work))
+    second = asyncio.create_task(sf.run("k", work))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    await asyncio.sleep(0)
+    gate.set()
+    assert await second == 42
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.asyncio
+async def test_shared_call_cancelled_when_all_callers_leave():
+    sf = SingleFlight()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def work():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    caller = asyncio.create_task(sf.run("k", work))
+    await started.wait()
+    caller.cancel()
+    await asyncio.wait_for(cancelled.wait(), 1)
+    await asyncio.sleep(0)
+    assert sf.in_flight == 0
@@ -0,0 +1,97 @@
+import pytest
+
+from mcp_cli.tools.index import ToolIndex
+from mcp_cli.tools.manager import ToolManager
+from mcp_cli.tools.models import ToolInfo
+
+
+def make_tool(ns, name):
+    return ToolInfo(name=name, namespace=ns, description=f"{ns}:{name}", parameters={})
+
+
+@pytest.fixture
+def index():
+    return ToolIndex([
+        make_tool("default", "list_tables"),
+        make_tool("sqlite", "list_tables"),
+        make_tool("sqlite", "read-query"),
+        make_tool("other", "list_tables"),
+    ])
+
+
+# ----------------------------------------------------------------------------
+# ToolIndex
+# ----------------------------------------------------------------------------
+
+def test_resolve_bare_name_skips_default(index):
+    ns, name, info = index.resolve("list_tables")
+    assert (ns, name) == ("sqlite", "list_tables")
+    assert info.description == "sqlite:list_tables"
+
+
+def test_resolve_namespaced_name(index):
+    assert index.resolve("other.list_tables")[0] == "other"
+    assert index.resolve("default.list_tables")[0] == "default"
+
+
+def test_resolve_openai_sanitised_name(index):
+    ns, name, _ = index.resolve("sqlite_read-query")
+    assert (ns, name) == ("sqlite", "read-query")
+
+
+def test_resolve_unknown(index):
+    assert index.resolve("nope") is None
+    assert "nope" not in index
+    assert index.namespace_for("nope") is None
+
+
+def test_matches_registry_items(index):
+    items = [("default", "list_tables"), ("sqlite", "list_tables"),
+             ("sqlite", "read-query"), ("other", "list_tables")]
+    assert index.matches(items)
+    assert not index.matches(items[:-1])
+
+
+# ----------------------------------------------------------------------------
+# ToolManager integration
+# ----------------------------------------------------------------------------
+
+class CountingRegistry:
+    def __init__(self, items):
+        self._items = list(items)
+        self.list_calls = 0
+
+    async def list_tools(self):
+        self.list_calls += 1
+        return list(self._items)
+
+    async def get_metadata(self, name, ns):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_manager_resolution_uses_index(monkeypatch):
+    tm = ToolManager(config_file="dummy", servers=[])
+    registry = CountingRegistry([("sqlite", "list_tables"), ("default", "list_tables")])
+    monkeypatch.setattr(tm, "_registry", registry)
+
+    assert await tm.get_server_for_tool("list_tables") == "sqlite"
+    calls_after_build = registry.list_calls
+
+    # repeated hits never touch the registry again
+    for _ in range(10):
+        assert await tm.get_server_for_tool("list_tables") == "sqlite"
+        assert await tm._resolve_tool("sqlite_list_tables") == ("sqlite", "list_tables")
+    assert registry.list_calls == calls_after_build
+
+
+@pytest.mark.asyncio
+async def test_manager_index_refreshes_on_registry_change(monkeypatch):
+    tm = ToolManager(config_file="dummy", servers=[])
+    registry = CountingRegistry([("sqlite", "list_tables")])
+    monkeypatch.setattr(tm, "_registry", registry)
+
+    assert await tm.get_server_for_tool("fetch") is None
+
+    registry._items.append(("web", "fetch"))
+    assert await tm.get_server_for_tool("fetch") == "web"
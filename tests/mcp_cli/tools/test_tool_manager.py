@@ -1,3 +1,5 @@
+import asyncio
+import copy
 import pytest
 import json
 from typing import Any, Dict, List, Tuple
@@ -173,9 +175,358 @@ async def test_get_adapted_tools_for_llm_other_provider(manager):
     fns, mapping = await manager.get_adapted_tools_for_llm(provider="ollama")
     assert mapping == {}
 
+    # the server tools, plus the built-in pager for spilled results
     names = {f["function"]["name"] for f in fns}
-    assert names == {"ns1.t1", "ns2.t2"}
+    assert names == {"ns1.t1", "ns2.t2", "result.read"}
 
     for f in fns:
         assert f["type"] == "function"
         assert "description" in f["function"] and "parameters" in f["function"]
+
+
+# ----------------------------------------------------------------------------
+# Tool catalogue caching
+# ----------------------------------------------------------------------------
+
+
+class CountingRegistry(DummyRegistry):
+    def __init__(self, items):
+        super().__init__(items)
+        self.metadata_calls = 0
+
+    async def get_metadata(self, name, ns):
+        self.metadata_calls += 1
+        return await super().get_metadata(name, ns)
+
+
+@pytest.fixture
+def counting_manager(monkeypatch):
+    tm = ToolManager(config_file="dummy", servers=[])
+    reg = CountingRegistry([("ns1", "t1"), ("ns2", "t2")])
+    reg._meta[("ns1", "t1")] = DummyMeta("d1", {})
+    reg._meta[("ns2", "t2")] = DummyMeta("d2", {})
+    monkeypatch.setattr(tm, "_registry", reg)
+    return tm, reg
+
+
+@pytest.mark.asyncio
+async def test_catalogue_is_cached(counting_manager):
+    tm, reg = counting_manager
+    first = await tm.get_all_tools()
+    await tm.get_unique_tools()
+    await tm.get_adapted_tools_for_llm("openai")
+    second = await tm.get_all_tools()
+
+    assert first == second
+    assert reg.metadata_calls == 2
+    assert tm.catalogue_version == 1
+
+
+@pytest.mark.asyncio
+async def test_catalogue_invalidation_per_namespace(counting_manager):
+    tm, reg = counting_manager
+    await tm.get_all_tools()
+
+    tm.invalidate_tool_catalogue("ns2")
+    await tm.get_all_tools()
+
+    # only ns2 metadata was re-fetched, and nothing changed
+    assert reg.metadata_calls == 3
+    assert tm.catalogue_version == 1
+
+
+@pytest.mark.asyncio
+async def test_catalogue_refresh_picks_up_new_tools(counting_manager):
+    tm, reg = counting_manager
+    await tm.get_all_tools()
+
+    reg._items.append(("ns3", "t3"))
+    reg._meta[("ns3", "t3")] = DummyMeta("d3", {})
+    await tm.refresh_tool_index()
+
+    names = {(t.namespace, t.name) for t in await tm.get_all_tools()}
+    assert ("ns3", "t3") in names
+    assert reg.metadata_calls == 3
+    assert tm.catalogue_version == 2
+
+
+@pytest.mark.asyncio
+async def test_adapted_tools_memoised_per_provider(counting_manager, monkeypatch):
+    tm, reg = counting_manager
+    fns, mapping = await tm.get_adapted_tools_for_llm("openai")
+
+    # a second call must not rebuild - make the adapter explode if it does
+    monkeypatch.setattr(
+        ToolNameAdapter, "to_openai_compatible",
+        staticmethod(lambda ns, name: pytest.fail("rebuilt adapted tools")),
+    )
+    fns2, mapping2 = await tm.get_adapted_tools_for_llm("openai")
+    assert fns2 == fns and mapping2 == mapping
+
+
+@pytest.mark.asyncio
+async def test_adapted_tools_are_copies(counting_manager):
+    tm, reg = counting_manager
+    fns, mapping = await tm.get_adapted_tools_for_llm("openai")
+    expected = copy.deepcopy(fns)
+
+    # a caller rewriting nested schemas must not corrupt the cache
+    for fn in fns:
+        fn["function"]["parameters"]["injected"] = True
+        fn["function"]["name"] = "renamed"
+
+    assert await tm.get_adapted_tools_for_llm("openai") == (expected, mapping)
+
+
+@pytest.mark.asyncio
+async def test_adapted_tools_rebuilt_on_catalogue_change(counting_manager):
+    tm, reg = counting_manager
+    fns, _ = await tm.get_adapted_tools_for_llm("openai")
+    assert len(fns) == 3  # two server tools + result.read
+
+    reg._items.append(("ns3", "t3"))
+    await tm.refresh_tool_index()
+    fns, mapping = await tm.get_adapted_tools_for_llm("openai")
+    assert len(fns) == 4
+    assert mapping["ns3_t3"] == "ns3.t3"
+
+
+# ----------------------------------------------------------------------------
+# Batch execution
+# ----------------------------------------------------------------------------
+
+
+class DummyResult:
+    def __init__(self, call, result=None, error=None):
+        self.call_id = call.id
+        self.tool = call.tool
+        self.result = result
+        self.error = error
+
+
+class RecordingExecutor:
+    def __init__(self):
+        self.calls = []
+
+    async def execute(self, calls):
+        self.calls.extend(calls)
+        call = calls[0]
+        # later calls finish first
+        await asyncio.sleep(0.01 * (3 - call.arguments.get("i", 0)))
+        if call.arguments.get("fail"):
+            return [DummyResult(call, error="boom")]
+        return [DummyResult(call, result=call.arguments)]
+
+
+@pytest.mark.asyncio
+async def test_execute_tools_batch_ordered(manager, monkeypatch):
+    executor = RecordingExecutor()
+    monkeypatch.setattr(manager, "_executor", executor)
+
+    results = await manager.execute_tools([
+        ("t1", {"i": 0}),
+        ("ns2.t2", {"i": 1, "fail": True}),
+        ("t1", {"i": 2}),
+    ])
+
+    assert sorted((c.namespace, c.tool) for c in executor.calls) == [
+        ("ns1", "t1"), ("ns1", "t1"), ("ns2", "t2"),
+    ]
+    assert [r.tool_name for r in results] == ["t1", "ns2.t2", "t1"]
+    assert results[0].result == {"i": 0} and results[2].result == {"i": 2}
+    assert results[1].success is False and results[1].error == "boom"
+
+    stats = manager.get_scheduler_stats()
+    assert stats["ns1"].completed == 2 and stats["ns2"].completed == 1
+
+
+@pytest.mark.asyncio
+async def test_process_tool_calls_run_under_the_scheduler(manager, monkeypatch):
+    executor = RecordingExecutor()
+
+    async def stream_execute(calls):
+        for result in await executor.execute(calls):
+            yield result
+
+    executor.stream_execute = stream_execute
+    monkeypatch.setattr(manager, "_executor", executor)
+    tool_calls = [
+        {"id": f"c{i}", "function": {"name": name, "arguments": json.dumps({"i": i})}}
+        for i, name in enumerate(["t1", "ns2.t2", "t1"])
+    ]
+
+    history = []
+    results = await manager.process_tool_calls(tool_calls, {}, history)
+    assert [r.result for r in results] == [{"i": 0}, {"i": 1}, {"i": 2}]
+    assert [m["tool_call_id"] for m in history if m["role"] == "tool"] == ["c0", "c1", "c2"]
+
+    streamed = [call_id async for _, call_id in manager.stream_process_tool_calls(tool_calls, {})]
+    assert sorted(streamed) == ["c0", "c1", "c2"]
+
+    stats = manager.get_scheduler_stats()
+    assert stats["ns1"].completed == 4 and stats["ns2"].completed == 2
+
+
+# ----------------------------------------------------------------------------
+# Result cache
+# ----------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_uses_result_cache(manager, monkeypatch):
+    from mcp_cli.tools.result_cache import ToolResultCache
+
+    executor = RecordingExecutor()
+    monkeypatch.setattr(manager, "_executor", executor)
+    manager.result_cache = ToolResultCache(allow={"ns1.t1": 60})
+
+    first = await manager.execute_tool("t1", {"i": 2, "x": [1, 2]})
+    second = await manager.execute_tool("ns1.t1", {"x": [1, 2], "i": 2})
+    await manager.execute_tool("ns2.t2", {"i": 2})
+    await manager.execute_tool("ns2.t2", {"i": 2})
+
+    assert first.result == second.result
+    assert second.tool_name == "ns1.t1"
+    # t1 ran once, the uncached t2 ran twice
+    assert [c.tool for c in executor.calls] == ["t1", "t2", "t2"]
+    stats = manager.get_cache_stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+    assert manager.clear_result_cache("ns1.t1") == 1
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_calls_are_coalesced(manager, monkeypatch):
+    from mcp_cli.tools.single_flight import SingleFlight
+
+    executor = RecordingExecutor()
+    monkeypatch.setattr(manager, "_executor", executor)
+    manager.single_flight = SingleFlight(allow=["t1"])
+
+    results = await asyncio.gather(
+        manager.execute_tool("t1", {"i": 2, "a": 1}),
+        manager.execute_tool("ns1.t1", {"a": 1, "i": 2}),
+        manager.execute_tool("ns2.t2", {"i": 2}),
+        manager.execute_tool("ns2.t2", {"i": 2}),
+    )
+
+    # t1 dispatched once and shared; t2 is not opted in and ran twice
+    assert [c.tool for c in executor.calls].count("t1") == 1
+    assert [c.tool for c in executor.calls].count("t2") == 2
+    assert [r.tool_name for r in results[:2]] == ["t1", "ns1.t1"]
+    assert results[0].result == results[1].result
+    assert manager.single_flight.coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_result_read_builtin_pages_spilled_results(manager, tmp_path):
+    from mcp_cli.tools.result_store import ResultStore
+
+    manager.result_store = ResultStore(root=tmp_path, max_inline_bytes=100, preview_bytes=40)
+    preview = manager.spill_result("ns1.t1", "0123456789" * 50)
+    assert "result.read" in preview
+    handle = preview.split("handle '")[1].split("'")[0]
+
+    res = await manager.execute_tool("result_read", {"handle": handle, "offset": 10, "limit": 20})
+    assert res.success
+    assert res.result["content"] == "01234567890123456789"
+    assert res.result["next_offset"] == 30
+
+    missing = await manager.execute_tool("result.read", {"handle": "r-0000"})
+    assert not missing.success
+
+
+@pytest.mark.asyncio
+async def test_result_read_pages_are_never_spilled(manager, tmp_path):
+    from mcp_cli.tools.result_store import ResultStore
+
+    manager.result_store = ResultStore(root=tmp_path, max_inline_bytes=100, preview_bytes=40)
+    preview = manager.spill_result("ns1.t1", '"\\' * 200)  # escapes double in JSON
+    handle = preview.split("handle '")[1].split("'")[0]
+
+    page = await manager.execute_tool("result.read", {"handle": handle})
+    encoded = manager.format_result(page.result)
+    assert len(encoded.encode("utf-8")) > 100
+    for name in ("result.read", "result_read"):
+        assert manager.spill_result(name, encoded) == encoded
+
+
+# ----------------------------------------------------------------------------
+# Concurrent server startup
+# ----------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_servers_start_concurrently_with_partial_availability(monkeypatch, tmp_path):
+    from types import SimpleNamespace
+
+    from chuk_tool_processor.mcp.transport.models import MCPToolDefinition
+    from chuk_tool_processor.mcp.transport.models import ServerInfo as StreamServerInfo
+
+    import mcp_cli.tools.manager as manager_mod
+
+    delays = {"fast": 0.0, "slow": 0.2, "broken": 0.0}
+    release_slow = asyncio.Event()
+    closed = []
+
+    async def fake_create(cls, config_file, servers, server_names=None, **kwargs):
+        name = servers[0]
+        if name == "slow":
+            await release_slow.wait()
+        await asyncio.sleep(delays[name])
+        if name == "broken":
+            return SimpleNamespace(transports={}, all_tools=[], server_info=[])
+
+        async def close():
+            closed.append(name)
+
+        return SimpleNamespace(
+            transports={name: object()},
+            all_tools=[MCPToolDefinition(name=f"{name}_tool")],
+            server_info=[StreamServerInfo(id=0, name=name, tools=1, status="Up")],
+            close=close,
+        )
+
+    registered = []
+
+    async def fake_register(sm, namespace):
+        registered.append(sorted(t.name for t in sm.all_tools))
+        return []
+
+    monkeypatch.setattr(manager_mod.StreamManager, "create", classmethod(fake_create))
+    monkeypatch.setattr(manager_mod, "register_mcp_tools", fake_register)
+
+    tm = ToolManager(config_file=str(tmp_path / "none.json"), servers=["fast", "slow", "broken"])
+    assert await tm.initialize(wait_for_all=False)
+
+    # usable as soon as the first server is ready
+    infos = {i.name: i for i in await tm.get_server_info()}
+    assert infos["fast"].status == "Up" and infos["fast"].startup_time is not None
+    assert infos["slow"].status == "starting"
+    assert tm.stream_manager.tool_to_server_map == {"fast_tool": "fast"}
+
+    # late servers are merged as they arrive
+    release_slow.set()
+    await tm.wait_for_servers()
+    infos = {i.name: i for i in await tm.get_server_info()}
+    assert [i.name for i in await tm.get_server_info()] == ["fast", "slow", "broken"]
+    assert infos["slow"].status == "Up" and infos["slow"].tool_count == 1
+    assert infos["broken"].status == "failed"
+    assert tm.server_startup["broken"].error
+    assert tm.stream_manager.tool_to_server_map == {"fast_tool": "fast", "slow_tool": "slow"}
+    assert registered[-1] == ["fast_tool", "slow_tool"]
+
+    # each server keeps its own connection, closed on shutdown
+    await tm.close()
+    assert sorted(closed) == ["fast", "slow"]
+
+
+def test_load_startup_timeouts(tmp_path):
+    from mcp_cli.config import load_startup_timeouts
+
+    cfg = tmp_path / "servers.json"
+    cfg.write_text(json.dumps({"mcpServers": {
+        "slow": {"command": "uv", "startupTimeout": 120},
+        "bad": {"command": "x", "startupTimeout": "soon"},
+        "plain": {"command": "y"},
+    }}))
+    assert load_startup_timeouts(str(cfg)) == {"slow": 120.0}
@@ -0,0 +1,81 @@
+# tests/mcp_cli/utils/test_llm_probe.py
+import asyncio
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from mcp_cli.utils.llm_probe import LLMProbe, latency_percentiles
+
+
+class _SlowClient:
+    def __init__(self, delay, tracker):
+        self.delay = delay
+        self.tracker = tracker
+
+    async def create_completion(self, messages):
+        self.tracker["active"] += 1
+        self.tracker["peak"] = max(self.tracker["peak"], self.tracker["active"])
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.tracker["active"] -= 1
+        return {"response": "pong", "error": False}
+
+
+def _manager(delays):
+    tracker = {"active": 0, "peak": 0}
+    manager = Mock()
+    manager.get_client_for_provider.side_effect = (
+        lambda provider, model: _SlowClient(delays[(provider, model)], tracker)
+    )
+    return manager, tracker
+
+
+@pytest.mark.asyncio
+async def test_probe_many_runs_concurrently_and_bounds_concurrency():
+    delays = {("p", f"m{i}"): 0.1 for i in range(6)}
+    manager, tracker = _manager(delays)
+
+    started = time.perf_counter()
+    results = [r async for r in LLMProbe(manager).probe_many(delays, concurrency=3)]
+    elapsed = time.perf_counter() - started
+
+    assert len(results) == 6
+    assert all(r.success and r.latency is not None for r in results)
+    assert tracker["peak"] == 3
+    assert elapsed < 0.5  # two waves of 0.1s, not six
+
+
+@pytest.mark.asyncio
+async def test_probe_many_yields_in_completion_order_and_times_out():
+    delays = {("slow", "m"): 5.0, ("fast", "m"): 0.01}
+    manager, _ = _manager(delays)
+
+    results = [r async for r in LLMProbe(manager).probe_many(delays, timeout=0.2)]
+
+    assert [r.provider for r in results] == ["fast", "slow"]
+    assert results[0].success
+    assert not results[1].success
+    assert "Timed out" in results[1].error_message
+
+
+@pytest.mark.asyncio
+async def test_probe_reports_client_errors():
+    manager = Mock()
+    manager.get_client_for_provider.side_effect = ValueError("no api key")
+
+    result = await LLMProbe(manager).test_provider_model("openai", "gpt-4o")
+
+    assert not result.success
+    assert result.error_message == "no api key"
+    assert (result.provider, result.model) == ("openai", "gpt-4o")
+
+
+def test_latency_percentiles():
+    stats = latency_percentiles([0.1 * i for i in range(1, 11)])
+    assert stats["p50"] == pytest.approx(0.5)
+    assert stats["p90"] == pytest.approx(0.9)
+    assert stats["p99"] == pytest.approx(1.0)
+    assert stats["max"] == pytest.approx(1.0)
+    assert latency_percentiles([]) == {}